@@ -1,14 +1,17 @@
 import tkinter as tk
 from tkinter import ttk
-import os
 
 from database.db import Database
+from core.jobs import JobRunner
 from core.version import APP_NAME, APP_VERSION
+import config
 
 from ui.styles import setup_styles
 from ui.employees_tab import EmployeesTab
-from ui.payroll_tab import PayrollTab
-from ui.payroll_history import PayrollHistory
+from ui.job_status import JobStatus
+
+# Вкладка Payroll (tkcalendar, numpy), история и отчёты (reportlab, openpyxl)
+# импортируются при первом использовании — окно появляется быстрее
 
 
 class PayrollApp(tk.Tk):
@@ -31,23 +34,25 @@ class PayrollApp(tk.Tk):
         setup_styles(self)
 
         # ---------- DATABASE ----------
-        local_appdata = os.getenv("LOCALAPPDATA")
-        db_dir = os.path.join(local_appdata, "PayrollSystem")
-        db_path = os.path.join(db_dir, "payroll.db")
-        os.makedirs(db_dir, exist_ok=True)
-
         self.db = Database()
 
+        # ---------- BACKGROUND JOBS ----------
+        # PDF, печать, экспорт, бэкап — в пуле потоков, результаты через after()
+        self.jobs = JobRunner()
+        self.jobs.attach(self)
 
         # ---------- NOTEBOOK ----------
-        notebook = ttk.Notebook(self)
-        notebook.pack(fill="both", expand=True, padx=8, pady=8)
+        self.notebook = ttk.Notebook(self)
+        self.notebook.pack(fill="both", expand=True, padx=8, pady=8)
 
-        self.employees_tab = EmployeesTab(notebook, self.db, on_change=self._update_status)
-        notebook.add(self.employees_tab, text="Employees")
+        self.employees_tab = EmployeesTab(self.notebook, self.db, on_change=self._on_employees_changed)
+        self.notebook.add(self.employees_tab, text="Employees")
 
-        self.payroll_tab = PayrollTab(notebook, self.db)
-        notebook.add(self.payroll_tab, text="Payroll")
+        # Строится при первом открытии вкладки
+        self.payroll_tab = None
+        self._payroll_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self._payroll_frame, text="Payroll")
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # ---------- MENU ----------
         menubar = tk.Menu(self)
@@ -57,7 +62,14 @@ class PayrollApp(tk.Tk):
         menubar.add_cascade(label="History", menu=history_menu)
         history_menu.add_command(
             label="Payroll history",
-            command=lambda: PayrollHistory(self, self.db)
+            command=self._open_history,
+        )
+
+        tools_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Tools", menu=tools_menu)
+        tools_menu.add_command(
+            label="Diagnostics",
+            command=self._open_diagnostics,
         )
 
         # ---------- STATUS BAR ----------
@@ -66,7 +78,8 @@ class PayrollApp(tk.Tk):
         
         self.status_label = ttk.Label(
             self.status_bar, 
-            text=f"Ready | Database: {db_path}",
+            text=f"Ready | Database: {self.db.path} ({self.db.profile.name}, "
+                 f"{self.db.settings()['journal_mode'].upper()})",
             font=("Segoe UI", 9),
             foreground="#6C757D"
         )
@@ -80,16 +93,78 @@ class PayrollApp(tk.Tk):
             foreground="#6C757D"
         )
         self.employee_count_label.pack(side="right", padx=10, pady=4)
-        
+
+        self.job_status = JobStatus(self.status_bar, self.jobs)
+
+        self._update_status()
+
+        # Резервная копия при запуске — в фоне, окно не блокируется
+        self.jobs.submit(self._backup, name="Backup")
+
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        """Сохранение несохранённых часов и закрытие БД"""
+        try:
+            if self.payroll_tab is not None:
+                self.payroll_tab.flush_hours()
+        finally:
+            self.jobs.shutdown(cancel=True)
+            self.db.close()
+            self.destroy()
+
+    def _backup(self, job):
+        """Онлайн-бэкап БД с ротацией копий (в рабочем потоке)"""
+        from core.backup import Retention, backup_db
+
+        try:
+            backup_db(
+                self.db.path,
+                config.backup_dir_for(self.db.path),
+                retention=Retention(
+                    daily=config.BACKUP_KEEP_DAILY,
+                    weekly=config.BACKUP_KEEP_WEEKLY,
+                    monthly=config.BACKUP_KEEP_MONTHLY,
+                ),
+                compress=config.BACKUP_COMPRESS,
+                progress=lambda remaining, total: job.report(total - remaining, total),
+                cancel=job.cancel_event,
+            )
+        except Exception:
+            pass  # Ошибка бэкапа не должна мешать работе
+
+    def _on_tab_changed(self, event=None):
+        if self.payroll_tab is None and self.notebook.select() == str(self._payroll_frame):
+            from ui.payroll_tab import PayrollTab
+
+            self.payroll_tab = PayrollTab(self._payroll_frame, self.db, self.jobs)
+            self.payroll_tab.pack(fill="both", expand=True)
+
+    def _open_history(self):
+        from ui.payroll_history import PayrollHistory
+
+        PayrollHistory(self, self.db, self.jobs)
+
+    def _open_diagnostics(self):
+        from ui.diagnostics import Diagnostics
+
+        Diagnostics(self)
+
+    def _on_employees_changed(self):
         self._update_status()
+        if self.payroll_tab is not None:
+            self.payroll_tab.reload_employees()
 
     def _update_status(self):
         """Обновление статус-бара"""
-        employees = self.db.get_employees()
-        count = len(employees)
+        count = self.db.count_employees()
         self.employee_count_label.config(text=f"👥 Employees: {count}")
 
 
 if __name__ == "__main__":
+    # Нужно для ProcessPoolExecutor (пакетные PDF) в собранном EXE
+    import multiprocessing
+
+    multiprocessing.freeze_support()
     PayrollApp().mainloop()
 
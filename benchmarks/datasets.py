@@ -0,0 +1,60 @@
+"""
+Данные для бенчмарков поверх database.synthetic.
+Одинаковый seed — одинаковые данные (сравнение с baseline корректно).
+"""
+from datetime import date, timedelta
+import random
+
+from core.models import Employee
+from database.db import Database
+from database.synthetic import create_database, make_employees
+
+
+PERIOD_START = date(2021, 1, 1)
+
+
+def period(months: int) -> tuple[str, str]:
+    """ISO даты периода из months месяцев, начиная с PERIOD_START"""
+    year, month = divmod(PERIOD_START.month - 1 + months, 12)
+    end = date(PERIOD_START.year + year, month + 1, 1) - timedelta(days=1)
+    return PERIOD_START.isoformat(), end.isoformat()
+
+
+def hours_map(months: int, seed: int = 1) -> dict[str, float]:
+    """Табель одного сотрудника: будни по 6–10 ч с шагом 0.5, выходные — 0"""
+    rnd = random.Random(seed)
+    start, end = (date.fromisoformat(d) for d in period(months))
+    result = {}
+    day = start
+    while day <= end:
+        result[day.isoformat()] = 0.0 if day.weekday() >= 5 else rnd.randrange(12, 21) * 0.5
+        day += timedelta(days=1)
+    return result
+
+
+def employees(count: int, seed: int = 1) -> list[Employee]:
+    return [
+        Employee(
+            id=i,
+            name=name,
+            rate=rate,
+            has_bank_account=bool(iban),
+            bank_name=bank,
+            iban=iban,
+            bic=bic,
+        )
+        for i, (name, rate, bank, iban, bic, _) in enumerate(make_employees(count, seed), start=1)
+    ]
+
+
+def make_database(path, employee_count: int, months: int, seed: int = 1) -> Database:
+    """БД с employee_count сотрудниками и часами за months месяцев (database.synthetic)"""
+    start, end = period(months)
+    db, _ = create_database(
+        path,
+        employee_count,
+        date.fromisoformat(start),
+        date.fromisoformat(end),
+        seed=seed,
+    )
+    return db
@@ -0,0 +1,105 @@
+"""
+Время импорта при запуске (python -X importtime):
+
+    python benchmarks/import_time.py                  # app
+    python benchmarks/import_time.py --module cli --budget-ms 150
+
+Импорт выполняется в отдельном процессе (холодный sys.modules), берётся
+медиана из --runs запусков. Код возврата 1 — превышен бюджет или при
+запуске загружен тяжёлый модуль из DEFERRED.
+"""
+from pathlib import Path
+import argparse
+import statistics
+import subprocess
+import sys
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+# Бюджет на импорт модуля запуска, мс (с запасом под медленные машины)
+BUDGETS_MS = {
+    "app": 250,
+    "cli": 100,
+}
+
+# Не должны загружаться при запуске: подгружаются при первом действии
+DEFERRED = ("reportlab", "openpyxl", "numpy", "tkcalendar")
+
+
+def parse_importtime(text: str) -> list[tuple[str, int, int]]:
+    """Вывод -X importtime → [(модуль, self мкс, cumulative мкс), ...]"""
+    result = []
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue    # строка заголовка
+        self_us, cumulative_us, name = fields
+        result.append((name.strip(), int(self_us), int(cumulative_us)))
+    return result
+
+
+def import_once(module: str) -> list[tuple[str, int, int]]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+def measure(module: str = "app", runs: int = 5) -> dict:
+    """
+    total_ms — медиана cumulative для module;
+    slowest — модули с наибольшим self-временем (последний запуск);
+    deferred — тяжёлые модули, загруженные при импорте.
+    """
+    totals = []
+    for _ in range(runs):
+        entries = import_once(module)
+        totals.append(next(c for name, _, c in entries if name == module) / 1000)
+
+    loaded = {name.split(".")[0] for name, _, _ in entries}
+    return {
+        "module": module,
+        "runs": runs,
+        "total_ms": statistics.median(totals),
+        "slowest": sorted(
+            ((name, self_us / 1000) for name, self_us, _ in entries),
+            key=lambda item: item[1],
+            reverse=True,
+        )[:15],
+        "deferred": sorted(loaded.intersection(DEFERRED)),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", default="app")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    budget = args.budget_ms or BUDGETS_MS.get(args.module)
+    result = measure(args.module, args.runs)
+
+    print(f"import {result['module']}: {result['total_ms']:.1f} ms (median of {result['runs']})")
+    for name, ms in result["slowest"]:
+        print(f"  {ms:8.2f} ms  {name}")
+
+    failed = False
+    if result["deferred"]:
+        print(f"FAIL: loaded at startup: {', '.join(result['deferred'])}")
+        failed = True
+    if budget is not None and result["total_ms"] > budget:
+        print(f"FAIL: over budget ({budget:.0f} ms)")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,325 @@
+"""
+Бенчмарки горячих путей: расчёт, PDF, БД, поиск.
+
+    python -m benchmarks.run                          # профиль quick
+    python -m benchmarks.run --profile full -o results.json
+    python -m benchmarks.run --save-baseline          # записать baseline
+    python -m benchmarks.run --baseline benchmarks/baseline.json --threshold 0.25
+
+Результаты — JSON (медиана / минимум на вызов, мс). При сравнении с baseline
+код возврата 1, если какой-либо случай медленнее больше чем на threshold.
+Baseline зависит от машины: записывайте его на той же, где сравниваете
+(в репозитории его нет). Без baseline — предупреждение, а с
+--require-baseline — код возврата 2 (для CI).
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import timeit
+
+from benchmarks import datasets
+from database.db import Database
+
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_THRESHOLD = 0.25     # +25% к медиане — регрессия
+REPEAT = 5
+
+
+# ==================================================
+# REGISTRY
+# ==================================================
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    setup: object                 # setup(**params) -> вызываемый объект без аргументов
+    params: dict                  # профиль -> список наборов параметров
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(name: str, **profiles):
+    """Регистрирует бенчмарк; profiles: quick=[{...}], full=[{...}], smoke=[{...}]"""
+    def decorator(setup):
+        BENCHMARKS.append(Benchmark(name, setup, profiles))
+        return setup
+    return decorator
+
+
+def case_id(name: str, params: dict) -> str:
+    args = ",".join(f"{key}={value}" for key, value in params.items())
+    return f"{name}[{args}]"
+
+
+# ==================================================
+# FIXTURES
+# ==================================================
+class Workspace:
+    """Временная папка и кэш сгенерированных БД на время прогона"""
+
+    def __init__(self):
+        self._tmp = tempfile.TemporaryDirectory(prefix="payroll-bench-")
+        self.path = Path(self._tmp.name)
+        self._databases = {}
+
+    def database(self, employees: int, months: int):
+        key = (employees, months)
+        if key not in self._databases:
+            path = self.path / f"bench_{employees}x{months}.db"
+            datasets.make_database(path, employees, months).close()
+            self._databases[key] = Database(path)
+        return self._databases[key]
+
+    def close(self):
+        for db in self._databases.values():
+            db.close()
+        self._tmp.cleanup()
+
+
+WORKSPACE: Workspace | None = None
+
+
+# ==================================================
+# PAYROLL
+# ==================================================
+MONTHS = {
+    "smoke": [{"months": 1}],
+    "quick": [{"months": 1}, {"months": 12}],
+    "full": [{"months": 1}, {"months": 12}, {"months": 60}],
+}
+
+
+@benchmark("build_payroll_rows", **MONTHS)
+def _build_rows(months):
+    from services.payroll_service import build_payroll_rows
+
+    hours = datasets.hours_map(months)
+    return lambda: build_payroll_rows(hours, 12.5)
+
+
+@benchmark("calculate_fixed_payroll", **MONTHS)
+def _fixed(months):
+    from services.payroll_service import calculate_fixed_payroll
+
+    employee = datasets.employees(1)[0]
+    hours = datasets.hours_map(months)
+    return lambda: calculate_fixed_payroll(employee, hours, housing=100.0, utilities=30.0)
+
+
+@benchmark("calculate_custom_payroll", **MONTHS)
+def _custom(months):
+    from services.payroll_service import calculate_custom_payroll
+
+    employee = datasets.employees(1)[0]
+    hours = datasets.hours_map(months)
+    return lambda: calculate_custom_payroll(employee, hours)
+
+
+@benchmark(
+    "calculate_payroll_run",
+    smoke=[{"employees": 10, "months": 1}],
+    quick=[{"employees": 100, "months": 1}, {"employees": 1000, "months": 1}],
+    full=[{"employees": 1000, "months": 1}, {"employees": 10000, "months": 1}, {"employees": 1000, "months": 12}],
+)
+def _run(employees, months):
+    from services.payroll_service import calculate_payroll_run
+
+    db = WORKSPACE.database(employees, months)
+    start, end = datasets.period(months)
+    return lambda: calculate_payroll_run(db, start, end, with_rows=False)
+
+
+# ==================================================
+# PDF
+# ==================================================
+@benchmark(
+    "render_pdf",
+    smoke=[{"months": 1}],
+    quick=[{"months": 1}, {"months": 12}],
+    full=[{"months": 1}, {"months": 12}, {"months": 60}],
+)
+def _render_pdf(months):
+    from core.dates import date_info
+    from core.models import EmployeePayroll
+    from services.payroll_service import calculate_fixed_payroll
+    from services.report_service import _render_pdf_to_file, build_statement
+
+    employee = datasets.employees(1)[0]
+    rows, summary = calculate_fixed_payroll(employee, datasets.hours_map(months))
+    start, end = datasets.period(months)
+    statement = build_statement(
+        EmployeePayroll(employee, rows, summary),
+        period_from=date_info(start).date_dmy,
+        period_to=date_info(end).date_dmy,
+        rate_mode="fixed",
+        output_dir=WORKSPACE.path,
+    )
+    return lambda: _render_pdf_to_file(**statement)
+
+
+# ==================================================
+# DATABASE
+# ==================================================
+DB_SIZES = {
+    "smoke": [{"employees": 10, "months": 1}],
+    "quick": [{"employees": 10, "months": 60}, {"employees": 1000, "months": 12}],
+    "full": [{"employees": 10, "months": 60}, {"employees": 1000, "months": 12}, {"employees": 10000, "months": 12}],
+}
+
+
+@benchmark("db.save_hours", **DB_SIZES)
+def _save_hours(employees, months):
+    db = WORKSPACE.database(employees, months)
+    state = {"hours": 0.0}
+
+    def run():
+        # Каждый вызов меняет значение — UPDATE, а не пустая запись
+        state["hours"] = 8.0 if state["hours"] != 8.0 else 7.5
+        db.save_hours(employees // 2 + 1, datasets.PERIOD_START.isoformat(), state["hours"])
+
+    return run
+
+
+@benchmark("db.load_hours", **DB_SIZES)
+def _load_hours(employees, months):
+    db = WORKSPACE.database(employees, months)
+    # Последний месяц периода одного сотрудника
+    start, end = datasets.period(months)
+    month_start = end[:8] + "01"
+    return lambda: db.load_hours(employees // 2 + 1, month_start, end)
+
+
+# ==================================================
+# SEARCH
+# ==================================================
+SEARCH_SIZES = {
+    "smoke": [{"employees": 10}],
+    "quick": [{"employees": 1000}, {"employees": 10000}],
+    "full": [{"employees": 1000}, {"employees": 10000}],
+}
+
+
+@benchmark("search.index", **SEARCH_SIZES)
+def _search_index(employees):
+    from services.employee_search import EmployeeSearchIndex
+
+    index = EmployeeSearchIndex(datasets.employees(employees))
+    return lambda: index.search("anna sch")
+
+
+@benchmark("search.fts", **SEARCH_SIZES)
+def _search_fts(employees):
+    db = WORKSPACE.database(employees, 1)
+    return lambda: db.search("anna sch", scope="employees")
+
+
+# ==================================================
+# RUNNER
+# ==================================================
+def measure(fn, repeat: int = REPEAT) -> dict:
+    fn()    # прогрев (кэши, ленивые импорты)
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    times = [t / number * 1000 for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "median_ms": statistics.median(times),
+        "min_ms": min(times),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run(profile: str = "quick", only: str | None = None, repeat: int = REPEAT, log=None) -> dict:
+    global WORKSPACE
+    WORKSPACE = Workspace()
+    results = {}
+    try:
+        for bench in BENCHMARKS:
+            if only and only not in bench.name:
+                continue
+            for params in bench.params.get(profile, ()):
+                key = case_id(bench.name, params)
+                results[key] = measure(bench.setup(**params), repeat)
+                if log:
+                    log(f"{key:<55} {results[key]['median_ms']:10.3f} ms")
+    finally:
+        WORKSPACE.close()
+        WORKSPACE = None
+
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "profile": profile,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list[dict]:
+    """Случаи из обоих прогонов: ratio = текущая медиана / baseline"""
+    rows = []
+    base = baseline.get("results", {})
+    for key, result in current.get("results", {}).items():
+        if key not in base:
+            continue
+        ratio = result["median_ms"] / base[key]["median_ms"] if base[key]["median_ms"] else 1.0
+        rows.append({
+            "case": key,
+            "baseline_ms": base[key]["median_ms"],
+            "current_ms": result["median_ms"],
+            "ratio": ratio,
+            "regression": ratio > 1 + threshold,
+        })
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--profile", choices=("smoke", "quick", "full"), default="quick")
+    parser.add_argument("-k", dest="only", help="only benchmarks whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("-o", "--output", help="write results JSON here")
+    parser.add_argument("--baseline", default=None, help=f"compare with baseline JSON (default: {BASELINE_PATH.name} if present)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--save-baseline", action="store_true", help="write results as the new baseline")
+    parser.add_argument("--require-baseline", action="store_true", help="fail if there is no baseline to compare with")
+    args = parser.parse_args(argv)
+
+    result = run(args.profile, args.only, args.repeat, log=print)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2), encoding="utf-8")
+    if args.save_baseline:
+        BASELINE_PATH.write_text(json.dumps(result, indent=2), encoding="utf-8")
+        print(f"Baseline saved to {BASELINE_PATH}")
+        return 0
+
+    baseline_path = Path(args.baseline) if args.baseline else BASELINE_PATH
+    if not baseline_path.exists():
+        print(
+            f"\nNo baseline at {baseline_path}: results were not compared. "
+            f"Record one on this machine with --save-baseline.",
+            file=sys.stderr,
+        )
+        return 2 if args.require_baseline else 0
+
+    rows = compare(result, json.loads(baseline_path.read_text(encoding="utf-8")), args.threshold)
+    print(f"\nCompared with {baseline_path} (threshold +{args.threshold:.0%}):")
+    for row in rows:
+        mark = "REGRESSION" if row["regression"] else ""
+        print(f"{row['case']:<55} {row['baseline_ms']:10.3f} → {row['current_ms']:10.3f} ms  x{row['ratio']:.2f} {mark}")
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
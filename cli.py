@@ -0,0 +1,308 @@
+"""
+Запуск без GUI (cron, планировщик задач):
+
+    python -m cli calc   --from 2026-01-01 --to 2026-01-31
+    python -m cli pdf    --from 2026-01-01 --to 2026-01-31 --combined
+    python -m cli export --from 2026-01-01 --to 2026-01-31 register.xlsx
+    python -m cli backup --compress
+    python -m cli generate load_test.db --employees 5000 --from 2026-01-01 --to 2026-12-31
+
+Tk не используется; тяжёлые модули (numpy, reportlab, openpyxl)
+импортируются только командами, которым они нужны.
+"""
+import argparse
+import sys
+
+
+# ==================================================
+# HELPERS
+# ==================================================
+def _open_db(args, profile="reporting"):
+    from database.db import Database
+
+    return Database(args.db, profile=profile)
+
+
+def _period(args):
+    """ISO даты периода и те же даты в формате PDF (DD-MM-YYYY)"""
+    from core.dates import date_info
+
+    if args.start > args.end:
+        raise ValueError(f"Empty period: {args.start} > {args.end}")
+    return (
+        args.start,
+        args.end,
+        date_info(args.start).date_dmy,
+        date_info(args.end).date_dmy,
+    )
+
+
+def _run(args):
+    from services.payroll_service import calculate_payroll_run
+
+    db = _open_db(args)
+    try:
+        return calculate_payroll_run(
+            db,
+            args.start,
+            args.end,
+            rate_mode=args.rate_mode,
+            housing=args.housing,
+            utilities=args.utilities,
+            with_rows=getattr(args, "with_rows", False),
+        )
+    finally:
+        db.close()
+
+
+def _progress(label, quiet):
+    if quiet:
+        return None
+
+    def report(done, total=None):
+        suffix = f"/{total}" if total else ""
+        print(f"\r{label}: {done}{suffix}", end="", file=sys.stderr, flush=True)
+
+    return report
+
+
+# ==================================================
+# COMMANDS
+# ==================================================
+def cmd_calc(args):
+    """Итоги расчёта по сотрудникам"""
+    _period(args)
+    payrolls = _run(args)
+
+    if args.format == "csv":
+        import csv
+
+        writer = csv.writer(sys.stdout)
+        writer.writerow(("id", "name", "hours", "gross", "deductions", "net"))
+        for p in payrolls:
+            s = p.summary
+            writer.writerow((
+                p.employee.id,
+                p.employee.name,
+                f"{s.total_hours:.2f}",
+                f"{s.gross_amount:.2f}",
+                f"{s.housing_deduction + s.utilities_deduction:.2f}",
+                f"{s.net_amount:.2f}",
+            ))
+        return 0
+
+    if args.format == "json":
+        import json
+        from dataclasses import asdict
+
+        json.dump(
+            [
+                {"id": p.employee.id, "name": p.employee.name, **asdict(p.summary)}
+                for p in payrolls
+            ],
+            sys.stdout,
+            ensure_ascii=False,
+            indent=2,
+        )
+        print()
+        return 0
+
+    net = 0.0
+    for p in payrolls:
+        s = p.summary
+        net += s.net_amount
+        print(f"{p.employee.name:<30} {s.total_hours:>8.2f} h {s.gross_amount:>10.2f} € {s.net_amount:>10.2f} €")
+    print(f"{len(payrolls)} employees, net total {net:.2f} €")
+    return 0
+
+
+def cmd_pdf(args):
+    """PDF ведомостей всех сотрудников за период"""
+    from services.report_service import generate_combined_payroll_pdf, generate_payroll_pdfs
+
+    args.with_rows = True
+    _, _, period_from, period_to = _period(args)
+    payrolls = _run(args)
+    progress = _progress("PDF", args.quiet)
+
+    if args.combined:
+        path = generate_combined_payroll_pdf(
+            payrolls,
+            period_from,
+            period_to,
+            args.rate_mode,
+            action="save",
+            output_dir=args.out,
+            progress=progress,
+        )
+        if progress:
+            print(file=sys.stderr)
+        print(path)
+        return 0
+
+    result = generate_payroll_pdfs(
+        payrolls,
+        period_from,
+        period_to,
+        args.rate_mode,
+        workers=args.workers,
+        output_dir=args.out,
+        progress=progress,
+    )
+    if progress:
+        print(file=sys.stderr)
+
+    for path in result.paths:
+        if path:
+            print(path)
+    for i, error in result.errors.items():
+        print(f"{payrolls[i].employee.name}: {error}", file=sys.stderr)
+    return 1 if result.errors else 0
+
+
+def cmd_export(args):
+    """Реестр зарплаты в Excel"""
+    from services.export_service import export_payroll_register
+
+    start, end, _, _ = _period(args)
+    db = _open_db(args)
+    try:
+        count = export_payroll_register(
+            db,
+            args.output,
+            start,
+            end,
+            rate_mode=args.rate_mode,
+            housing=args.housing,
+            utilities=args.utilities,
+            include_days=args.days,
+            progress=_progress("Employees", args.quiet),
+        )
+    finally:
+        db.close()
+
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(f"{count} employees exported to {args.output}")
+    return 0
+
+
+def cmd_backup(args):
+    """Онлайн-копия БД с ротацией"""
+    from core.backup import Retention, backup_db
+    import config
+
+    db_path = args.db or config.DATABASE_PATH
+    path = backup_db(
+        db_path,
+        args.dir or config.backup_dir_for(db_path),
+        retention=Retention(
+            daily=config.BACKUP_KEEP_DAILY,
+            weekly=config.BACKUP_KEEP_WEEKLY,
+            monthly=config.BACKUP_KEEP_MONTHLY,
+        ),
+        compress=args.compress or config.BACKUP_COMPRESS,
+        verify=not args.no_verify,
+    )
+    if path is None:
+        print("Database not found, nothing to back up", file=sys.stderr)
+        return 1
+    print(path)
+    return 0
+
+
+def cmd_generate(args):
+    """Синтетическая БД для нагрузочных тестов"""
+    from datetime import date
+    from pathlib import Path
+
+    from database.synthetic import create_database
+
+    if args.output != ":memory:" and Path(args.output).exists() and not args.append:
+        raise ValueError(f"{args.output} already exists (use --append to add data)")
+
+    db, stats = create_database(
+        args.output,
+        args.employees,
+        date.fromisoformat(args.start),
+        date.fromisoformat(args.end),
+        seed=args.seed,
+        progress=_progress("Employees", args.quiet),
+    )
+    db.close()
+
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(
+        f"{stats.employees} employees, {stats.hours_rows} hour rows in "
+        f"{stats.seconds:.1f} s ({stats.rows_per_second:,.0f} rows/s) → {args.output}"
+    )
+    return 0
+
+
+# ==================================================
+# ARGUMENTS
+# ==================================================
+def _add_period(parser):
+    parser.add_argument("--from", dest="start", required=True, metavar="YYYY-MM-DD")
+    parser.add_argument("--to", dest="end", required=True, metavar="YYYY-MM-DD")
+    parser.add_argument("--rate-mode", choices=("fixed", "custom"), default="fixed")
+    parser.add_argument("--housing", type=float, default=0.0, help="deduction per employee, €")
+    parser.add_argument("--utilities", type=float, default=0.0, help="deduction per employee, €")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m cli", description="Payroll System (headless)")
+    parser.add_argument("--db", help="database file (default: application data directory)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    calc = commands.add_parser("calc", help="calculate payroll for a period")
+    _add_period(calc)
+    calc.add_argument("--format", choices=("table", "csv", "json"), default="table")
+    calc.set_defaults(handler=cmd_calc)
+
+    pdf = commands.add_parser("pdf", help="save PDF statements for all employees")
+    _add_period(pdf)
+    pdf.add_argument("--combined", action="store_true", help="one PDF with a bookmark per employee")
+    pdf.add_argument("--out", help="output directory (default: Documents/PayrollSystem/Payroll/YYYY-MM)")
+    pdf.add_argument("--workers", type=int, default=None, help="render processes")
+    pdf.add_argument("-q", "--quiet", action="store_true")
+    pdf.set_defaults(handler=cmd_pdf)
+
+    export = commands.add_parser("export", help="export the payroll register to Excel")
+    _add_period(export)
+    export.add_argument("output", help="path to .xlsx")
+    export.add_argument("--days", action="store_true", help="add a sheet with hours per day")
+    export.add_argument("-q", "--quiet", action="store_true")
+    export.set_defaults(handler=cmd_export)
+
+    backup = commands.add_parser("backup", help="back up the database")
+    backup.add_argument("--dir", help="backup directory")
+    backup.add_argument("--compress", action="store_true")
+    backup.add_argument("--no-verify", action="store_true")
+    backup.set_defaults(handler=cmd_backup)
+
+    generate = commands.add_parser("generate", help="create a synthetic database for load testing")
+    generate.add_argument("output", help="database file to create")
+    generate.add_argument("--employees", type=int, default=1000)
+    generate.add_argument("--from", dest="start", default="2026-01-01", metavar="YYYY-MM-DD")
+    generate.add_argument("--to", dest="end", default="2026-12-31", metavar="YYYY-MM-DD")
+    generate.add_argument("--seed", type=int, default=0)
+    generate.add_argument("--append", action="store_true", help="add to an existing database")
+    generate.add_argument("-q", "--quiet", action="store_true")
+    generate.set_defaults(handler=cmd_generate)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except Exception as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,8 @@
 from pathlib import Path
 import os
 
+from core.paths import get_app_dir
+
 # ===== App Info =====
 APP_NAME = "Payroll System"
 APP_VERSION = "1.7.0"
@@ -9,9 +11,43 @@ APP_VERSION = "1.7.0"
 FIXED_RATE = 8  # €/hour
 
 # ===== Paths =====
-# Используем LOCALAPPDATA для хранения БД (работает и в EXE)
+# Используем LOCALAPPDATA для хранения БД (работает и в EXE);
+# без неё (Linux, cron) — ~/.local/share/PayrollSystem.
+# Папка создаётся при открытии БД, а не при импорте config
 LOCAL_APPDATA = os.getenv("LOCALAPPDATA")
-APP_DATA_DIR = Path(LOCAL_APPDATA) / "PayrollSystem"
-APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
+if LOCAL_APPDATA:
+    APP_DATA_DIR = Path(LOCAL_APPDATA) / "PayrollSystem"
+else:
+    APP_DATA_DIR = get_app_dir(create=False)
+
+# PAYROLL_DB_PATH — другой файл БД (например, из python -m cli generate)
+DATABASE_PATH = Path(os.getenv("PAYROLL_DB_PATH") or APP_DATA_DIR / "payroll.db")
+
+# ===== Database =====
+# Профиль соединения SQLite: interactive | bulk_import | reporting
+DB_PROFILE = os.getenv("PAYROLL_DB_PROFILE", "interactive")
+
+# ===== Backups =====
+BACKUP_DIR = APP_DATA_DIR / "backups"
+
+
+def backup_dir_for(db_path) -> Path:
+    """
+    Папка копий для файла БД: у основной payroll.db — BACKUP_DIR,
+    у любой другой (PAYROLL_DB_PATH, cli --db) — <папка БД>/backups/<имя БД>,
+    чтобы её ротация не смешивалась с копиями основной базы.
+    """
+    db_path = Path(db_path).resolve()
+    if db_path == (APP_DATA_DIR / "payroll.db").resolve():
+        return BACKUP_DIR
+    return db_path.parent / "backups" / db_path.stem
+
+
+BACKUP_KEEP_DAILY = 7
+BACKUP_KEEP_WEEKLY = 4
+BACKUP_KEEP_MONTHLY = 12
+BACKUP_COMPRESS = os.getenv("PAYROLL_BACKUP_COMPRESS", "0") == "1"
 
-DATABASE_PATH = APP_DATA_DIR / "payroll.db"
\ No newline at end of file
+# ===== PDF =====
+# Процессов для пакетной генерации PDF (0 — по числу ядер)
+PDF_WORKERS = int(os.getenv("PAYROLL_PDF_WORKERS", "0"))
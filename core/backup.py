@@ -1,16 +1,238 @@
+from dataclasses import dataclass
 from pathlib import Path
-import shutil
 from datetime import datetime
+import gzip
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
 
 
-def backup_db(db_path: Path):
-    if not db_path.exists():
+BACKUP_PREFIX = "salary_backup_"
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+# Страниц за один шаг sqlite3 backup
+BACKUP_PAGES = 256
+
+# Ожидание перед повтором шага, если БД занята (SQLITE_BUSY / SQLITE_LOCKED):
+# параметр sleep= у Connection.backup действует только в этом случае
+BACKUP_SLEEP = 0.005
+
+# Пауза после каждого шага (в progress-колбэке): блокировка чтения снята,
+# и приложение успевает записать в БД, не дожидаясь конца копии
+BACKUP_PAUSE = 0.002
+
+# Незавершённые копии моложе этого не трогаем: их может писать
+# другой процесс (бэкап при запуске приложения и `cli backup` по cron)
+PARTIAL_GRACE_SECONDS = 6 * 60 * 60
+
+
+class BackupError(Exception):
+    pass
+
+
+# ==================================================
+# RETENTION
+# ==================================================
+@dataclass(frozen=True)
+class Retention:
+    """Сколько последних копий хранить: по дням / неделям / месяцам"""
+    daily: int = 7
+    weekly: int = 4
+    monthly: int = 12
+
+
+def _backup_timestamp(path: Path) -> datetime | None:
+    name = path.name
+    if not name.startswith(BACKUP_PREFIX):
+        return None
+    # salary_backup_<ts>[-N].db[.gz]: -N — вторая и следующие копии в ту же секунду
+    stamp = name[len(BACKUP_PREFIX):].split(".", 1)[0].split("-", 1)[0]
+    try:
+        return datetime.strptime(stamp, TIMESTAMP_FORMAT)
+    except ValueError:
+        return None
+
+
+def list_backups(backup_dir: Path) -> list[tuple[datetime, Path]]:
+    """Готовые копии (.db / .db.gz), новые сначала"""
+    if not backup_dir.exists():
+        return []
+
+    backups = []
+    for path in backup_dir.iterdir():
+        if not (path.name.endswith(".db") or path.name.endswith(".db.gz")):
+            continue
+        ts = _backup_timestamp(path)
+        if ts is not None:
+            backups.append((ts, path))
+
+    backups.sort(reverse=True)
+    return backups
+
+
+def prune_backups(backup_dir: Path, retention: Retention) -> list[Path]:
+    """
+    Удаляет копии вне политики хранения (самая новая копия в каждом
+    дне / неделе / месяце). Возвращает список удалённых файлов.
+    """
+    backups = list_backups(backup_dir)
+
+    keep = set()
+    buckets = (
+        (lambda ts: ts.date(), retention.daily),
+        (lambda ts: ts.isocalendar()[:2], retention.weekly),
+        (lambda ts: (ts.year, ts.month), retention.monthly),
+    )
+    for bucket, limit in buckets:
+        seen = set()
+        for ts, path in backups:
+            key = bucket(ts)
+            if key in seen:
+                continue
+            if len(seen) >= limit:
+                break
+            seen.add(key)
+            keep.add(path)
+
+    removed = []
+    for _, path in backups:
+        if path not in keep:
+            path.unlink(missing_ok=True)
+            removed.append(path)
+
+    # Незавершённые копии (приложение закрыли во время бэкапа)
+    stale = time.time() - PARTIAL_GRACE_SECONDS
+    for path in backup_dir.glob(f"{BACKUP_PREFIX}*.partial"):
+        try:
+            if path.stat().st_mtime < stale:
+                path.unlink()
+        except FileNotFoundError:
+            pass
+
+    return removed
+
+
+# ==================================================
+# INTEGRITY
+# ==================================================
+def verify_backup(path: Path):
+    """PRAGMA integrity_check для копии (.db или .db.gz)"""
+    if path.name.endswith(".gz"):
+        plain = path.with_name(path.name[:-3] + ".verify")
+        with gzip.open(path, "rb") as src, open(plain, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        try:
+            verify_backup(plain)
+        finally:
+            plain.unlink(missing_ok=True)
         return
 
-    backup_dir = db_path.parent / "backups"
-    backup_dir.mkdir(exist_ok=True)
+    conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        result = conn.execute("PRAGMA integrity_check").fetchone()[0]
+    finally:
+        conn.close()
+
+    if result != "ok":
+        raise BackupError(f"Backup integrity check failed for {path}: {result}")
+
+
+# ==================================================
+# ONLINE BACKUP
+# ==================================================
+def _partial_file(backup_dir: Path, ts: str) -> Path:
+    """Уникальный временный файл копии (свой у каждого процесса и вызова)"""
+    fd, name = tempfile.mkstemp(prefix=f"{BACKUP_PREFIX}{ts}_", suffix=".partial", dir=backup_dir)
+    os.close(fd)
+    return Path(name)
+
+
+def _claim_backup_name(backup_dir: Path, ts: str, suffix: str) -> Path:
+    """
+    Свободное имя копии: файл создаётся сразу (режим "x"), поэтому второй
+    бэкап в ту же секунду получает salary_backup_<ts>-1 и т.д.
+    """
+    n = 0
+    while True:
+        counter = f"-{n}" if n else ""
+        path = backup_dir / f"{BACKUP_PREFIX}{ts}{counter}{suffix}"
+        try:
+            open(path, "xb").close()
+            return path
+        except FileExistsError:
+            n += 1
+
+
+def backup_db(
+    db_path: Path,
+    backup_dir: Path | None = None,
+    *,
+    retention: Retention | None = None,
+    compress: bool = False,
+    verify: bool = True,
+    progress=None,
+    cancel=None,
+):
+    """
+    Онлайн-копия БД через sqlite3 backup API (шагами по BACKUP_PAGES страниц).
+
+    progress(remaining, total) — прогресс в страницах.
+    cancel — threading.Event; если установлен, копирование прерывается.
+    Возвращает путь к копии или None, если БД ещё не создана.
+    """
+    db_path = Path(db_path)
+    if not db_path.exists():
+        return None
+
+    backup_dir = Path(backup_dir) if backup_dir else db_path.parent / "backups"
+    backup_dir.mkdir(parents=True, exist_ok=True)
+
+    ts = datetime.now().strftime(TIMESTAMP_FORMAT)
+    partial = _partial_file(backup_dir, ts)
+
+    def _on_step(status, remaining, total):
+        if cancel is not None and cancel.is_set():
+            raise BackupError("Backup cancelled")
+        if progress:
+            progress(remaining, total)
+        if remaining and BACKUP_PAUSE:
+            time.sleep(BACKUP_PAUSE)
+
+    try:
+        src = sqlite3.connect(db_path)
+        try:
+            target = sqlite3.connect(partial)
+            try:
+                src.backup(target, pages=BACKUP_PAGES, progress=_on_step, sleep=BACKUP_SLEEP)
+            finally:
+                target.close()
+        finally:
+            src.close()
+
+        if verify:
+            verify_backup(partial)
+
+        dst = _claim_backup_name(backup_dir, ts, ".db.gz" if compress else ".db")
+        try:
+            if compress:
+                packed = _partial_file(backup_dir, ts)
+                try:
+                    with open(partial, "rb") as f_in, gzip.open(packed, "wb", compresslevel=6) as f_out:
+                        shutil.copyfileobj(f_in, f_out)
+                    packed.replace(dst)
+                finally:
+                    packed.unlink(missing_ok=True)
+            else:
+                partial.replace(dst)
+        except BaseException:
+            dst.unlink(missing_ok=True)
+            raise
+    finally:
+        partial.unlink(missing_ok=True)
 
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    dst = backup_dir / f"salary_backup_{ts}.db"
+    if retention is not None:
+        prune_backups(backup_dir, retention)
 
-    shutil.copy2(db_path, dst)
+    return dst
@@ -0,0 +1,83 @@
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import NamedTuple
+
+
+# Названия дней недели фиксированы (не зависят от локали, как strftime("%A"))
+WEEKDAYS = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
+# Сколько лет держать в памяти (≈365 записей на год)
+YEAR_CACHE_SIZE = 16
+
+
+# ==================================================
+# DATE INFO
+# ==================================================
+class DateInfo(NamedTuple):
+    iso: str           # YYYY-MM-DD
+    date_ui: str       # DD.MM.YYYY
+    date_dmy: str      # DD-MM-YYYY (формат DateEntry и PDF)
+    weekday: str       # Monday, Tuesday, ...
+    is_weekend: bool
+    iso_week: int
+    date: date
+
+
+def _make_info(d: date) -> DateInfo:
+    iso = d.isoformat()
+    year, month, day = iso[0:4], iso[5:7], iso[8:10]
+    weekday = d.weekday()
+
+    return DateInfo(
+        iso=iso,
+        date_ui=f"{day}.{month}.{year}",
+        date_dmy=f"{day}-{month}-{year}",
+        weekday=WEEKDAYS[weekday],
+        is_weekend=weekday >= 5,
+        iso_week=d.isocalendar()[1],
+        date=d,
+    )
+
+
+# ==================================================
+# PRECOMPUTED TABLE (PER YEAR)
+# ==================================================
+@lru_cache(maxsize=YEAR_CACHE_SIZE)
+def _year_table(year: int) -> dict[str, DateInfo]:
+    """Таблица ISO дата → DateInfo на весь год"""
+    d = date(year, 1, 1)
+    table = {}
+    while d.year == year:
+        info = _make_info(d)
+        table[info.iso] = info
+        d += timedelta(days=1)
+    return table
+
+
+def date_info(iso: str) -> DateInfo:
+    """Метаданные даты по ISO строке (YYYY-MM-DD)"""
+    try:
+        return _year_table(int(iso[0:4]))[iso]
+    except (KeyError, ValueError):
+        raise ValueError(f"Invalid ISO date: {iso!r}") from None
+
+
+def date_info_dmy(dmy: str) -> DateInfo:
+    """Метаданные даты по строке DD-MM-YYYY"""
+    return date_info(f"{dmy[6:10]}-{dmy[3:5]}-{dmy[0:2]}")
+
+
+def date_range(start: date, end: date):
+    """DateInfo для каждого дня периода включительно"""
+    d = start
+    while d <= end:
+        yield date_info(d.isoformat())
+        d += timedelta(days=1)
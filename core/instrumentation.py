@@ -0,0 +1,291 @@
+"""
+Замеры горячих путей: время, число вызовов и обработанных строк.
+
+Выключено по умолчанию — обёртка стоит одну проверку флага на вызов.
+Включение:
+    PAYROLL_METRICS=1            — собирать (окно Tools → Diagnostics)
+    PAYROLL_METRICS=metrics.json — собирать и записать JSON при выходе
+    enable() / disable()         — из кода или окна Diagnostics
+
+PDF, которые рендерятся в пуле процессов (пакетное сохранение), здесь
+не видны: у процессов-воркеров свои счётчики.
+"""
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from types import FunctionType
+import atexit
+import json
+import math
+import os
+
+
+# Сколько последних замеров на метрику хранить для p50 / p95
+SAMPLES = 2048
+
+ENV_VAR = "PAYROLL_METRICS"
+
+# Строк за один замер при чтении курсора (timed_cursor)
+CURSOR_BATCH = 1000
+
+_enabled = False
+_lock = Lock()
+_metrics: dict[str, "Metric"] = {}
+
+
+# ==================================================
+# METRIC
+# ==================================================
+class Metric:
+    __slots__ = ("name", "calls", "errors", "rows", "total", "max", "samples")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=SAMPLES)
+
+    def add(self, seconds: float, rows: int | None, failed: bool):
+        self.calls += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.samples.append(seconds)
+        if rows:
+            self.rows += rows
+        if failed:
+            self.errors += 1
+
+    def summary(self) -> dict:
+        ordered = sorted(self.samples)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rows": self.rows,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total / self.calls * 1000 if self.calls else 0.0,
+            "p50_ms": _percentile(ordered, 0.50) * 1000,
+            "p95_ms": _percentile(ordered, 0.95) * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+def _percentile(ordered, q: float) -> float:
+    """Nearest-rank по отсортированным замерам"""
+    if not ordered:
+        return 0.0
+    index = max(0, min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1))
+    return ordered[index]
+
+
+def record(name: str, seconds: float, rows: int | None = None, failed: bool = False):
+    with _lock:
+        metric = _metrics.get(name)
+        if metric is None:
+            metric = _metrics[name] = Metric(name)
+        metric.add(seconds, rows, failed)
+
+
+# ==================================================
+# SWITCH
+# ==================================================
+def enabled() -> bool:
+    return _enabled
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def reset():
+    with _lock:
+        _metrics.clear()
+
+
+# ==================================================
+# MEASURE
+# ==================================================
+def _count_rows(result):
+    """Строки в результате: длина списка или словаря (кортеж — это запись, не строки)"""
+    if isinstance(result, (list, dict)):
+        return len(result)
+    return None
+
+
+def timed(name: str, rows=_count_rows):
+    """
+    Декоратор: время вызова функции под именем name.
+    rows(result) -> int | None — сколько строк обработано (None — не считать).
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+
+            started = perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException:
+                record(name, perf_counter() - started, failed=True)
+                raise
+            record(name, perf_counter() - started, rows(result) if rows else None)
+            return result
+
+        return wrapper
+    return decorator
+
+
+class _Span:
+    __slots__ = ("rows",)
+
+    def __init__(self):
+        self.rows = None
+
+
+@contextmanager
+def timer(name: str):
+    """
+    Замер блока кода:
+        with timer("ui.tree.fetch") as span:
+            page = fetch(...)
+            span.rows = len(page)
+    """
+    span = _Span()
+    if not _enabled:
+        yield span
+        return
+
+    started = perf_counter()
+    try:
+        yield span
+    except BaseException:
+        record(name, perf_counter() - started, span.rows, failed=True)
+        raise
+    record(name, perf_counter() - started, span.rows)
+
+
+class _MeteredCursor:
+    """
+    Курсор, который считает строки и время выборки по мере чтения
+    (fetchmany пакетами по CURSOR_BATCH — замер на пакет, а не на строку).
+    Замер записывается, когда курсор дочитан или брошен.
+    Остальные атрибуты (description, ...) — от исходного курсора.
+    """
+    __slots__ = ("_cursor", "_name", "_seconds", "_rows", "_batch", "_done")
+
+    def __init__(self, cursor, name: str, seconds: float):
+        self._cursor = cursor
+        self._name = name
+        self._seconds = seconds
+        self._rows = 0
+        self._batch = iter(())
+        self._done = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        row = next(self._batch, None)
+        if row is None:
+            started = perf_counter()
+            batch = self._cursor.fetchmany(CURSOR_BATCH)
+            self._seconds += perf_counter() - started
+            if not batch:
+                self._finish()
+                raise StopIteration
+            self._batch = iter(batch)
+            row = next(self._batch)
+        self._rows += 1
+        return row
+
+    def __getattr__(self, attr):
+        return getattr(self._cursor, attr)
+
+    def _finish(self):
+        if not self._done:
+            self._done = True
+            record(self._name, self._seconds, self._rows)
+
+    def __del__(self):
+        self._finish()
+
+
+def timed_cursor(name: str):
+    """
+    Как timed, но для методов, возвращающих курсор: в замер входят
+    execute и чтение строк, rows — сколько строк прочитано.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+
+            started = perf_counter()
+            try:
+                cursor = fn(*args, **kwargs)
+            except BaseException:
+                record(name, perf_counter() - started, failed=True)
+                raise
+            return _MeteredCursor(cursor, name, perf_counter() - started)
+
+        return wrapper
+    return decorator
+
+
+def instrumented(prefix: str, skip=(), cursors=()):
+    """
+    Декоратор класса: timed(f"{prefix}.{метод}") на каждый публичный метод.
+    skip — методы, которые оборачивать нельзя или не нужно (контекст-менеджеры).
+    cursors — методы, возвращающие курсор: замер по мере чтения (timed_cursor).
+    staticmethod / classmethod / property не трогаются.
+    """
+    def decorator(cls):
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or attr in skip or not isinstance(value, FunctionType):
+                continue
+            wrap = timed_cursor if attr in cursors else timed
+            setattr(cls, attr, wrap(f"{prefix}.{attr}")(value))
+        return cls
+    return decorator
+
+
+# ==================================================
+# REPORT
+# ==================================================
+def snapshot() -> dict[str, dict]:
+    """{имя: calls, errors, rows, total / mean / p50 / p95 / max в мс}"""
+    with _lock:
+        return {name: metric.summary() for name, metric in sorted(_metrics.items())}
+
+
+def dump(path) -> dict:
+    data = {"enabled": _enabled, "metrics": snapshot()}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    return data
+
+
+def configure_from_env():
+    """PAYROLL_METRICS: пусто / 0 — выключено, 1 — включено, иначе путь к JSON"""
+    value = os.getenv(ENV_VAR, "").strip()
+    if not value or value == "0":
+        return
+    enable()
+    if value != "1":
+        atexit.register(dump, value)
+
+
+configure_from_env()
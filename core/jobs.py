@@ -0,0 +1,174 @@
+from concurrent.futures import ThreadPoolExecutor, wait
+from itertools import count
+import queue
+import threading
+
+
+# Потоков для фоновых задач (PDF, бэкап, экспорт, пакетные расчёты)
+JOB_WORKERS = 2
+
+# Как часто GUI забирает результаты из очереди, мс
+POLL_MS = 100
+
+# Сколько закрытие приложения ждёт отменённые задачи, с
+SHUTDOWN_TIMEOUT = 2.0
+
+
+class JobCancelled(Exception):
+    pass
+
+
+# ==================================================
+# JOB
+# ==================================================
+class Job:
+    """
+    Фоновая задача. Функция задачи получает Job первым аргументом:
+        job.report(done, total) — прогресс (из рабочего потока)
+        job.cancel_event        — threading.Event для функций с cancel=
+        job.check()             — JobCancelled, если задачу отменили
+    """
+
+    def __init__(self, runner, job_id: int, name: str, on_done, on_error, on_progress):
+        self.runner = runner
+        self.id = job_id
+        self.name = name
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.cancel_event = threading.Event()
+        self.future = None
+        self.done = None
+        self.total = None
+        self.finished = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def check(self):
+        if self.cancel_event.is_set():
+            raise JobCancelled(f"{self.name} cancelled")
+
+    def report(self, done, total=None):
+        self.runner._events.put((self, "progress", (done, total)))
+
+    def __repr__(self):
+        return f"<Job {self.id} {self.name!r}>"
+
+
+# ==================================================
+# RUNNER
+# ==================================================
+class JobRunner:
+    """
+    Пул рабочих потоков + очередь результатов.
+
+    Функции задач выполняются в пуле; колбэки on_done / on_error /
+    on_progress и слушатели вызываются только из poll() — то есть в потоке
+    GUI, если runner подключён через attach(). Соединение sqlite3 нельзя
+    использовать из другого потока: задача, которой нужна БД, открывает
+    своё соединение.
+    """
+
+    def __init__(self, workers: int = JOB_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job")
+        self._events = queue.Queue()
+        self._ids = count(1)
+        self._listeners = []
+        self._widget = None
+        self.jobs: dict[int, Job] = {}
+
+    # ---------- SUBMIT ----------
+    def submit(self, fn, *args, name="", on_done=None, on_error=None, on_progress=None, **kwargs) -> Job:
+        """fn(job, *args, **kwargs) в рабочем потоке"""
+        job = Job(self, next(self._ids), name, on_done, on_error, on_progress)
+        self.jobs[job.id] = job
+        job.future = self._executor.submit(self._run, job, fn, args, kwargs)
+        self._notify(job)
+        return job
+
+    def _run(self, job, fn, args, kwargs):
+        try:
+            job.check()
+            result = fn(job, *args, **kwargs)
+        except BaseException as e:
+            self._events.put((job, "error", e))
+        else:
+            self._events.put((job, "done", result))
+
+    def running(self, name: str | None = None) -> list[Job]:
+        return [j for j in self.jobs.values() if name is None or j.name == name]
+
+    def cancel_all(self):
+        for job in list(self.jobs.values()):
+            job.cancel()
+
+    def shutdown(self, cancel: bool = True, timeout: float | None = SHUTDOWN_TIMEOUT):
+        """
+        Закрытие приложения: отменить задачи и подождать их не дольше timeout.
+        Задачи без проверки отмены (один PDF, печать) окно не держат —
+        они доработают в своих потоках, процесс дождётся их при выходе.
+        timeout=None — ждать все задачи.
+        """
+        if cancel:
+            self.cancel_all()
+        futures = [job.future for job in self.jobs.values() if job.future is not None]
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        wait(futures, timeout=timeout)
+        self._widget = None
+
+    # ---------- LISTENERS ----------
+    def add_listener(self, callback):
+        """callback(job) — при запуске, прогрессе и завершении любой задачи"""
+        self._listeners.append(callback)
+
+    def _notify(self, job):
+        for callback in self._listeners:
+            callback(job)
+
+    # ---------- RESULTS ----------
+    def poll(self) -> int:
+        """Разобрать очередь результатов; возвращает число событий"""
+        handled = 0
+        while True:
+            try:
+                job, kind, payload = self._events.get_nowait()
+            except queue.Empty:
+                return handled
+            handled += 1
+
+            if kind == "progress":
+                job.done, job.total = payload
+                if job.on_progress:
+                    job.on_progress(*payload)
+                self._notify(job)
+                continue
+
+            job.finished = True
+            self.jobs.pop(job.id, None)
+            self._notify(job)
+            if kind == "done":
+                if job.on_done:
+                    job.on_done(payload)
+            elif isinstance(payload, JobCancelled) or job.cancelled:
+                pass    # отмену запросил пользователь — сообщать не о чем
+            elif job.on_error:
+                job.on_error(payload)
+
+    def attach(self, widget, interval: int = POLL_MS):
+        """Опрос очереди через widget.after() — колбэки в потоке Tk"""
+        self._widget = widget
+
+        def tick():
+            if self._widget is not widget:
+                return
+            try:
+                self.poll()
+            finally:
+                widget.after(interval, tick)
+
+        widget.after(interval, tick)
@@ -21,7 +21,7 @@ class Employee:
             name=row["name"],
             rate=row["rate"],
             has_bank_account=bool(row["has_bank_account"]),
-            bank_name=row["bank_name"],
+            bank_name=row["bank"],
             iban=row["iban"],
             bic=row["bic"],
         )
@@ -50,3 +50,13 @@ class PayrollSummary:
     housing_deduction: float = 0.0
     utilities_deduction: float = 0.0
     net_amount: float = 0.0
+
+
+# ==================================================
+# EMPLOYEE PAYROLL (BATCH RUN RESULT)
+# ==================================================
+@dataclass
+class EmployeePayroll:
+    employee: Employee
+    rows: list[PayrollRow]
+    summary: PayrollSummary
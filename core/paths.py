@@ -2,10 +2,11 @@ import sys
 from pathlib import Path
 
 
-def get_app_dir(app_name="PayrollSystem") -> Path:
+def get_app_dir(app_name="PayrollSystem", create=True) -> Path:
     """
     Returns writable application directory.
     Works both for Python and PyInstaller exe.
+    create=False only computes the path (no filesystem access).
     """
     if sys.platform.startswith("win"):
         base = Path.home() / "AppData" / "Local"
@@ -13,5 +14,6 @@ def get_app_dir(app_name="PayrollSystem") -> Path:
         base = Path.home() / ".local" / "share"
 
     app_dir = base / app_name
-    app_dir.mkdir(parents=True, exist_ok=True)
+    if create:
+        app_dir.mkdir(parents=True, exist_ok=True)
     return app_dir
@@ -1,42 +1,115 @@
-from config import DATABASE_PATH
+from config import DATABASE_PATH, DB_PROFILE
+from core.instrumentation import instrumented
+from database.migrations import LATEST_VERSION, migrate, schema_version
+from database.profiles import connect, effective_settings, get_profile
+from database.repository import EmployeeRepository, HoursCache
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+import re
 import sqlite3
 
 
+# Веса колонок для bm25: совпадение в имени важнее, чем в реквизитах
+EMPLOYEE_WEIGHTS = (10.0, 2.0, 1.0, 1.0)                # name, bank, iban, bic
+PAYROLL_WEIGHTS = (10.0, 2.0, 1.0, 1.0, 1.0, 1.0)       # + period_from, period_to
+
+# Сколько табелей (сотрудник × период) держать в памяти
+HOURS_CACHE_SIZE = 32
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def fts_query(text: str) -> str | None:
+    """
+    Пользовательский ввод → запрос FTS5: каждое слово как префикс,
+    все слова обязательны ("anna sch" → "anna"* "sch"*).
+    Операторы FTS5 во вводе не интерпретируются.
+    """
+    words = _WORD_RE.findall(text or "")
+    if not words:
+        return None
+    return " ".join(f'"{w}"*' for w in words)
+
+
+def _like_pattern(text: str) -> str:
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+# Время, вызовы и строки по каждому публичному методу (см. core.instrumentation)
+@instrumented(
+    "db",
+    skip=("transaction", "close", "settings"),
+    cursors=("iter_employees", "iter_hours", "load_hours_for_period"),
+)
 class Database:
-    def __init__(self):
-        self.conn = sqlite3.connect(DATABASE_PATH)
+    def __init__(self, path=None, profile=None):
+        self.path = path or DATABASE_PATH
+        self.profile = get_profile(profile or DB_PROFILE)
+        if not self.profile.read_only and str(self.path) != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = connect(self.path, self.profile)
         self.conn.row_factory = sqlite3.Row
         self.cur = self.conn.cursor()
-        self._init_db()
+        self._tx_depth = 0
+        if not self.profile.read_only:
+            migrate(self.conn)
+        elif str(self.path) != ":memory:" and schema_version(self.conn) < LATEST_VERSION:
+            # БД, которую приложение ещё не открывало (cron, `cli`): отчётное
+            # соединение схему не меняет — миграции отдельным соединением на запись
+            self._migrate_read_write()
+        self.has_fts = self._table_exists("employees_fts")
+        self.employees = EmployeeRepository(self.conn)
+        self.hours_cache = HoursCache(self.conn, HOURS_CACHE_SIZE)
+
+    def _migrate_read_write(self):
+        conn = connect(self.path, "interactive")
+        try:
+            migrate(conn)
+        finally:
+            conn.close()
+
+    def _table_exists(self, name: str) -> bool:
+        return self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name=?", (name,)
+        ).fetchone() is not None
+
+    def settings(self) -> dict:
+        """Профиль соединения и фактические настройки SQLite"""
+        return {
+            "profile": self.profile.name,
+            "cached_statements": self.profile.cached_statements,
+            **effective_settings(self.conn),
+        }
 
     # ==================================================
-    # INIT
+    # TRANSACTIONS
     # ==================================================
-    def _init_db(self):
-        self.cur.execute("""
-            CREATE TABLE IF NOT EXISTS employees (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                rate REAL NOT NULL,
-                bank TEXT,
-                iban TEXT,
-                bic TEXT
-            )
-        """)
-
-        self.cur.execute("""
-            CREATE TABLE IF NOT EXISTS work_hours (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                employee_id INTEGER NOT NULL,
-                work_date TEXT NOT NULL,
-                hours REAL NOT NULL,
-                UNIQUE(employee_id, work_date),
-                FOREIGN KEY(employee_id) REFERENCES employees(id)
-            )
-        """)
-
-        self.conn.commit()
+    @contextmanager
+    def transaction(self):
+        """
+        Единица работы: все изменения внутри блока фиксируются одним коммитом.
+        Вложенные блоки присоединяются к внешней транзакции.
+        """
+        self._tx_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
+                self.conn.rollback()
+                self.employees.clear()
+                self.hours_cache.clear()
+            raise
+        else:
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
+                self.conn.commit()
 
+    def _commit(self):
+        if self._tx_depth == 0:
+            self.conn.commit()
 
     # ==================================================
     # EMPLOYEES
@@ -46,44 +119,82 @@ class Database:
             "SELECT * FROM employees ORDER BY name"
         ).fetchall()
 
+    def get_employee(self, emp_id: int):
+        """Сотрудник (Employee) по id — из кэша, без запроса при повторе"""
+        return self.employees.get(emp_id)
+
+    def count_employees(self) -> int:
+        return self.employees.count()
+
+    def list_employees(self, after=None, limit: int = None):
+        """
+        Сотрудники (Employee) по имени.
+        limit=None — все (кэшируются), иначе страница после ключа after=(name, id).
+        """
+        if limit is None:
+            return self.employees.all()
+        return self.employees.page(after, limit)
+
+    def iter_employees(self):
+        """Курсор по всем сотрудникам в порядке id (для потоковых отчётов)"""
+        return self.conn.execute("SELECT * FROM employees ORDER BY id")
+
     def add_employee(self, name: str, rate: float, bank: str = None, iban: str = None, bic: str = None):
         self.cur.execute(
-            "INSERT INTO employees (name, rate, bank, iban, bic) VALUES (?, ?, ?, ?, ?)",
-            (name, rate, bank, iban, bic),
+            """
+            INSERT INTO employees (name, rate, bank, iban, bic, has_bank_account)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (name, rate, bank, iban, bic, int(bool(iban))),
         )
-        self.conn.commit()
+        self._commit()
+        emp_id = self.cur.lastrowid
+        self.employees.added(emp_id)
+        return emp_id
 
     def update_employee(self, emp_id: int, name: str, rate: float, bank: str = None, iban: str = None, bic: str = None):
         self.cur.execute(
-            "UPDATE employees SET name=?, rate=?, bank=?, iban=?, bic=? WHERE id=?",
-            (name, rate, bank, iban, bic, emp_id),
+            """
+            UPDATE employees
+            SET name=?, rate=?, bank=?, iban=?, bic=?, has_bank_account=?
+            WHERE id=?
+            """,
+            (name, rate, bank, iban, bic, int(bool(iban)), emp_id),
         )
-        self.conn.commit()
+        self._commit()
+        self.employees.changed(emp_id)
 
     def delete_employee(self, emp_id: int):
+        # Сначала часы — на employees ссылается внешний ключ work_hours
         self.cur.execute(
-            "DELETE FROM employees WHERE id=?",
+            "DELETE FROM work_hours WHERE employee_id=?",
             (emp_id,),
         )
         self.cur.execute(
-            "DELETE FROM work_hours WHERE employee_id=?",
+            "DELETE FROM employees WHERE id=?",
             (emp_id,),
         )
-        self.conn.commit()
+        deleted = self.cur.rowcount
+        self._commit()
+        self.hours_cache.invalidate(emp_id)
+        if deleted:
+            self.employees.removed(emp_id)
 
     def update_employee_name(self, emp_id: int, name: str):
         self.cur.execute(
             "UPDATE employees SET name=? WHERE id=?",
             (name, emp_id),
         )
-        self.conn.commit()
+        self._commit()
+        self.employees.changed(emp_id)
 
     def update_employee_rate(self, emp_id: int, rate: float):
         self.cur.execute(
             "UPDATE employees SET rate=? WHERE id=?",
             (rate, emp_id),
         )
-        self.conn.commit()
+        self._commit()
+        self.employees.changed(emp_id)
 
     def update_employee_bank(
         self,
@@ -97,7 +208,7 @@ class Database:
             """
             UPDATE employees
             SET has_bank_account=?,
-                bank_name=?,
+                bank=?,
                 iban=?,
                 bic=?
             WHERE id=?
@@ -110,7 +221,8 @@ class Database:
                 emp_id,
             ),
         )
-        self.conn.commit()
+        self._commit()
+        self.employees.changed(emp_id)
 
     # ==================================================
     # HOURS
@@ -127,6 +239,39 @@ class Database:
             (emp_id, start, end),
         ).fetchall()
 
+    def load_period_hours(self, emp_id: int, start: str, end: str) -> dict[str, float]:
+        """Сохранённые часы сотрудника за период {ISO дата: часы} — через LRU-кэш"""
+        return self.hours_cache.get(emp_id, start, end)
+
+    def prefetch_hours(self, emp_ids, start: str, end: str):
+        """Загрузить в кэш табели нескольких сотрудников одним запросом"""
+        self.hours_cache.prefetch(emp_ids, start, end)
+
+    def iter_hours(self, emp_id: int, start: str, end: str):
+        """Как load_hours, но курсор без fetchall — для длинных периодов"""
+        return self.conn.execute(
+            """
+            SELECT work_date, hours
+            FROM work_hours
+            WHERE employee_id=?
+              AND work_date BETWEEN ? AND ?
+            ORDER BY work_date
+            """,
+            (emp_id, start, end),
+        )
+
+    def load_hours_for_period(self, start: str, end: str):
+        """Часы всех сотрудников за период одним запросом (по employee_id, дате)"""
+        return self.conn.execute(
+            """
+            SELECT employee_id, work_date, hours
+            FROM work_hours
+            WHERE work_date BETWEEN ? AND ?
+            ORDER BY employee_id, work_date
+            """,
+            (start, end),
+        )
+
     def save_hours(self, emp_id: int, date: str, hours: float):
         self.cur.execute(
             """
@@ -137,7 +282,244 @@ class Database:
             """,
             (emp_id, date, hours),
         )
-        self.conn.commit()
+        self._commit()
+        self.hours_cache.invalidate(emp_id, date)
+
+    def save_hours_many(self, rows) -> tuple[int, int]:
+        """
+        Пакетное сохранение часов одной транзакцией.
+
+        rows — итерируемое (employee_id, date, hours).
+        Возвращает (inserted, updated); updated — строки, где часы изменились.
+        """
+        rows = list(rows)
+
+        with self.transaction():
+            inserted = self.conn.executemany(
+                """
+                INSERT OR IGNORE INTO work_hours (employee_id, work_date, hours)
+                VALUES (?, ?, ?)
+                """,
+                rows,
+            ).rowcount
+
+            updated = self.conn.executemany(
+                """
+                UPDATE work_hours
+                SET hours=?
+                WHERE employee_id=? AND work_date=? AND hours<>?
+                """,
+                ((hours, emp_id, date, hours) for emp_id, date, hours in rows),
+            ).rowcount
+
+            for emp_id, date, _ in rows:
+                self.hours_cache.invalidate(emp_id, date)
+
+        return inserted, updated
+
+    # ==================================================
+    # PAYROLL HISTORY
+    # ==================================================
+    def save_payroll(
+        self,
+        *,
+        employee_id: int,
+        name: str,
+        rate_mode: str,
+        rate: float,
+        period_from: str,
+        period_to: str,
+        total_hours: float,
+        gross_amount: float,
+        net_amount: float,
+        days: dict,
+        utilities: float = None,
+        rental: float = None,
+        bank: str = None,
+        iban: str = None,
+        bic: str = None,
+    ) -> int:
+        """Сохраняет расчёт в историю (period_* и ключи days — ISO даты)"""
+        created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        with self.transaction():
+            cur = self.conn.execute(
+                """
+                INSERT INTO payrolls (
+                    employee_id, name, rate_mode, rate,
+                    period_from, period_to, created_at,
+                    bank, iban, bic, utilities, rental,
+                    total_hours, gross_amount, net_amount
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    employee_id, name, rate_mode, rate,
+                    period_from, period_to, created_at,
+                    bank, iban, bic, utilities, rental,
+                    total_hours, gross_amount, net_amount,
+                ),
+            )
+            payroll_id = cur.lastrowid
+
+            self.conn.executemany(
+                "INSERT INTO payroll_days (payroll_id, work_date, hours) VALUES (?, ?, ?)",
+                ((payroll_id, date, hours) for date, hours in sorted(days.items())),
+            )
+
+        return payroll_id
+
+    def _payroll_filters(self, employee_id, name, period_from, period_to, query=None):
+        where, params = [], []
+        if employee_id is not None:
+            where.append("employee_id = ?")
+            params.append(employee_id)
+        if name:
+            where.append("name LIKE ? ESCAPE '\\'")
+            params.append(_like_pattern(name))
+        # Полнотекстовый поиск: имя, реквизиты, даты периода
+        if query and fts_query(query):
+            if self.has_fts:
+                where.append("id IN (SELECT rowid FROM payrolls_fts WHERE payrolls_fts MATCH ?)")
+                params.append(fts_query(query))
+            else:
+                where.append("name LIKE ? ESCAPE '\\'")
+                params.append(_like_pattern(query.strip()))
+        # Пересечение периодов
+        if period_from:
+            where.append("period_to >= ?")
+            params.append(period_from)
+        if period_to:
+            where.append("period_from <= ?")
+            params.append(period_to)
+
+        clause = f"WHERE {' AND '.join(where)}" if where else ""
+        return clause, params
+
+    def get_payrolls(
+        self,
+        *,
+        employee_id: int = None,
+        name: str = None,
+        period_from: str = None,
+        period_to: str = None,
+        query: str = None,
+        limit: int = 200,
+        offset: int = 0,
+    ):
+        """Страница истории расчётов (новые сначала)"""
+        clause, params = self._payroll_filters(
+            employee_id, name, period_from, period_to, query
+        )
+        return self.conn.execute(
+            f"""
+            SELECT id, employee_id, name, rate_mode, rate,
+                   period_from, period_to, created_at,
+                   total_hours, gross_amount, net_amount
+            FROM payrolls
+            {clause}
+            ORDER BY created_at DESC, id DESC
+            LIMIT ? OFFSET ?
+            """,
+            (*params, limit, offset),
+        ).fetchall()
+
+    def count_payrolls(
+        self,
+        *,
+        employee_id: int = None,
+        name: str = None,
+        period_from: str = None,
+        period_to: str = None,
+        query: str = None,
+    ) -> int:
+        clause, params = self._payroll_filters(
+            employee_id, name, period_from, period_to, query
+        )
+        return self.conn.execute(
+            f"SELECT COUNT(*) FROM payrolls {clause}", params
+        ).fetchone()[0]
+
+    # ==================================================
+    # FULL-TEXT SEARCH
+    # ==================================================
+    def search(self, query: str, limit: int = 50, offset: int = 0, *, scope: str = "all"):
+        """
+        Поиск по сотрудникам и истории расчётов (FTS5, префиксы слов).
+
+        scope: "all" | "employees" | "payrolls".
+        Строки: kind ("employee" / "payroll"), id, name, period_from,
+        period_to, rank. Сначала сотрудники, потом расчёты; внутри каждого
+        вида — лучшие совпадения первыми (bm25). Оценки bm25 двух таблиц
+        (разные веса и объём) между собой не сравнимы, поэтому общего
+        рейтинга нет.
+        Без FTS5 в сборке SQLite — подстрока в имени через LIKE, без ранжирования.
+        """
+        if scope not in ("all", "employees", "payrolls"):
+            raise ValueError(f"Unknown search scope: {scope!r}")
+
+        match = fts_query(query)
+        if match is None:
+            return []
+
+        if self.has_fts:
+            employees = f"""
+                SELECT 'employee' AS kind, e.id, e.name,
+                       NULL AS period_from, NULL AS period_to,
+                       bm25(employees_fts, {", ".join(map(str, EMPLOYEE_WEIGHTS))}) AS rank
+                FROM employees_fts
+                JOIN employees e ON e.id = employees_fts.rowid
+                WHERE employees_fts MATCH ?
+            """
+            payrolls = f"""
+                SELECT 'payroll' AS kind, p.id, p.name,
+                       p.period_from, p.period_to,
+                       bm25(payrolls_fts, {", ".join(map(str, PAYROLL_WEIGHTS))}) AS rank
+                FROM payrolls_fts
+                JOIN payrolls p ON p.id = payrolls_fts.rowid
+                WHERE payrolls_fts MATCH ?
+            """
+            param = match
+        else:
+            employees = """
+                SELECT 'employee' AS kind, id, name,
+                       NULL AS period_from, NULL AS period_to, 0 AS rank
+                FROM employees
+                WHERE name LIKE ? ESCAPE '\\'
+            """
+            payrolls = """
+                SELECT 'payroll' AS kind, id, name,
+                       period_from, period_to, 0 AS rank
+                FROM payrolls
+                WHERE name LIKE ? ESCAPE '\\'
+            """
+            param = _like_pattern(query.strip())
+
+        parts = {"all": (employees, payrolls), "employees": (employees,), "payrolls": (payrolls,)}[scope]
+        sql = " UNION ALL ".join(parts) + " ORDER BY kind, rank, id LIMIT ? OFFSET ?"
+
+        return self.conn.execute(sql, (*[param] * len(parts), limit, offset)).fetchall()
+
+    def get_payroll_full(self, payroll_id: int):
+        """Расчёт из истории вместе с днями: (payroll, days)"""
+        payroll = self.conn.execute(
+            "SELECT * FROM payrolls WHERE id=?",
+            (payroll_id,),
+        ).fetchone()
+        if payroll is None:
+            raise KeyError(f"Payroll {payroll_id} not found")
+
+        days = self.conn.execute(
+            """
+            SELECT work_date, hours
+            FROM payroll_days
+            WHERE payroll_id=?
+            ORDER BY work_date
+            """,
+            (payroll_id,),
+        ).fetchall()
+
+        return payroll, days
 
     # ==================================================
     # CLOSE
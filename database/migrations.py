@@ -0,0 +1,298 @@
+from dataclasses import dataclass
+from typing import Callable
+import sqlite3
+
+
+# Сколько строк обновлять за один шаг в пакетных миграциях
+BATCH_SIZE = 5_000
+
+# Как часто (в инструкциях VM SQLite) сообщать о прогрессе долгих операций
+PROGRESS_OPCODES = 100_000
+
+
+# ==================================================
+# MIGRATION REGISTRY
+# ==================================================
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    apply: Callable
+
+
+MIGRATIONS: list[Migration] = []
+
+
+def migration(version: int, description: str):
+    """Регистрирует миграцию; версии должны идти строго по порядку"""
+    def decorator(fn):
+        if MIGRATIONS and version != MIGRATIONS[-1].version + 1:
+            raise RuntimeError(f"Migration {version} is out of order")
+        MIGRATIONS.append(Migration(version, description, fn))
+        return fn
+    return decorator
+
+
+# ==================================================
+# PROGRESS
+# ==================================================
+class MigrationProgress:
+    """
+    Передаёт прогресс миграции в callback(migration, done, total).
+    total=None — операция без известного объёма (например, построение индекса).
+    """
+
+    def __init__(self, callback, migration: Migration):
+        self.callback = callback
+        self.migration = migration
+
+    def report(self, done, total=None):
+        if self.callback:
+            self.callback(self.migration, done, total)
+
+    def heartbeat(self):
+        self.report(None)
+        return 0  # продолжить выполнение запроса
+
+
+def _column_names(conn, table: str) -> set[str]:
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def run_batched(conn, table: str, sql: str, progress: MigrationProgress):
+    """
+    Выполняет UPDATE по диапазонам rowid пакетами по BATCH_SIZE строк.
+    sql должен содержать условие "rowid BETWEEN ? AND ?".
+    """
+    low, high = conn.execute(f"SELECT MIN(rowid), MAX(rowid) FROM {table}").fetchone()
+    if low is None:
+        return
+
+    total = high - low + 1
+    start = low
+    while start <= high:
+        end = min(start + BATCH_SIZE - 1, high)
+        conn.execute(sql, (start, end))
+        progress.report(end - low + 1, total)
+        start = end + 1
+
+
+# ==================================================
+# MIGRATIONS
+# ==================================================
+@migration(1, "Base schema: employees, work_hours")
+def _base_schema(conn, progress):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS employees (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            rate REAL NOT NULL,
+            bank TEXT,
+            iban TEXT,
+            bic TEXT
+        )
+    """)
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS work_hours (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            employee_id INTEGER NOT NULL,
+            work_date TEXT NOT NULL,
+            hours REAL NOT NULL,
+            UNIQUE(employee_id, work_date),
+            FOREIGN KEY(employee_id) REFERENCES employees(id)
+        )
+    """)
+
+
+@migration(2, "employees.bank column (replaces add_bank_column.py)")
+def _employees_bank(conn, progress):
+    if "bank" not in _column_names(conn, "employees"):
+        conn.execute("ALTER TABLE employees ADD COLUMN bank TEXT")
+
+
+@migration(3, "Index on work_hours.work_date")
+def _work_hours_date_index(conn, progress):
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_work_hours_date
+        ON work_hours(work_date)
+    """)
+
+
+@migration(4, "Payroll history: payrolls, payroll_days")
+def _payroll_history(conn, progress):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS payrolls (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            employee_id INTEGER,
+            name TEXT NOT NULL,
+            rate_mode TEXT NOT NULL,
+            rate REAL NOT NULL,
+            period_from TEXT NOT NULL,
+            period_to TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            bank TEXT,
+            iban TEXT,
+            bic TEXT,
+            utilities REAL,
+            rental REAL,
+            total_hours REAL NOT NULL,
+            gross_amount REAL NOT NULL,
+            net_amount REAL NOT NULL,
+            FOREIGN KEY(employee_id) REFERENCES employees(id) ON DELETE SET NULL
+        )
+    """)
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS payroll_days (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            payroll_id INTEGER NOT NULL,
+            work_date TEXT NOT NULL,
+            hours REAL NOT NULL,
+            UNIQUE(payroll_id, work_date),
+            FOREIGN KEY(payroll_id) REFERENCES payrolls(id) ON DELETE CASCADE
+        )
+    """)
+
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_payrolls_employee
+        ON payrolls(employee_id, created_at)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_payrolls_period
+        ON payrolls(period_from, period_to)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_payrolls_created
+        ON payrolls(created_at)
+    """)
+
+
+@migration(5, "employees.has_bank_account (backfilled from IBAN)")
+def _employees_has_bank_account(conn, progress):
+    if "has_bank_account" not in _column_names(conn, "employees"):
+        conn.execute(
+            "ALTER TABLE employees ADD COLUMN has_bank_account INTEGER NOT NULL DEFAULT 0"
+        )
+
+    run_batched(
+        conn,
+        "employees",
+        """
+        UPDATE employees
+        SET has_bank_account = (COALESCE(iban, '') <> '')
+        WHERE rowid BETWEEN ? AND ?
+        """,
+        progress,
+    )
+
+
+def fts5_available(conn) -> bool:
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp._fts5_probe USING fts5(x)")
+    except sqlite3.OperationalError:
+        return False
+    conn.execute("DROP TABLE temp._fts5_probe")
+    return True
+
+
+# Индексы FTS5 с внешним содержимым: текст хранится только в исходной таблице,
+# триггеры поддерживают индекс при INSERT / UPDATE / DELETE
+FTS_TABLES = {
+    "employees_fts": ("employees", ("name", "bank", "iban", "bic")),
+    "payrolls_fts": ("payrolls", ("name", "bank", "iban", "bic", "period_from", "period_to")),
+}
+
+
+@migration(6, "Full-text search (FTS5) over employees and payroll history")
+def _full_text_search(conn, progress):
+    # Сборка SQLite без FTS5 — Database.search работает через LIKE
+    if not fts5_available(conn):
+        return
+
+    for fts, (table, columns) in FTS_TABLES.items():
+        cols = ", ".join(columns)
+        new = ", ".join(f"new.{c}" for c in columns)
+        old = ", ".join(f"old.{c}" for c in columns)
+
+        conn.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                {cols},
+                content='{table}',
+                content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+        """)
+
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new});
+            END
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old});
+            END
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old});
+                INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new});
+            END
+        """)
+
+        conn.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+@migration(7, "Index on employees.name (sorted lists, keyset pagination)")
+def _employees_name_index(conn, progress):
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_employees_name
+        ON employees(name)
+    """)
+
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+# ==================================================
+# RUNNER
+# ==================================================
+def schema_version(conn) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection, progress=None) -> int:
+    """
+    Применяет недостающие миграции по порядку, каждую в своей транзакции.
+    Если схема актуальна — только одно чтение PRAGMA user_version.
+    Возвращает количество применённых миграций.
+    """
+    version = schema_version(conn)
+    if version >= LATEST_VERSION:
+        return 0
+
+    if conn.in_transaction:
+        conn.commit()
+
+    applied = 0
+    for m in MIGRATIONS:
+        if m.version <= version:
+            continue
+
+        reporter = MigrationProgress(progress, m)
+        conn.set_progress_handler(reporter.heartbeat, PROGRESS_OPCODES)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            m.apply(conn, reporter)
+            conn.execute(f"PRAGMA user_version = {m.version}")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            conn.set_progress_handler(None, 0)
+
+        applied += 1
+
+    return applied
@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from pathlib import Path
+import sqlite3
+
+
+# ==================================================
+# CONNECTION PROFILE
+# ==================================================
+@dataclass(frozen=True)
+class ConnectionProfile:
+    name: str
+    journal_mode: str = "wal"
+    synchronous: str = "normal"
+    cache_size: int = -16_000          # < 0 — размер в KiB (≈16 MB)
+    mmap_size: int = 64 * 1024 ** 2
+    temp_store: str = "memory"
+    busy_timeout: int = 5_000          # ms
+    foreign_keys: bool = True
+    cached_statements: int = 256
+    read_only: bool = False
+
+
+PROFILES = {
+    # GUI: WAL + synchronous=NORMAL — быстрые коммиты без потери целостности
+    "interactive": ConnectionProfile(name="interactive"),
+
+    # Массовая загрузка: большой кэш, без fsync на каждый коммит
+    "bulk_import": ConnectionProfile(
+        name="bulk_import",
+        synchronous="off",
+        cache_size=-128_000,
+        mmap_size=256 * 1024 ** 2,
+        busy_timeout=30_000,
+        cached_statements=512,
+    ),
+
+    # Отчёты: соединение только для чтения
+    "reporting": ConnectionProfile(
+        name="reporting",
+        cache_size=-64_000,
+        mmap_size=256 * 1024 ** 2,
+        read_only=True,
+    ),
+}
+
+
+def get_profile(profile) -> ConnectionProfile:
+    """Профиль по имени (или сам профиль, если передан ConnectionProfile)"""
+    if isinstance(profile, ConnectionProfile):
+        return profile
+    try:
+        return PROFILES[profile]
+    except KeyError:
+        raise ValueError(
+            f"Unknown database profile: {profile!r} "
+            f"(available: {', '.join(PROFILES)})"
+        ) from None
+
+
+# ==================================================
+# CONNECT
+# ==================================================
+def connect(path, profile) -> sqlite3.Connection:
+    profile = get_profile(profile)
+
+    if profile.read_only and str(path) != ":memory:":
+        conn = sqlite3.connect(
+            f"{Path(path).resolve().as_uri()}?mode=ro",
+            uri=True,
+            timeout=profile.busy_timeout / 1000,
+            cached_statements=profile.cached_statements,
+        )
+    else:
+        conn = sqlite3.connect(
+            path,
+            timeout=profile.busy_timeout / 1000,
+            cached_statements=profile.cached_statements,
+        )
+
+    apply_profile(conn, profile)
+    return conn
+
+
+def apply_profile(conn: sqlite3.Connection, profile: ConnectionProfile):
+    """Применяет PRAGMA профиля к открытому соединению"""
+    if not profile.read_only:
+        conn.execute(f"PRAGMA journal_mode={profile.journal_mode}")
+    conn.execute(f"PRAGMA synchronous={profile.synchronous}")
+    conn.execute(f"PRAGMA cache_size={int(profile.cache_size)}")
+    conn.execute(f"PRAGMA mmap_size={int(profile.mmap_size)}")
+    conn.execute(f"PRAGMA temp_store={profile.temp_store}")
+    conn.execute(f"PRAGMA busy_timeout={int(profile.busy_timeout)}")
+    conn.execute(f"PRAGMA foreign_keys={'ON' if profile.foreign_keys else 'OFF'}")
+    if profile.read_only:
+        conn.execute("PRAGMA query_only=ON")
+
+
+def effective_settings(conn: sqlite3.Connection) -> dict:
+    """Фактические значения PRAGMA (SQLite может не принять запрошенные)"""
+    settings = {}
+    for pragma in (
+        "journal_mode",
+        "synchronous",
+        "cache_size",
+        "mmap_size",
+        "temp_store",
+        "busy_timeout",
+        "foreign_keys",
+        "query_only",
+    ):
+        row = conn.execute(f"PRAGMA {pragma}").fetchone()
+        settings[pragma] = row[0] if row is not None else None
+    return settings
+
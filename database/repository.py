@@ -0,0 +1,179 @@
+from bisect import insort
+from collections import OrderedDict
+
+from core.models import Employee
+
+
+def _sort_key(employee: Employee):
+    return employee.name, employee.id
+
+
+# ==================================================
+# EMPLOYEE REPOSITORY (IDENTITY MAP)
+# ==================================================
+class EmployeeRepository:
+    """
+    Кэш сотрудников поверх таблицы employees.
+
+    Каждый сотрудник загружается из БД не более одного раза и дальше
+    отдаётся из памяти (один объект Employee на id). Database сообщает
+    об изменениях через added / changed / removed — сбрасываются только
+    затронутые записи, а не весь кэш.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.clear()
+
+    def clear(self):
+        self._by_id: dict[int, Employee] = {}
+        self._count: int | None = None
+        self._sorted: list[Employee] | None = None   # все сотрудники по имени
+
+    # ---------- READ ----------
+    def get(self, emp_id: int) -> Employee | None:
+        employee = self._by_id.get(emp_id)
+        # Полный список загружен — отсутствие в кэше означает отсутствие в БД
+        if employee is None and self._sorted is None:
+            employee = self._load(emp_id)
+        return employee
+
+    def _load(self, emp_id: int) -> Employee | None:
+        row = self.conn.execute(
+            "SELECT * FROM employees WHERE id=?", (emp_id,)
+        ).fetchone()
+        return None if row is None else self._identity(row)
+
+    def count(self) -> int:
+        if self._count is None:
+            self._count = self.conn.execute(
+                "SELECT COUNT(*) FROM employees"
+            ).fetchone()[0]
+        return self._count
+
+    def all(self) -> list[Employee]:
+        """Все сотрудники по имени; после первой загрузки — без запросов"""
+        if self._sorted is None:
+            rows = self.conn.execute(
+                "SELECT * FROM employees ORDER BY name, id"
+            ).fetchall()
+            self._sorted = [self._identity(row) for row in rows]
+            self._count = len(self._sorted)
+        return list(self._sorted)
+
+    def page(self, after: tuple[str, int] | None = None, limit: int = 100) -> list[Employee]:
+        """
+        Страница по (name, id) после ключа after — keyset-пагинация:
+        стоимость не зависит от номера страницы (индекс idx_employees_name).
+        """
+        if after is None:
+            rows = self.conn.execute(
+                "SELECT * FROM employees ORDER BY name, id LIMIT ?",
+                (limit,),
+            ).fetchall()
+        else:
+            rows = self.conn.execute(
+                """
+                SELECT * FROM employees
+                WHERE (name, id) > (?, ?)
+                ORDER BY name, id
+                LIMIT ?
+                """,
+                (*after, limit),
+            ).fetchall()
+        return [self._identity(row) for row in rows]
+
+    def _identity(self, row) -> Employee:
+        employee = self._by_id.get(row["id"])
+        if employee is None:
+            employee = self._by_id[row["id"]] = Employee.from_row(row)
+        return employee
+
+    # ---------- INVALIDATION ----------
+    def _unlist(self, emp_id: int):
+        employee = self._by_id.pop(emp_id, None)
+        if self._sorted is not None and employee is not None:
+            self._sorted.remove(employee)
+
+    def _relist(self, emp_id: int):
+        if self._sorted is None:
+            return
+        employee = self._load(emp_id)
+        if employee is not None:
+            insort(self._sorted, employee, key=_sort_key)
+
+    def added(self, emp_id: int):
+        if self._count is not None:
+            self._count += 1
+        self._relist(emp_id)
+
+    def changed(self, emp_id: int):
+        self._unlist(emp_id)
+        self._relist(emp_id)
+
+    def removed(self, emp_id: int):
+        if self._count is not None:
+            self._count -= 1
+        self._unlist(emp_id)
+
+
+# ==================================================
+# HOURS CACHE (LRU)
+# ==================================================
+class HoursCache:
+    """
+    LRU-кэш табелей: (employee_id, start, end) → {ISO дата: часы}.
+    Запись часов сбрасывает только диапазоны, в которые попадает дата.
+    """
+
+    def __init__(self, conn, size: int):
+        self.conn = conn
+        self.size = size
+        self._entries: OrderedDict[tuple[int, str, str], dict] = OrderedDict()
+
+    def clear(self):
+        self._entries.clear()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, emp_id: int, start: str, end: str) -> dict[str, float]:
+        key = (emp_id, start, end)
+        hours = self._entries.get(key)
+        if hours is None:
+            self.prefetch((emp_id,), start, end)
+            hours = self._entries[key]
+        else:
+            self._entries.move_to_end(key)
+        return dict(hours)
+
+    def prefetch(self, emp_ids, start: str, end: str):
+        """Табели нескольких сотрудников за период одним запросом"""
+        missing = [e for e in emp_ids if (e, start, end) not in self._entries]
+        if not missing:
+            return
+
+        loaded = {emp_id: {} for emp_id in missing}
+        placeholders = ", ".join("?" * len(missing))
+        for emp_id, work_date, hours in self.conn.execute(
+            f"""
+            SELECT employee_id, work_date, hours
+            FROM work_hours
+            WHERE employee_id IN ({placeholders})
+              AND work_date BETWEEN ? AND ?
+            """,
+            (*missing, start, end),
+        ):
+            loaded[emp_id][work_date] = hours
+
+        for emp_id, hours in loaded.items():
+            self._entries[(emp_id, start, end)] = hours
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, emp_id: int, date: str | None = None):
+        """Сбросить табели сотрудника (только содержащие date, если указана)"""
+        for key in list(self._entries):
+            cached_emp, start, end = key
+            if cached_emp == emp_id and (date is None or start <= date <= end):
+                del self._entries[key]
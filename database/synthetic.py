@@ -0,0 +1,280 @@
+"""
+Синтетические данные для нагрузочных тестов: сотрудники и табели.
+
+Генерация детерминирована: одинаковые seed и параметры дают одинаковую БД.
+Реальные данные не нужны — можно собрать payroll.db любого размера.
+"""
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date
+from itertools import repeat
+from time import perf_counter
+import random
+
+from core.dates import date_range
+from database.db import Database
+from database.migrations import FTS_TABLES
+
+
+FIRST_NAMES = (
+    "Anna", "Boris", "Clara", "Dmitri", "Elena", "Felix", "Greta", "Hugo",
+    "Irina", "Jonas", "Katarzyna", "Lukas", "Marta", "Nikolai", "Olga", "Pavel",
+    "Sofia", "Tomasz", "Ursula", "Viktor", "Yana", "Zoran",
+)
+LAST_NAMES = (
+    "Schmidt", "Ivanova", "Müller", "Petrov", "Weber", "Novak", "Fischer",
+    "Kowalski", "Wagner", "Horvat", "Becker", "Popescu", "Schulz", "Nowak",
+    "Hoffmann", "Kovač", "Koch", "Smirnov", "Richter", "Lewandowski",
+)
+BANKS = (
+    ("Sparkasse", "SPKADE2H"),
+    ("Deutsche Bank", "DEUTDEFF"),
+    ("Commerzbank", "COBADEFF"),
+    ("Volksbank", "GENODEF1"),
+    ("ING", "INGDDEFF"),
+    ("N26", "NTSBDEB1"),
+)
+
+# Сколько строк work_hours передавать в executemany за раз
+CHUNK_ROWS = 50_000
+
+
+@dataclass(frozen=True)
+class SyntheticProfile:
+    """Доли и вероятности, из которых складываются табели"""
+    part_time_share: float = 0.2        # сотрудники на неполный день
+    unbanked_share: float = 0.1         # без банковского счёта
+    weekend_share: float = 0.05         # иногда работают в субботу
+    sick_rate: float = 0.01             # вероятность начала больничного в рабочий день
+    sick_days: tuple[int, int] = (1, 5)
+    vacation_days: int = 20             # отпуск в год, двумя блоками
+    overtime_rate: float = 0.1          # день с 10 ч вместо 8
+    rate_range: tuple[float, float] = (9.0, 25.0)
+
+
+@dataclass(frozen=True)
+class GenerationStats:
+    employees: int
+    hours_rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.hours_rows / self.seconds if self.seconds else 0.0
+
+
+# ==================================================
+# EMPLOYEES
+# ==================================================
+def _iban(rnd: random.Random) -> str:
+    """Немецкий IBAN с правильными контрольными цифрами (ISO 13616, mod 97)"""
+    bban = f"{rnd.randrange(10**7, 10**8)}{rnd.randrange(10**9, 10**10)}"
+    # "DE" → 13 14, контрольные цифры "00" в конце
+    check = 98 - int(f"{bban}131400") % 97
+    return f"DE{check:02d}{bban}"
+
+
+def make_employees(count: int, seed: int = 0, profile: SyntheticProfile = SyntheticProfile()):
+    """[(name, rate, bank, iban, bic, part_time), ...]"""
+    rnd = random.Random(seed)
+    low, high = profile.rate_range
+    employees = []
+    for i in range(1, count + 1):
+        name = f"{rnd.choice(FIRST_NAMES)} {rnd.choice(LAST_NAMES)} {i:05d}"
+        rate = round(rnd.uniform(low, high) * 4) / 4       # шаг 0.25 €
+        if rnd.random() < profile.unbanked_share:
+            bank = iban = bic = None
+        else:
+            bank, bic = rnd.choice(BANKS)
+            iban = _iban(rnd)
+        employees.append((name, rate, bank, iban, bic, rnd.random() < profile.part_time_share))
+    return employees
+
+
+# ==================================================
+# TIMESHEETS
+# ==================================================
+def calendar(start: date, end: date):
+    """
+    Дни периода для timesheet(): (ISO дата, день недели 0–6, ordinal).
+    ISO-строки строятся один раз на прогон, а не на каждого сотрудника.
+    """
+    return [(info.iso, info.date.weekday(), info.date.toordinal()) for info in date_range(start, end)]
+
+
+def timesheet(days, rnd: random.Random, part_time: bool, profile: SyntheticProfile = SyntheticProfile()):
+    """
+    Табель по дням из calendar(): параллельные списки (ISO даты, часы).
+    Дни без работы не попадают: выходные, больничные и отпуск — без строк,
+    как в реальном табеле.
+    """
+    weekend_worker = rnd.random() < profile.weekend_share
+    workdays = {0, 1, 2, 3, 4} if not part_time else set(rnd.sample(range(5), rnd.randint(3, 5)))
+    base = 8.0 if not part_time else rnd.choice((4.0, 5.0, 6.0))
+    short = base - 1.5          # ушёл раньше
+    overtime = profile.overtime_rate if not part_time else 0.0
+    sick_rate = profile.sick_rate
+    random_ = rnd.random
+
+    # Отпуск: два блока в каждом году периода (+ выходные внутри блока)
+    vacation = set()
+    first_day, last_day = days[0][2], days[-1][2]
+    for year in range(date.fromordinal(first_day).year, date.fromordinal(last_day).year + 1):
+        for length in (profile.vacation_days // 2, profile.vacation_days - profile.vacation_days // 2):
+            first = date(year, 1, 1).toordinal() + rnd.randrange(0, 365 - length)
+            vacation.update(range(first, first + length + length // 2))
+
+    dates = []
+    hours = []
+    add_date = dates.append
+    add_hours = hours.append
+    sick_left = 0
+    for iso, weekday, ordinal in days:
+        if weekday >= 5:
+            if weekend_worker and weekday == 5 and random_() < 0.3:
+                add_date(iso)
+                add_hours(5.0)
+            continue
+        if weekday not in workdays or ordinal in vacation:
+            continue
+        if sick_left:
+            sick_left -= 1
+            continue
+        if random_() < sick_rate:
+            sick_left = rnd.randint(*profile.sick_days) - 1
+            continue
+
+        roll = random_()
+        add_date(iso)
+        if roll < overtime:
+            add_hours(10.0)
+        elif roll > 0.97:
+            add_hours(short)
+        else:
+            add_hours(base)
+    return dates, hours
+
+
+# ==================================================
+# GENERATOR
+# ==================================================
+def populate(
+    db: Database,
+    employees: int,
+    start: date,
+    end: date,
+    *,
+    seed: int = 0,
+    profile: SyntheticProfile = SyntheticProfile(),
+    progress=None,
+) -> GenerationStats:
+    """
+    Добавляет сотрудников и их часы за период одной транзакцией.
+    Строки пишутся через executemany пакетами по CHUNK_ROWS.
+    progress(done, total) — после каждого сотрудника.
+    """
+    started = perf_counter()
+    rnd = random.Random(f"hours:{seed}")     # поток, независимый от make_employees
+    days = calendar(start, end)
+    if not days:
+        raise ValueError(f"Empty period: {start} > {end}")
+    people = make_employees(employees, seed, profile)
+
+    # id сотрудников берутся из той же транзакции — проверка внешних ключей
+    # на каждую строку work_hours не нужна (≈ −25% времени вставки)
+    foreign_keys = db.conn.execute("PRAGMA foreign_keys").fetchone()[0]
+    db.conn.execute("PRAGMA foreign_keys=OFF")
+
+    rows = []
+    written = 0
+    try:
+        with db.transaction(), _deferred_indexes(db):
+            for i, (name, rate, bank, iban, bic, part_time) in enumerate(people, start=1):
+                emp_id = db.conn.execute(
+                    """
+                    INSERT INTO employees (name, rate, bank, iban, bic, has_bank_account)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (name, rate, bank, iban, bic, int(bool(iban))),
+                ).lastrowid
+
+                dates, hours = timesheet(days, rnd, part_time, profile)
+                rows.extend(zip(repeat(emp_id), dates, hours))
+                if len(rows) >= CHUNK_ROWS:
+                    written += _insert_hours(db, rows)
+                    rows = []
+                if progress:
+                    progress(i, employees)
+
+            written += _insert_hours(db, rows)
+    finally:
+        db.conn.execute(f"PRAGMA foreign_keys={'ON' if foreign_keys else 'OFF'}")
+
+    # Записи шли мимо методов Database — сбрасываем кэши целиком
+    db.employees.clear()
+    db.hours_cache.clear()
+    return GenerationStats(employees, written, perf_counter() - started)
+
+
+@contextmanager
+def _deferred_indexes(db: Database):
+    """
+    На время загрузки (внутри транзакции populate):
+    - триггеры FTS сотрудников снимаются, новые строки индексируются
+      одним INSERT ... SELECT в конце;
+    - индекс work_hours по дате в пустой таблице строится после вставки
+      сортировкой, а не по строке (в непустой — остаётся, перестройка дороже).
+    При ошибке DDL откатывается вместе с данными.
+    """
+    conn = db.conn
+    fts = "employees_fts"
+    triggers = conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type='trigger' AND name LIKE ?",
+        (f"{fts}_%",),
+    ).fetchall() if db.has_fts else []
+    indexes = []
+    if conn.execute("SELECT 1 FROM work_hours LIMIT 1").fetchone() is None:
+        indexes = conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type='index' AND tbl_name='work_hours' AND name='idx_work_hours_date'"
+        ).fetchall()
+    last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM employees").fetchone()[0]
+
+    for name, _ in triggers:
+        conn.execute(f"DROP TRIGGER {name}")
+    for name, _ in indexes:
+        conn.execute(f"DROP INDEX {name}")
+
+    yield
+
+    for _, sql in indexes + triggers:
+        conn.execute(sql)
+    if triggers:
+        columns = ", ".join(FTS_TABLES[fts][1])
+        conn.execute(
+            f"INSERT INTO {fts}(rowid, {columns}) SELECT id, {columns} FROM employees WHERE id > ?",
+            (last_id,),
+        )
+
+
+def _insert_hours(db: Database, rows) -> int:
+    db.conn.executemany(
+        "INSERT INTO work_hours (employee_id, work_date, hours) VALUES (?, ?, ?)",
+        rows,
+    )
+    return len(rows)
+
+
+def create_database(
+    path=":memory:",
+    employees: int = 100,
+    start: date = date(2026, 1, 1),
+    end: date = date(2026, 12, 31),
+    *,
+    seed: int = 0,
+    profile: SyntheticProfile = SyntheticProfile(),
+    progress=None,
+) -> tuple[Database, GenerationStats]:
+    """Новая БД (файл или ":memory:") с синтетическими данными, профиль bulk_import"""
+    db = Database(path, profile="bulk_import")
+    stats = populate(db, employees, start, end, seed=seed, profile=profile, progress=progress)
+    return db, stats
@@ -0,0 +1,107 @@
+from bisect import bisect_left, insort
+import re
+
+from core.models import Employee
+
+
+# Разделители токенов: пробелы и пунктуация ("Müller-Lüdenscheidt", "DE89 3704")
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str | None) -> list[str]:
+    if not text:
+        return []
+    return _TOKEN_RE.findall(text.casefold())
+
+
+def _employee_tokens(employee: Employee) -> set[str]:
+    tokens = set(tokenize(employee.name))
+    tokens.update(tokenize(employee.bank_name))
+    tokens.update(tokenize(employee.bic))
+    if employee.iban:
+        tokens.update(tokenize(employee.iban))
+        # IBAN целиком без пробелов: "de8937…" находит и "DE89 37…"
+        tokens.add("".join(tokenize(employee.iban)))
+    return tokens
+
+
+# ==================================================
+# SEARCH INDEX
+# ==================================================
+class EmployeeSearchIndex:
+    """
+    Индекс сотрудников в памяти для поиска по мере ввода.
+
+    Отсортированный список (токен, id): поиск по префиксу — bisect,
+    без обхода всех сотрудников. Запрос из нескольких слов — все слова
+    должны совпасть (по префиксу) с токенами имени, банка, IBAN или BIC.
+    """
+
+    def __init__(self, employees=()):
+        self._employees: dict[int, Employee] = {}
+        self._tokens: list[tuple[str, int]] = []
+        self.rebuild(employees)
+
+    def rebuild(self, employees):
+        self._employees = {e.id: e for e in employees}
+        self._tokens = sorted(
+            (token, e.id)
+            for e in self._employees.values()
+            for token in _employee_tokens(e)
+        )
+
+    def __len__(self):
+        return len(self._employees)
+
+    def __iter__(self):
+        return iter(self._employees.values())
+
+    def __contains__(self, emp_id):
+        return emp_id in self._employees
+
+    def get(self, emp_id: int) -> Employee | None:
+        return self._employees.get(emp_id)
+
+    # ---------- UPDATES ----------
+    def add(self, employee: Employee):
+        if employee.id in self._employees:
+            self.remove(employee.id)
+        self._employees[employee.id] = employee
+        for token in _employee_tokens(employee):
+            insort(self._tokens, (token, employee.id))
+
+    def update(self, employee: Employee):
+        self.add(employee)
+
+    def remove(self, emp_id: int):
+        employee = self._employees.pop(emp_id, None)
+        if employee is None:
+            return
+        for token in _employee_tokens(employee):
+            i = bisect_left(self._tokens, (token, emp_id))
+            if i < len(self._tokens) and self._tokens[i] == (token, emp_id):
+                del self._tokens[i]
+
+    # ---------- QUERY ----------
+    def _prefix_ids(self, prefix: str) -> set[int]:
+        ids = set()
+        i = bisect_left(self._tokens, (prefix,))
+        while i < len(self._tokens) and self._tokens[i][0].startswith(prefix):
+            ids.add(self._tokens[i][1])
+            i += 1
+        return ids
+
+    def search(self, query: str) -> list[Employee]:
+        """Сотрудники, подходящие под запрос, по имени (как get_employees)"""
+        ids = None
+        for prefix in tokenize(query):
+            matched = self._prefix_ids(prefix)
+            ids = matched if ids is None else ids & matched
+            if not ids:
+                return []
+
+        employees = (
+            self._employees.values() if ids is None
+            else (self._employees[i] for i in ids)
+        )
+        return sorted(employees, key=lambda e: (e.name, e.id))
@@ -0,0 +1,204 @@
+from pathlib import Path
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+
+from config import FIXED_RATE
+from core.dates import date_info
+from core.instrumentation import timed
+from core.models import Employee
+from services.payroll_service import PayrollVector, summarize
+
+
+REGISTER_COLUMNS = (
+    ("Employee ID", 12),
+    ("Employee", 28),
+    ("Period from", 12),
+    ("Period to", 12),
+    ("Rate mode", 10),
+    ("Hourly rate", 12),
+    ("Hours", 10),
+    ("Gross", 12),
+    ("Rental deduction", 16),
+    ("Utilities deduction", 18),
+    ("Net", 12),
+    ("Bank", 20),
+    ("IBAN", 30),
+    ("BIC", 14),
+)
+
+DAY_COLUMNS = (
+    ("Employee ID", 12),
+    ("Employee", 28),
+    ("Date", 12),
+    ("Day", 12),
+    ("Hours", 10),
+    ("Hourly rate", 12),
+    ("Amount", 12),
+)
+
+MONEY_FORMAT = "#,##0.00"
+HOURS_FORMAT = "0.0"
+
+
+# ==================================================
+# SHEET HELPERS
+# ==================================================
+def _add_sheet(wb, title, columns):
+    ws = wb.create_sheet(title)
+    for i, (_, width) in enumerate(columns, start=1):
+        ws.column_dimensions[get_column_letter(i)].width = width
+    ws.freeze_panes = "A2"
+
+    bold = Font(bold=True)
+    header = []
+    for name, _ in columns:
+        cell = WriteOnlyCell(ws, value=name)
+        cell.font = bold
+        header.append(cell)
+    ws.append(header)
+    return ws
+
+
+def _formatted(ws, values, formats):
+    """Строка с форматами чисел: formats — {индекс колонки: number_format}"""
+    row = []
+    for i, value in enumerate(values):
+        fmt = formats.get(i)
+        if fmt is None:
+            row.append(value)
+            continue
+        cell = WriteOnlyCell(ws, value=value)
+        cell.number_format = fmt
+        row.append(cell)
+    return row
+
+
+REGISTER_FORMATS = {
+    5: MONEY_FORMAT, 6: HOURS_FORMAT, 7: MONEY_FORMAT,
+    8: MONEY_FORMAT, 9: MONEY_FORMAT, 10: MONEY_FORMAT,
+}
+DAY_FORMATS = {4: HOURS_FORMAT, 5: MONEY_FORMAT, 6: MONEY_FORMAT}
+
+
+# ==================================================
+# PAYROLL REGISTER
+# ==================================================
+def _hours_by_employee(cursor):
+    """
+    (employee_id, work_date, hours), отсортированные по employee_id →
+    (employee_id, dates, hours) по одному сотруднику за раз
+    """
+    current, dates, hours = None, [], []
+    for emp_id, work_date, value in cursor:
+        if emp_id != current:
+            if current is not None:
+                yield current, dates, hours
+            current, dates, hours = emp_id, [], []
+        dates.append(work_date)
+        hours.append(value)
+    if current is not None:
+        yield current, dates, hours
+
+
+@timed("export.register", rows=lambda count: count)
+def export_payroll_register(
+    db,
+    path,
+    start: str,
+    end: str,
+    *,
+    rate_mode: str = "fixed",
+    housing: float = 0.0,
+    utilities: float = 0.0,
+    deductions: dict | None = None,
+    include_days: bool = False,
+    progress=None,
+) -> int:
+    """
+    Реестр зарплаты за период (start/end — ISO) в XLSX.
+
+    Лист "Register" — строка на сотрудника, лист "Days" (include_days) —
+    строка на рабочий день. Расчёт как в calculate_payroll_run.
+    Книга пишется в режиме write_only за один проход по курсорам БД:
+    в памяти только часы текущего сотрудника.
+    progress(done) — после каждого сотрудника.
+    Возвращает количество сотрудников в реестре.
+    """
+    fixed = rate_mode == "fixed"
+    deductions = deductions or {}
+    period_from = date_info(start).date_dmy
+    period_to = date_info(end).date_dmy
+
+    wb = Workbook(write_only=True)
+    register = _add_sheet(wb, "Register", REGISTER_COLUMNS)
+    days = _add_sheet(wb, "Days", DAY_COLUMNS) if include_days else None
+
+    # Оба курсора отсортированы по employee_id — слияние без словарей
+    hours = _hours_by_employee(db.load_hours_for_period(start, end))
+    pending = next(hours, None)
+
+    count = 0
+    for row in db.iter_employees():
+        employee = Employee.from_row(row)
+        rate = FIXED_RATE if fixed else employee.rate
+
+        while pending is not None and pending[0] < employee.id:
+            pending = next(hours, None)   # часы без сотрудника
+        if pending is not None and pending[0] == employee.id:
+            _, dates, values = pending
+            pending = next(hours, None)
+        else:
+            dates, values = [], []
+
+        vector = PayrollVector(dates, values, rate)
+        emp_housing, emp_utilities = deductions.get(employee.id, (housing, utilities))
+        _, summary = summarize(
+            vector,
+            housing=emp_housing,
+            utilities=emp_utilities,
+            apply_deductions=fixed,
+            with_rows=False,
+        )
+
+        register.append(_formatted(register, (
+            employee.id,
+            employee.name,
+            period_from,
+            period_to,
+            rate_mode,
+            rate,
+            summary.total_hours,
+            summary.gross_amount,
+            summary.housing_deduction,
+            summary.utilities_deduction,
+            summary.net_amount,
+            employee.bank_name,
+            employee.iban,
+            employee.bic,
+        ), REGISTER_FORMATS))
+
+        if days is not None:
+            for work_date, h, cents in zip(
+                dates, vector.hours.tolist(), vector.amounts_cents.tolist()
+            ):
+                info = date_info(work_date)
+                days.append(_formatted(days, (
+                    employee.id,
+                    employee.name,
+                    info.date_dmy,
+                    info.weekday,
+                    h,
+                    rate,
+                    cents / 100,
+                ), DAY_FORMATS))
+
+        count += 1
+        if progress:
+            progress(count)
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    wb.save(str(path))
+    return count
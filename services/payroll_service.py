@@ -1,52 +1,188 @@
-from datetime import datetime
-from typing import Dict
+from typing import Dict, Sequence
 from config import FIXED_RATE
 
+import numpy as np
 
-from core.models import Employee, PayrollRow, PayrollSummary
+from core.dates import date_info
+from core.instrumentation import timed
+from core.models import Employee, EmployeePayroll, PayrollRow, PayrollSummary
 
 
 # ==================================================
-# HELPERS
+# VECTORIZED CALCULATION
 # ==================================================
-def _weekday_name(date_str: str) -> str:
-    return datetime.strptime(date_str, "%Y-%m-%d").strftime("%A")
+class PayrollVector:
+    """
+    Часы периода в виде массивов numpy.
 
+    Суммы считаются в целых центах (округление каждого дня как round(h * rate, 2)),
+    итоги — одной редукцией. PayrollRow создаются только по запросу rows().
+    """
 
-def _date_ui(date_str: str) -> str:
-    return datetime.strptime(date_str, "%Y-%m-%d").strftime("%d.%m.%Y")
+    def __init__(self, dates: Sequence[str], hours, rate: float):
+        self.dates = np.asarray(dates, dtype=str)
+        self.hours = np.asarray(hours, dtype=np.float64)
+        self.rate = rate
+        self.amounts_cents = np.rint(self.hours * (rate * 100)).astype(np.int64)
+
+    @classmethod
+    def from_hours_map(cls, hours_map: Dict[str, float], rate: float):
+        dates = sorted(hours_map)
+        hours = np.fromiter(
+            (hours_map[d] for d in dates), dtype=np.float64, count=len(dates)
+        )
+        return cls(dates, hours, rate)
+
+    def __len__(self):
+        return len(self.hours)
+
+    @property
+    def total_hours(self) -> float:
+        return float(self.hours.sum())
+
+    @property
+    def gross_cents(self) -> int:
+        return int(self.amounts_cents.sum())
+
+    @property
+    def gross_amount(self) -> float:
+        return self.gross_cents / 100
+
+    def rows(self) -> list[PayrollRow]:
+        rows = []
+        for date, hours, cents in zip(
+            self.dates.tolist(), self.hours.tolist(), self.amounts_cents.tolist()
+        ):
+            info = date_info(date)
+            rows.append(
+                PayrollRow(
+                    date=date,
+                    date_ui=info.date_ui,
+                    weekday=info.weekday,
+                    hours=hours,
+                    rate=self.rate,
+                    amount=cents / 100,
+                )
+            )
+        return rows
+
+
+def summarize(
+    vector: PayrollVector,
+    *,
+    housing: float = 0.0,
+    utilities: float = 0.0,
+    apply_deductions: bool,
+    with_rows: bool = True,
+):
+    """
+    (rows, PayrollSummary) по вектору часов одного сотрудника.
+    apply_deductions=False — удержания не вычитаются (Custom Rate).
+    """
+    gross = vector.gross_amount
+
+    if apply_deductions:
+        housing = round(housing, 2)
+        utilities = round(utilities, 2)
+    else:
+        housing = utilities = 0.0
+
+    summary = PayrollSummary(
+        total_hours=vector.total_hours,
+        gross_amount=gross,
+        housing_deduction=housing,
+        utilities_deduction=utilities,
+        net_amount=round(gross - housing - utilities, 2),
+    )
+
+    rows = vector.rows() if with_rows else []
+    return rows, summary
+
+
+# ==================================================
+# RUNNING TOTALS (INCREMENTAL)
+# ==================================================
+def _amount_cents(hours: float, rate: float) -> int:
+    # Та же формула, что в PayrollVector: np.rint и round — оба к чётному
+    return int(round(hours * (rate * 100)))
+
+
+class RunningTotals:
+    """
+    Итоги периода, которые обновляются на разницу при правке одного дня.
+
+    Часы хранятся в сотых, суммы — в центах (как PayrollVector), поэтому
+    после любой серии правок итоги совпадают с полным пересчётом.
+    Полный проход по дням нужен только при смене ставки.
+    """
+
+    def __init__(self, hours_map: Dict[str, float], rate: float):
+        self.hours_map = dict(hours_map)
+        self.rate = rate
+        self.housing = 0.0
+        self.utilities = 0.0
+        self.apply_deductions = True
+        self._recount()
+
+    def _recount(self):
+        self._hours_centi = sum(round(h * 100) for h in self.hours_map.values())
+        self._gross_cents = sum(
+            _amount_cents(h, self.rate) for h in self.hours_map.values()
+        )
+
+    def set_hours(self, date: str, hours: float):
+        old = self.hours_map.get(date, 0.0)
+        self.hours_map[date] = hours
+        self._hours_centi += round(hours * 100) - round(old * 100)
+        self._gross_cents += _amount_cents(hours, self.rate) - _amount_cents(old, self.rate)
+
+    def set_rate(self, rate: float):
+        if rate != self.rate:
+            self.rate = rate
+            self._recount()
+
+    def set_deductions(self, housing: float, utilities: float, apply: bool):
+        self.housing = housing
+        self.utilities = utilities
+        self.apply_deductions = apply
+
+    @property
+    def total_hours(self) -> float:
+        return self._hours_centi / 100
+
+    def summary(self) -> PayrollSummary:
+        gross = self._gross_cents / 100
+
+        if self.apply_deductions:
+            housing = round(self.housing, 2)
+            utilities = round(self.utilities, 2)
+        else:
+            housing = utilities = 0.0
+
+        return PayrollSummary(
+            total_hours=self.total_hours,
+            gross_amount=gross,
+            housing_deduction=housing,
+            utilities_deduction=utilities,
+            net_amount=round(gross - housing - utilities, 2),
+        )
 
 
 # ==================================================
 # ROW BUILDER
 # ==================================================
+@timed("payroll.rows")
 def build_payroll_rows(
     hours_map: Dict[str, float],
     rate: float,
 ):
-    rows: list[PayrollRow] = []
-
-    for date in sorted(hours_map.keys()):
-        hours = hours_map[date]
-        amount = round(hours * rate, 2)
-
-        rows.append(
-            PayrollRow(
-                date=date,
-                date_ui=_date_ui(date),
-                weekday=_weekday_name(date),
-                hours=hours,
-                rate=rate,
-                amount=amount,
-            )
-        )
-
-    return rows
+    return PayrollVector.from_hours_map(hours_map, rate).rows()
 
 
 # ==================================================
 # FIXED RATE (8 €/h) — ✅ DEDUCTIONS APPLY
 # ==================================================
+@timed("payroll.fixed", rows=lambda result: len(result[0]))
 def calculate_fixed_payroll(
     employee: Employee,
     hours_map: Dict[str, float],
@@ -55,31 +191,22 @@ def calculate_fixed_payroll(
     *,
     housing: float = 0.0,
     utilities: float = 0.0,
+    with_rows: bool = True,
 ):
-    rate = FIXED_RATE
-    rows = build_payroll_rows(hours_map, rate)
-
-    total_hours = sum(r.hours for r in rows)
-    gross = round(sum(r.amount for r in rows), 2)
-
-    housing = round(housing, 2)
-    utilities = round(utilities, 2)
-    net = round(gross - housing - utilities, 2)
-
-    summary = PayrollSummary(
-        total_hours=total_hours,
-        gross_amount=gross,
-        housing_deduction=housing,
-        utilities_deduction=utilities,
-        net_amount=net,
+    vector = PayrollVector.from_hours_map(hours_map, FIXED_RATE)
+    return summarize(
+        vector,
+        housing=housing,
+        utilities=utilities,
+        apply_deductions=True,
+        with_rows=with_rows,
     )
 
-    return rows, summary
-
 
 # ==================================================
 # CUSTOM RATE (EMPLOYEE) — ❌ NO DEDUCTIONS
 # ==================================================
+@timed("payroll.custom", rows=lambda result: len(result[0]))
 def calculate_custom_payroll(
     employee: Employee,
     hours_map: Dict[str, float],
@@ -88,19 +215,65 @@ def calculate_custom_payroll(
     *,
     housing: float = 0.0,
     utilities: float = 0.0,
+    with_rows: bool = True,
 ):
-    rate = employee.rate
-    rows = build_payroll_rows(hours_map, rate)
+    vector = PayrollVector.from_hours_map(hours_map, employee.rate)
+    return summarize(
+        vector,
+        housing=housing,
+        utilities=utilities,
+        apply_deductions=False,
+        with_rows=with_rows,
+    )
 
-    total_hours = sum(r.hours for r in rows)
-    gross = round(sum(r.amount for r in rows), 2)
 
-    summary = PayrollSummary(
-        total_hours=total_hours,
-        gross_amount=gross,
-        housing_deduction=0.0,
-        utilities_deduction=0.0,
-        net_amount=gross,
-    )
+# ==================================================
+# BATCH RUN — ALL EMPLOYEES FOR A PERIOD
+# ==================================================
+@timed("payroll.run")
+def calculate_payroll_run(
+    db,
+    start: str,
+    end: str,
+    *,
+    rate_mode: str = "fixed",
+    housing: float = 0.0,
+    utilities: float = 0.0,
+    deductions: Dict[int, tuple[float, float]] | None = None,
+    with_rows: bool = True,
+):
+    """
+    Расчёт зарплаты всех сотрудников за период (start/end — ISO даты).
 
-    return rows, summary
+    Часы загружаются одним запросом для всего периода.
+    deductions — необязательные удержания по сотрудникам:
+    {employee_id: (housing, utilities)}; иначе используются housing/utilities.
+    with_rows=False — только итоги, без PayrollRow (для реестров и экспорта).
+    """
+    # Запрос отсортирован по (employee_id, work_date) — массивы уже упорядочены
+    hours_by_employee: Dict[int, tuple[list, list]] = {}
+    for emp_id, work_date, hours in db.load_hours_for_period(start, end):
+        dates, values = hours_by_employee.setdefault(emp_id, ([], []))
+        dates.append(work_date)
+        values.append(hours)
+
+    fixed = rate_mode == "fixed"
+    deductions = deductions or {}
+
+    results: list[EmployeePayroll] = []
+    for employee in db.list_employees():
+        emp_housing, emp_utilities = deductions.get(employee.id, (housing, utilities))
+
+        dates, values = hours_by_employee.get(employee.id, ([], []))
+        vector = PayrollVector(dates, values, FIXED_RATE if fixed else employee.rate)
+
+        rows, summary = summarize(
+            vector,
+            housing=emp_housing,
+            utilities=emp_utilities,
+            apply_deductions=fixed,
+            with_rows=with_rows,
+        )
+        results.append(EmployeePayroll(employee=employee, rows=rows, summary=summary))
+
+    return results
@@ -1,15 +1,20 @@
-from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
 from reportlab.platypus import Table, TableStyle
 from reportlab.lib import colors
 from reportlab.pdfgen import canvas
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from dataclasses import dataclass, field
 from datetime import datetime
 import tempfile
 import os
 import sys
 import subprocess
 from pathlib import Path
-from config import FIXED_RATE
+from config import FIXED_RATE, PDF_WORKERS
+from core.dates import date_info
+from core.instrumentation import timed
+from services.report_templates import DEFAULT_SIZE, load_plan
 
 
 # ======================================================
@@ -37,6 +42,19 @@ def _generate_filename(employee_name: str, rate_mode: str, rate: float) -> str:
         return f"{employee_name}_Custom_{rate:.2f}€h.pdf"
 
 
+def _batch_filename(employee, rate_mode: str, rate: float, used: set) -> str:
+    """
+    Имя PDF в пакете: имена сотрудников не уникальны — при повторе
+    добавляется id, иначе файлы перезапишут друг друга.
+    """
+    filename = _generate_filename(employee.name, rate_mode, rate)
+    if filename in used:
+        stem, suffix = filename.rsplit(".", 1)
+        filename = f"{stem}_{employee.id}.{suffix}"
+    used.add(filename)
+    return filename
+
+
 # ======================================================
 # PUBLIC API — FROM PAYROLL TAB
 # ======================================================
@@ -78,13 +96,7 @@ def generate_payroll_pdf(
         gross += amount
         total_hours += h
 
-        parsed_rows.append((
-            date,
-            day,
-            f"{h:.1f}",
-            f"{rate:.2f} €",
-            f"{amount:.2f} €"
-        ))
+        parsed_rows.append((date, day, h, rate, amount))
 
     # Определяем путь сохранения
     if action == "save":
@@ -112,6 +124,7 @@ def generate_payroll_pdf(
         total_hours=total_hours,
         utilities=float(utilities) if utilities else None,
         rental=float(rental) if rental else None,
+        template=rate_mode,
     )
 
     # Выполняем действие
@@ -134,114 +147,354 @@ def preview_payroll_pdf(*args, **kwargs):
 # PUBLIC API — FROM HISTORY
 # ======================================================
 
-def preview_payroll_pdf_from_history(payroll, days):
-    rate = payroll["rate"]
-
-    parsed_rows = []
-    gross = 0.0
-    total_hours = 0.0
-
-    for d in days:
-        h = d["hours"]
-        amount = h * rate
-        gross += amount
-        total_hours += h
-
-        day_name = datetime.strptime(d["work_date"], "%d-%m-%Y").strftime("%A")
+def statement_rows(days, rate: float):
+    """
+    Генератор строк таблицы из (work_date ISO, hours) — например, курсора БД.
+    Строки не накапливаются: PDF рисуется постранично.
+    """
+    for work_date, hours in days:
+        info = date_info(work_date)
+        h = float(hours or 0.0)
+        yield (info.date_dmy, info.weekday, h, rate, h * rate)
 
-        parsed_rows.append((
-            d["work_date"],
-            day_name,
-            f"{h:.1f}",
-            f"{rate:.2f} €",
-            f"{amount:.2f} €"
-        ))
 
+def preview_payroll_pdf_from_history(payroll, days):
     # Для истории всегда используем временный файл для просмотра
     pdf_path = Path(tempfile.gettempdir()) / f"Payroll_{payroll['name']}.pdf"
     
     _render_pdf_to_file(
         path=str(pdf_path),
         employee_name=payroll["name"],
-        period_from=payroll["period_from"],
-        period_to=payroll["period_to"],
-        created_at=payroll["created_at"],
+        period_from=date_info(payroll["period_from"]).date_dmy,
+        period_to=date_info(payroll["period_to"]).date_dmy,
+        created_at=date_info(payroll["created_at"][:10]).date_dmy,
         bank=payroll["bank"],
         iban=payroll["iban"],
         bic=payroll["bic"],
-        rows=parsed_rows,
-        gross=gross,
-        total_hours=total_hours,
+        rows=statement_rows(days, payroll["rate"]),
         utilities=payroll["utilities"],
         rental=payroll["rental"],
+        template=payroll["rate_mode"],
     )
     
     _open_file(str(pdf_path))
 
 
+@timed("pdf.statement", rows=None)
+def render_statement_from_db(
+    db,
+    employee,
+    start: str,
+    end: str,
+    *,
+    rate_mode: str,
+    path: str,
+    utilities: float | None = None,
+    rental: float | None = None,
+) -> str:
+    """
+    Ведомость за произвольно длинный период (год и больше) прямо из БД:
+    часы читаются курсором, итоги считаются по ходу рендера.
+    start / end — ISO. Custom rate — без удержаний.
+    """
+    rate = FIXED_RATE if rate_mode == "fixed" else float(employee.rate)
+    if rate_mode != "fixed":
+        utilities = rental = None
+
+    _render_pdf_to_file(
+        path=path,
+        employee_name=employee.name,
+        period_from=date_info(start).date_dmy,
+        period_to=date_info(end).date_dmy,
+        created_at=datetime.now().strftime("%d-%m-%Y"),
+        bank=employee.bank_name,
+        iban=employee.iban,
+        bic=employee.bic,
+        rows=statement_rows(db.iter_hours(employee.id, start, end), rate),
+        utilities=utilities,
+        rental=rental,
+        template=rate_mode,
+    )
+    return path
+
+
 # ======================================================
-# CORE PDF RENDER (FINAL)
+# PUBLIC API — BATCH (PROCESS POOL)
 # ======================================================
 
-def _render_pdf_to_file(
-    path,
-    employee_name,
-    period_from,
-    period_to,
-    created_at,
-    bank,
-    iban,
-    bic,
-    rows,
-    gross,
-    total_hours,
-    utilities,
-    rental
-):
-    c = canvas.Canvas(path, pagesize=A4)
-    width, height = A4
-    y = height - 20 * mm
-
-    # ---------- HEADER ----------
-    c.setFont("Helvetica-Bold", 15)
-    c.drawCentredString(width / 2, y, "Blue Reef Development LTD")
-    y -= 10 * mm
-
-    c.setFont("Helvetica-Bold", 13)
-    c.drawCentredString(width / 2, y, "PAYROLL STATEMENT")
-    y -= 14 * mm
-
-    c.setFont("Helvetica", 10)
-    c.drawString(20 * mm, y, f"Employee: {employee_name}")
-    y -= 6 * mm
-    c.drawString(20 * mm, y, f"Period: {period_from} – {period_to}")
-    y -= 6 * mm
-    c.drawString(20 * mm, y, f"Generated on: {created_at}")
-    y -= 8 * mm
+@dataclass
+class BatchPdfResult:
+    paths: list = field(default_factory=list)     # путь или None, по порядку входа
+    errors: dict = field(default_factory=dict)    # индекс → текст ошибки
+    cancelled: bool = False
+
 
-    # ---------- BANK ----------
-    if bank or iban or bic:
-        c.setFont("Helvetica-Bold", 10)
-        c.drawString(20 * mm, y, "Bank details:")
-        y -= 6 * mm
-        c.setFont("Helvetica", 10)
-        if bank:
-            c.drawString(20 * mm, y, f"Bank: {bank}")
-            y -= 6 * mm
-        if iban:
-            c.drawString(20 * mm, y, f"IBAN: {iban}")
-            y -= 6 * mm
-        if bic:
-            c.drawString(20 * mm, y, f"BIC: {bic}")
-            y -= 6 * mm
-        y -= 6 * mm
-
-    # ---------- TABLE ----------
-    table_data = [["Date", "Day", "Hours", "Hourly rate", "Amount"]] + list(rows)
+def build_statement(
+    payroll,
+    *,
+    period_from: str,
+    period_to: str,
+    rate_mode: str,
+    output_dir: Path,
+    created_at: str | None = None,
+    filename: str | None = None,
+) -> dict:
+    """
+    Аргументы _render_pdf_to_file для одного EmployeePayroll из
+    calculate_payroll_run (period_* — DD-MM-YYYY, как в PDF).
+    filename — имя файла в output_dir (по умолчанию — по имени сотрудника).
+    """
+    employee, summary = payroll.employee, payroll.summary
+    rate = FIXED_RATE if rate_mode == "fixed" else employee.rate
+
+    parsed_rows = [
+        (date_info(r.date).date_dmy, r.weekday, r.hours, r.rate, r.amount)
+        for r in payroll.rows
+    ]
+
+    return {
+        "path": str(Path(output_dir) / (filename or _generate_filename(employee.name, rate_mode, rate))),
+        "employee_name": employee.name,
+        "period_from": period_from,
+        "period_to": period_to,
+        "created_at": created_at or datetime.now().strftime("%d-%m-%Y"),
+        "bank": employee.bank_name,
+        "iban": employee.iban,
+        "bic": employee.bic,
+        "rows": parsed_rows,
+        "gross": summary.gross_amount,
+        "total_hours": summary.total_hours,
+        "utilities": summary.utilities_deduction or None,
+        "rental": summary.housing_deduction or None,
+        "template": rate_mode,
+    }
+
+
+def _render_statement(statement: dict) -> str:
+    """Точка входа процесса-воркера"""
+    _render_pdf_to_file(**statement)
+    return statement["path"]
+
+
+# Как часто пакетный рендер проверяет отмену, пока документы в работе
+CANCEL_POLL_SECONDS = 0.1
+
+
+def render_statements(
+    statements: list[dict],
+    *,
+    workers: int | None = None,
+    progress=None,
+    cancel=None,
+) -> BatchPdfResult:
+    """
+    Рендер многих PDF параллельно в ProcessPoolExecutor.
+
+    statements — аргументы _render_pdf_to_file (см. build_statement).
+    progress(done, total) вызывается после каждого документа.
+    cancel — threading.Event: оставшиеся документы отменяются.
+    """
+    total = len(statements)
+    result = BatchPdfResult(paths=[None] * total)
+    workers = workers or PDF_WORKERS or os.cpu_count() or 1
+
+    # Для одного документа пул процессов не окупается
+    if workers == 1 or total <= 1:
+        for i, statement in enumerate(statements):
+            if cancel is not None and cancel.is_set():
+                result.cancelled = True
+                break
+            try:
+                result.paths[i] = _render_statement(statement)
+            except Exception as e:
+                result.errors[i] = str(e)
+            if progress:
+                progress(i + 1, total)
+        return result
+
+    executor = ProcessPoolExecutor(max_workers=min(workers, total))
+    try:
+        futures = {
+            executor.submit(_render_statement, statement): i
+            for i, statement in enumerate(statements)
+        }
+
+        done = 0
+        pending = set(futures)
+        while pending:
+            # Отмена проверяется и пока ни один документ не готов
+            if cancel is not None and cancel.is_set():
+                result.cancelled = True
+                for future in pending:
+                    future.cancel()
+                break
+
+            finished, pending = wait(pending, timeout=CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+            for future in finished:
+                i = futures[future]
+                try:
+                    result.paths[i] = future.result()
+                except Exception as e:
+                    result.errors[i] = str(e)
+
+                done += 1
+                if progress:
+                    progress(done, total)
+    finally:
+        # Уже запущенные документы дорисовываются, очередь отменяется
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    return result
+
+
+def generate_payroll_pdfs(
+    payrolls,
+    period_from: str,
+    period_to: str,
+    rate_mode: str,
+    *,
+    workers: int | None = None,
+    output_dir: Path | None = None,
+    progress=None,
+    cancel=None,
+) -> BatchPdfResult:
+    """
+    Сохраняет PDF всех сотрудников периода в папку по периоду
+    (или в output_dir, если указана).
+    """
+    if output_dir is None:
+        payroll_dir = _get_payroll_directory(period_from)
+    else:
+        payroll_dir = Path(output_dir)
+        payroll_dir.mkdir(parents=True, exist_ok=True)
+    created_at = datetime.now().strftime("%d-%m-%Y")
+
+    used = set()
+    statements = [
+        build_statement(
+            payroll,
+            period_from=period_from,
+            period_to=period_to,
+            rate_mode=rate_mode,
+            output_dir=payroll_dir,
+            created_at=created_at,
+            filename=_batch_filename(
+                payroll.employee,
+                rate_mode,
+                FIXED_RATE if rate_mode == "fixed" else payroll.employee.rate,
+                used,
+            ),
+        )
+        for payroll in payrolls
+    ]
+
+    return render_statements(
+        statements, workers=workers, progress=progress, cancel=cancel
+    )
+
+
+# ======================================================
+# PUBLIC API — COMBINED (ONE PDF PER RUN)
+# ======================================================
+
+def _generate_combined_filename(period_from: str, period_to: str, rate_mode: str) -> str:
+    mode = "Fixed" if rate_mode == "fixed" else "Custom"
+    return f"All_employees_{mode}_{period_from}_{period_to}.pdf"
+
+
+def generate_combined_payroll_pdf(
+    payrolls,
+    period_from: str,
+    period_to: str,
+    rate_mode: str,
+    *,
+    action: str = "save",  # "preview", "save", "print"
+    output_dir: Path | None = None,
+    progress=None,
+    cancel=None,
+) -> str | None:
+    """
+    Ведомости всех сотрудников периода одним PDF (закладка на сотрудника).
+    "print" — одно задание печати вместо файла на каждого.
+    output_dir — папка для "save" вместо папки по периоду.
+    Возвращает путь к PDF или None, если рендер отменён.
+    """
+    if not payrolls:
+        raise ValueError("No employees to include in the PDF")
+
+    filename = _generate_combined_filename(period_from, period_to, rate_mode)
+    if action == "save" and output_dir is not None:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        pdf_path = Path(output_dir) / filename
+    elif action == "save":
+        pdf_path = _get_payroll_directory(period_from) / filename
+    else:
+        pdf_path = Path(tempfile.gettempdir()) / filename
+
+    created_at = datetime.now().strftime("%d-%m-%Y")
+    statements = (
+        build_statement(
+            payroll,
+            period_from=period_from,
+            period_to=period_to,
+            rate_mode=rate_mode,
+            output_dir=pdf_path.parent,
+            created_at=created_at,
+        )
+        for payroll in payrolls
+    )
+
+    pdf_path_str = str(pdf_path)
+    completed = _render_combined_to_file(
+        pdf_path_str,
+        statements,
+        total=len(payrolls),
+        title=f"Payroll {period_from} – {period_to}",
+        progress=progress,
+        cancel=cancel,
+    )
+    if not completed:
+        return None
+
+    if action == "preview":
+        _open_file(pdf_path_str)
+    elif action == "print":
+        _print_file(pdf_path_str)
+
+    return pdf_path_str
+
+
+# ======================================================
+# CORE PDF RENDER (FINAL)
+# ======================================================
+
+def _draw_lines(c, plan, lines, context, y):
+    width = plan.page_size[0]
+    for line in lines:
+        if not line.visible(context):
+            continue
+        text = line.render(context)
+        if text:
+            c.setFont(line.font, line.size)
+            if line.align == "center":
+                c.drawCentredString(width / 2, y, text)
+            else:
+                c.drawString(plan.margin_left, y, text)
+        y -= line.space_after
+    return y
+
+
+def _draw_table(c, plan, rows, y, subtotal=None):
+    """Таблица часов; subtotal=(hours, amount) добавляет строку подытога"""
+    table_data = [[col.title for col in plan.columns]]
+    table_data += [plan.format_row(row) for row in rows]
+    if subtotal is not None:
+        table_data.append(plan.format_subtotal(*subtotal))
 
     table = Table(
         table_data,
-        colWidths=[30 * mm, 36 * mm, 20 * mm, 34 * mm, 26 * mm]
+        colWidths=plan.col_widths,
+        rowHeights=plan.row_height,
     )
 
     style = TableStyle([
@@ -249,18 +502,20 @@ def _render_pdf_to_file(
 
         # Header
         ("BACKGROUND", (0, 0), (-1, 0), colors.whitesmoke),
-        ("FONT", (0, 0), (-1, 0), "Helvetica-Bold", 9),
+        ("FONT", (0, 0), (-1, 0), plan.font_bold, plan.table_size),
 
         # Body
-        ("FONT", (0, 1), (-1, -1), "Helvetica", 9),
-        ("ALIGN", (2, 1), (-1, -1), "RIGHT"),
-        ("TOPPADDING", (0, 0), (-1, -1), 4),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+        ("FONT", (0, 1), (-1, -1), plan.font, plan.table_size),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
     ])
 
+    for i, col in enumerate(plan.columns):
+        if col.align != "left":
+            style.add("ALIGN", (i, 1), (i, -1), col.align.upper())
+
     # Highlight Sundays
     for idx, row in enumerate(rows, start=1):
-        if row[1].lower().startswith("sun"):
+        if plan.is_highlighted(row):
             style.add(
                 "BACKGROUND",
                 (0, idx),
@@ -268,46 +523,216 @@ def _render_pdf_to_file(
                 colors.lavenderblush
             )
 
+    if subtotal is not None:
+        style.add("BACKGROUND", (0, -1), (-1, -1), colors.whitesmoke)
+        style.add("FONT", (0, -1), (-1, -1), plan.font_bold, plan.table_size)
+
     table.setStyle(style)
+    width, height = plan.page_size
     table.wrapOn(c, width, height)
-    table.drawOn(c, 20 * mm, y - table._height)
-    y -= table._height + 12 * mm
+    table.drawOn(c, plan.margin_left, y - table._height)
+    return y - table._height - plan.table_space_after
 
-    # ---------- TOTALS ----------
-    net = gross - (utilities or 0) - (rental or 0)
 
-    c.setFont("Helvetica", 10)
-    c.drawString(20 * mm, y, f"Total hours: {total_hours:.1f} h")
-    y -= 6 * mm
-    c.drawString(20 * mm, y, f"Gross amount: {gross:.2f} €")
-    y -= 6 * mm
+def _draw_page_footer(c, plan, page):
+    if plan.page_footer:
+        c.setFont(plan.font, 8)
+        c.drawRightString(
+            plan.page_size[0] - plan.margin_left,
+            plan.margin_bottom / 2,
+            plan.page_footer.format(page=page),
+        )
 
-    if utilities:
-        c.drawString(20 * mm, y, f"Utilities deduction: -{utilities:.2f} €")
-        y -= 6 * mm
-    if rental:
-        c.drawString(20 * mm, y, f"Rental deduction: -{rental:.2f} €")
-        y -= 6 * mm
 
-    c.setFont("Helvetica-Bold", 11)
-    c.drawString(20 * mm, y, f"Net amount: {net:.2f} €")
-    y -= 14 * mm
+def _draw_signatures(c, plan, context, y):
+    c.setFont(plan.font, DEFAULT_SIZE)
 
-    # ---------- SIGNATURES ----------
-    c.setFont("Helvetica", 10)
-
-    c.drawString(20 * mm, y, "Employee signature:")
-    c.drawString(120 * mm, y, "Manager signature:")
+    for label, x in plan.signatures:
+        c.drawString(x, y, label)
     y -= 12 * mm
 
-    c.line(20 * mm, y, 90 * mm, y)
-    c.line(120 * mm, y, 190 * mm, y)
+    for _, x in plan.signatures:
+        c.line(x, y, x + plan.signature_line_width, y)
     y -= 8 * mm
 
-    c.drawString(20 * mm, y, f"Date: {created_at}")
-    c.drawString(120 * mm, y, f"Date: {created_at}")
+    date_text = plan.signature_date.format_map(context)
+    for _, x in plan.signatures:
+        c.drawString(x, y, date_text)
+    return y
+
+
+def _statement_context(
+    employee_name, period_from, period_to, created_at,
+    bank, iban, bic, gross, total_hours, utilities, rental,
+):
+    return {
+        "employee": employee_name,
+        "period_from": period_from,
+        "period_to": period_to,
+        "created_at": created_at,
+        "bank": bank,
+        "iban": iban,
+        "bic": bic,
+        "total_hours": total_hours,
+        "gross": gross,
+        "utilities": utilities,
+        "rental": rental,
+    }
+
+
+def _draw_statement(c, plan, context, rows):
+    """
+    Рисует ведомость начиная с текущей страницы canvas.
+
+    rows может быть генератором: строки забираются постранично, в памяти
+    только текущая страница. Если строки не помещаются на одну страницу,
+    таблица продолжается с повтором заголовка и подытогом на каждой странице.
+    Если total_hours / gross в context равны None — считаются по строкам.
+    """
+    top = plan.page_size[1] - plan.margin_top
+    bottom = plan.margin_bottom
+
+    # ---------- HEADER + BANK ----------
+    y = _draw_lines(c, plan, plan.header, context, top)
+
+    # ---------- TABLE (PAGINATED) ----------
+    rows = iter(rows)
+    pending = next(rows, None)
+    page = 1
+    multipage = False
+    total_hours = 0.0
+    gross = 0.0
+
+    if pending is None:
+        y = _draw_table(c, plan, [], y)
+
+    while pending is not None:
+        # Заголовок таблицы + строка подытога
+        capacity = max(int((y - bottom) // plan.row_height) - 2, 1)
+        chunk = [pending]
+        chunk.extend(islice(rows, capacity - 1))
+        pending = next(rows, None)
+        multipage = multipage or pending is not None
+
+        page_hours = sum(row[2] for row in chunk)
+        page_amount = sum(row[4] for row in chunk)
+        total_hours += page_hours
+        gross += page_amount
+
+        y = _draw_table(
+            c, plan, chunk, y,
+            subtotal=(page_hours, page_amount) if multipage else None,
+        )
+
+        if pending is not None:
+            _draw_page_footer(c, plan, page)
+            c.showPage()
+            page += 1
+            y = _draw_lines(c, plan, plan.continuation, context, top)
+
+    if context["total_hours"] is None:
+        context["total_hours"] = total_hours
+    if context["gross"] is None:
+        context["gross"] = gross
+    context["net"] = context["gross"] - (context["utilities"] or 0) - (context["rental"] or 0)
+
+    # Итоги и подписи не разрываем
+    if y - plan.closing_height < bottom:
+        _draw_page_footer(c, plan, page)
+        c.showPage()
+        page += 1
+        multipage = True
+        y = _draw_lines(c, plan, plan.continuation, context, top)
+
+    # ---------- TOTALS ----------
+    y = _draw_lines(c, plan, plan.summary, context, y)
+
+    # ---------- SIGNATURES ----------
+    _draw_signatures(c, plan, context, y)
+
+    if multipage:
+        _draw_page_footer(c, plan, page)
+
+
+def _draw_statement_document(
+    c,
+    employee_name,
+    period_from,
+    period_to,
+    created_at,
+    bank,
+    iban,
+    bic,
+    rows,
+    gross=None,
+    total_hours=None,
+    utilities=None,
+    rental=None,
+    template="fixed",
+):
+    """Одна ведомость на canvas c, начиная с текущей страницы"""
+    plan = load_plan(template)
+
+    # Custom rate — без удержаний (как в payroll_service): в шаблоне custom
+    # строк удержаний нет, и net не должен их вычитать
+    if template != "fixed":
+        utilities = rental = None
+    context = _statement_context(
+        employee_name, period_from, period_to, created_at,
+        bank, iban, bic, gross, total_hours, utilities, rental,
+    )
+
+    c.setPageSize(plan.page_size)
+    _draw_statement(c, plan, context, rows)
+
+
+@timed("pdf.render", rows=None)
+def _render_pdf_to_file(path, **statement):
+    """
+    rows — кортежи (date, weekday, hours, rate, amount), список или генератор;
+    оформление берётся из templates/report_<template>.json
+    """
+    c = canvas.Canvas(path, pageCompression=1)
+    _draw_statement_document(c, **statement)
+    c.save()
+
+
+@timed("pdf.combined", rows=None)
+def _render_combined_to_file(
+    path, statements, *, total=None, title=None, progress=None, cancel=None
+):
+    """
+    Все ведомости в одном PDF на общем canvas: шрифты и ресурсы страниц
+    пишутся в файл один раз, у каждого сотрудника — закладка в оглавлении.
+    statements может быть генератором (тогда total — их количество для progress).
+    Возвращает False, если рендер отменён (файл не создаётся).
+    """
+    c = canvas.Canvas(path, pageCompression=1)
+    if title:
+        c.setTitle(title)
+    c.showOutline()
+
+    if total is None:
+        total = len(statements)
+    for i, statement in enumerate(statements):
+        if cancel is not None and cancel.is_set():
+            return False
+
+        statement = dict(statement)
+        statement.pop("path", None)
+
+        key = f"statement-{i}"
+        c.bookmarkPage(key)
+        c.addOutlineEntry(statement["employee_name"], key, level=0)
+
+        _draw_statement_document(c, **statement)
+        c.showPage()
+
+        if progress:
+            progress(i + 1, total)
 
     c.save()
+    return True
 
 
 # ======================================================
@@ -0,0 +1,224 @@
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+import json
+import sys
+
+from reportlab.lib import pagesizes
+from reportlab.lib.units import mm
+from reportlab.pdfbase import pdfmetrics
+
+
+# В собранном EXE шаблоны лежат рядом с распакованными файлами (--add-data)
+TEMPLATES_DIR = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parents[1])) / "templates"
+
+# Порядок полей в строке таблицы, которую передаёт report_service
+ROW_FIELDS = ("date", "weekday", "hours", "rate", "amount")
+
+DEFAULT_SIZE = 10
+DEFAULT_SPACE_AFTER = 6  # mm
+
+
+class TemplateError(Exception):
+    pass
+
+
+# ==================================================
+# RENDER PLAN
+# ==================================================
+@dataclass(frozen=True)
+class TextLine:
+    fmt: str
+    font: str
+    size: float
+    align: str                  # left | center
+    space_after: float          # pt
+    when: tuple[str, ...]       # показывать, если любое из полей непустое
+
+    def visible(self, context: dict) -> bool:
+        return not self.when or any(context.get(key) for key in self.when)
+
+    def render(self, context: dict) -> str:
+        return self.fmt.format_map(context)
+
+
+@dataclass(frozen=True)
+class Column:
+    title: str
+    index: int                  # позиция в строке (ROW_FIELDS)
+    width: float                # pt
+    fmt: str | None
+    align: str
+
+
+@dataclass(frozen=True)
+class RenderPlan:
+    name: str
+    page_size: tuple[float, float]
+    margin_top: float
+    margin_bottom: float
+    margin_left: float
+    font: str
+    font_bold: str
+    header: tuple[TextLine, ...]
+    continuation: tuple[TextLine, ...]
+    page_footer: str
+    columns: tuple[Column, ...]
+    col_widths: tuple[float, ...]
+    table_size: float
+    row_height: float
+    table_space_after: float
+    highlight_weekdays: frozenset
+    subtotal_label: str
+    summary: tuple[TextLine, ...]
+    signatures: tuple[tuple[str, float], ...]
+    signature_line_width: float
+    signature_date: str
+
+    def format_row(self, row) -> list[str]:
+        """Строка таблицы → ячейки по колонкам шаблона"""
+        cells = []
+        for col in self.columns:
+            value = row[col.index]
+            cells.append(col.fmt.format(value) if col.fmt else str(value))
+        return cells
+
+    def format_subtotal(self, hours: float, amount: float) -> list[str]:
+        """Строка подытога страницы: подпись, часы и сумма в своих колонках"""
+        values = {ROW_FIELDS.index("hours"): hours, ROW_FIELDS.index("amount"): amount}
+        cells = []
+        for i, col in enumerate(self.columns):
+            if col.index in values:
+                value = values[col.index]
+                cells.append(col.fmt.format(value) if col.fmt else str(value))
+            else:
+                cells.append(self.subtotal_label if i == 0 else "")
+        return cells
+
+    def is_highlighted(self, row) -> bool:
+        return row[1] in self.highlight_weekdays
+
+    @property
+    def closing_height(self) -> float:
+        """Место под итоги и подписи (оценка сверху)"""
+        summary = sum(line.space_after for line in self.summary)
+        signatures = (12 + 8 + 6) * mm if self.signatures else 0
+        return summary + signatures
+
+
+# ==================================================
+# COMPILE
+# ==================================================
+def _resolve_font(name: str) -> str:
+    try:
+        pdfmetrics.getFont(name)
+    except KeyError:
+        raise TemplateError(f"Unknown font in template: {name!r}") from None
+    return name
+
+
+def _compile_lines(items, font, font_bold) -> tuple[TextLine, ...]:
+    return tuple(
+        TextLine(
+            fmt=item.get("text", ""),
+            font=font_bold if item.get("bold") else font,
+            size=item.get("size", DEFAULT_SIZE),
+            align=item.get("align", "left"),
+            space_after=item.get("space_after", DEFAULT_SPACE_AFTER) * mm,
+            when=tuple(item.get("when", ())),
+        )
+        for item in items
+    )
+
+
+def compile_template(name: str, data: dict) -> RenderPlan:
+    page = data.get("page", {})
+    fonts = data.get("fonts", {})
+    font = _resolve_font(fonts.get("regular", "Helvetica"))
+    font_bold = _resolve_font(fonts.get("bold", "Helvetica-Bold"))
+
+    try:
+        page_size = getattr(pagesizes, page.get("size", "A4"))
+    except AttributeError:
+        raise TemplateError(f"Unknown page size: {page.get('size')!r}") from None
+
+    table = data["table"]
+    columns = []
+    for col in table["columns"]:
+        try:
+            index = ROW_FIELDS.index(col["key"])
+        except ValueError:
+            raise TemplateError(f"Unknown table column key: {col['key']!r}") from None
+        columns.append(
+            Column(
+                title=col["title"],
+                index=index,
+                width=col["width"] * mm,
+                fmt=col.get("format"),
+                align=col.get("align", "left"),
+            )
+        )
+
+    signatures = data.get("signatures", {})
+
+    return RenderPlan(
+        name=name,
+        page_size=page_size,
+        margin_top=page.get("margin_top", 20) * mm,
+        margin_bottom=page.get("margin_bottom", 20) * mm,
+        margin_left=page.get("margin_left", 20) * mm,
+        font=font,
+        font_bold=font_bold,
+        header=_compile_lines(data.get("header", []), font, font_bold),
+        continuation=_compile_lines(data.get("continuation", []), font, font_bold),
+        page_footer=data.get("page_footer", ""),
+        columns=tuple(columns),
+        col_widths=tuple(c.width for c in columns),
+        table_size=table.get("size", 9),
+        row_height=table.get("row_height", 6.5) * mm,
+        table_space_after=table.get("space_after", 12) * mm,
+        highlight_weekdays=frozenset(table.get("highlight_weekdays", ())),
+        subtotal_label=table.get("subtotal_label", "Subtotal"),
+        summary=_compile_lines(data.get("summary", []), font, font_bold),
+        signatures=tuple(
+            (s["label"], s.get("x", 20) * mm) for s in signatures.get("labels", [])
+        ),
+        signature_line_width=signatures.get("line_width", 70) * mm,
+        signature_date=signatures.get("date", ""),
+    )
+
+
+# ==================================================
+# CACHE (MTIME INVALIDATION)
+# ==================================================
+_cache: dict[Path, tuple[int, RenderPlan]] = {}
+_lock = Lock()
+
+
+def load_plan(name: str, templates_dir: Path | None = None) -> RenderPlan:
+    """
+    Скомпилированный шаблон templates/report_<name>.json.
+    Файл перечитывается только если изменилось его mtime.
+    """
+    path = Path(templates_dir or TEMPLATES_DIR) / f"report_{name}.json"
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise TemplateError(f"Report template not found: {path}") from None
+
+    with _lock:
+        cached = _cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+    with open(path, encoding="utf-8") as f:
+        plan = compile_template(name, json.load(f))
+
+    with _lock:
+        _cache[path] = (mtime, plan)
+    return plan
+
+
+def clear_cache():
+    with _lock:
+        _cache.clear()
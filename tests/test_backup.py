@@ -0,0 +1,125 @@
+import os
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.backup import (
+    BackupError,
+    Retention,
+    backup_db,
+    list_backups,
+    prune_backups,
+    verify_backup,
+)
+
+
+# --------------------------------------------------
+# FIXTURES
+# --------------------------------------------------
+@pytest.fixture
+def live_db(tmp_path):
+    path = tmp_path / "payroll.db"
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, payload TEXT)")
+    conn.executemany("INSERT INTO t (payload) VALUES (?)", [("x" * 500,)] * 2000)
+    conn.commit()
+    yield path, conn
+    conn.close()
+
+
+# --------------------------------------------------
+# BACKUP
+# --------------------------------------------------
+def test_online_backup_while_open(live_db, tmp_path, monkeypatch):
+    import core.backup
+
+    monkeypatch.setattr(core.backup, "BACKUP_PAGES", 16)
+    path, conn = live_db
+    conn.execute("INSERT INTO t (payload) VALUES ('uncommitted')")  # открытая транзакция
+
+    steps = []
+    dst = backup_db(path, tmp_path / "backups", progress=lambda r, t: steps.append(r))
+
+    assert len(steps) > 1
+    copy = sqlite3.connect(dst)
+    assert copy.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 2000
+    copy.close()
+
+
+def test_compressed_backup_is_verified(live_db, tmp_path):
+    path, _ = live_db
+
+    dst = backup_db(path, tmp_path / "backups", compress=True)
+
+    assert dst.name.endswith(".db.gz")
+    verify_backup(dst)
+    assert not list((tmp_path / "backups").glob("*.partial"))
+
+
+def test_backups_in_the_same_second_do_not_collide(live_db, tmp_path, monkeypatch):
+    import core.backup
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2026, 3, 1, 12, 0, 0)
+
+    monkeypatch.setattr(core.backup, "datetime", FrozenDatetime)
+    path, _ = live_db
+    backups = tmp_path / "backups"
+
+    first = backup_db(path, backups)
+    second = backup_db(path, backups)
+
+    assert first != second
+    assert first.name == "salary_backup_20260301_120000.db"
+    assert len(list_backups(backups)) == 2
+    verify_backup(first)
+    verify_backup(second)
+
+
+def test_prune_keeps_recent_partials(tmp_path):
+    running = tmp_path / "salary_backup_20260301_120000_abc.partial"
+    stale = tmp_path / "salary_backup_20260101_120000_def.partial"
+    running.touch()
+    stale.touch()
+    old = time.time() - 7 * 24 * 3600
+    os.utime(stale, (old, old))
+
+    prune_backups(tmp_path, Retention())
+
+    assert running.exists()     # другой процесс ещё пишет копию
+    assert not stale.exists()
+
+
+def test_verify_rejects_garbage(tmp_path):
+    bad = tmp_path / "salary_backup_20260101_000000.db"
+    bad.write_bytes(b"SQLite format 3\x00" + b"\xff" * 4096)
+
+    with pytest.raises((BackupError, sqlite3.DatabaseError)):
+        verify_backup(bad)
+
+
+def test_missing_database(tmp_path):
+    assert backup_db(tmp_path / "nope.db") is None
+
+
+# --------------------------------------------------
+# RETENTION
+# --------------------------------------------------
+def test_retention_keeps_daily_weekly_monthly(tmp_path):
+    start = datetime(2026, 1, 1, 12, 0, 0)
+    for hours in range(0, 24 * 120, 12):  # две копии в день, 120 дней
+        ts = start + timedelta(hours=hours)
+        (tmp_path / f"salary_backup_{ts:%Y%m%d_%H%M%S}.db").touch()
+
+    prune_backups(tmp_path, Retention(daily=3, weekly=2, monthly=2))
+    kept = [ts for ts, _ in list_backups(tmp_path)]
+
+    newest = start + timedelta(hours=24 * 120 - 12)
+    assert kept[0] == newest
+    assert len({ts.date() for ts in kept}) == len(kept)  # одна копия на день
+    assert 3 <= len(kept) <= 3 + 2 + 2
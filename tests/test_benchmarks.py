@@ -0,0 +1,36 @@
+from benchmarks import datasets
+from benchmarks.run import case_id, compare, main, run
+
+
+def test_datasets_are_deterministic():
+    assert datasets.period(1) == ("2021-01-01", "2021-01-31")
+    assert datasets.period(12) == ("2021-01-01", "2021-12-31")
+
+    hours = datasets.hours_map(1)
+    assert len(hours) == 31
+    assert hours["2021-01-02"] == 0.0           # суббота
+    assert hours == datasets.hours_map(1)
+    assert datasets.employees(5) == datasets.employees(5)
+
+
+def test_smoke_run_and_compare():
+    result = run("smoke", only="search", repeat=1)
+
+    keys = set(result["results"])
+    assert keys == {case_id("search.index", {"employees": 10}), case_id("search.fts", {"employees": 10})}
+    assert all(r["median_ms"] > 0 for r in result["results"].values())
+
+    # Baseline вдвое быстрее — регрессия; вдвое медленнее — нет
+    key = case_id("search.index", {"employees": 10})
+    current = {"results": {key: {"median_ms": 2.0}}}
+    assert compare(current, {"results": {key: {"median_ms": 1.0}}})[0]["regression"]
+    assert not compare(current, {"results": {key: {"median_ms": 4.0}}})[0]["regression"]
+    assert compare(current, {"results": {}}) == []
+
+
+def test_missing_baseline_is_reported(tmp_path, capsys):
+    args = ["--profile", "smoke", "-k", "search.index", "--repeat", "1", "--baseline", str(tmp_path / "none.json")]
+
+    assert main(args) == 0
+    assert "No baseline" in capsys.readouterr().err
+    assert main(args + ["--require-baseline"]) == 2
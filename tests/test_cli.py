@@ -0,0 +1,119 @@
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+
+import cli
+from database.db import Database
+from tests.conftest import ROOT_DIR
+
+
+# --------------------------------------------------
+# FIXTURES
+# --------------------------------------------------
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "payroll.db"
+    db = Database(path)
+    db.add_employee("Zoe", 12.5)
+    db.add_employee("Adam", 10.0)
+    db.save_hours_many([
+        (1, "2026-03-02", 8.0),
+        (1, "2026-03-03", 2.0),
+        (2, "2026-04-01", 8.0),   # вне периода
+    ])
+    db.close()
+    return path
+
+
+# --------------------------------------------------
+# COMMANDS
+# --------------------------------------------------
+def test_calc_json(db_path, capsys):
+    code = cli.main([
+        "--db", str(db_path),
+        "calc", "--from", "2026-03-01", "--to", "2026-03-31",
+        "--housing", "50", "--format", "json",
+    ])
+    assert code == 0
+
+    result = {r["name"]: r for r in json.loads(capsys.readouterr().out)}
+    assert result["Zoe"]["total_hours"] == 10.0
+    assert result["Zoe"]["net_amount"] == 30.0     # 10 h × 8 € − 50
+    assert result["Adam"]["total_hours"] == 0.0
+
+
+def test_pdf_and_backup(db_path, tmp_path, capsys):
+    out = tmp_path / "pdf"
+    assert cli.main([
+        "--db", str(db_path),
+        "pdf", "--from", "2026-03-01", "--to", "2026-03-31",
+        "--combined", "--out", str(out), "-q",
+    ]) == 0
+    assert len(list(out.glob("*.pdf"))) == 1
+
+    assert cli.main(["--db", str(db_path), "backup", "--dir", str(tmp_path / "bk")]) == 0
+    assert len(list((tmp_path / "bk").glob("*.db"))) == 1
+
+
+def test_calc_on_database_from_before_migrations(tmp_path, capsys):
+    # Схема первой версии приложения, без user_version: GUI эту БД не открывал
+    path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE employees (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL, rate REAL NOT NULL, bank TEXT, iban TEXT, bic TEXT
+        );
+        CREATE TABLE work_hours (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            employee_id INTEGER NOT NULL, work_date TEXT NOT NULL, hours REAL NOT NULL,
+            UNIQUE(employee_id, work_date),
+            FOREIGN KEY(employee_id) REFERENCES employees(id)
+        );
+        INSERT INTO employees (name, rate, iban) VALUES ('Zoe', 12.5, 'DE89');
+        INSERT INTO work_hours (employee_id, work_date, hours) VALUES (1, '2026-01-05', 8.0);
+    """)
+    conn.close()
+
+    code = cli.main([
+        "--db", str(path),
+        "calc", "--from", "2026-01-01", "--to", "2026-01-31", "--format", "json",
+    ])
+
+    assert code == 0
+    assert json.loads(capsys.readouterr().out)[0]["total_hours"] == 8.0
+
+
+def test_backup_of_other_database_is_kept_apart(db_path):
+    assert cli.main(["--db", str(db_path), "backup"]) == 0
+
+    # Не в общую папку копий основной payroll.db, а рядом с этой БД
+    assert len(list((db_path.parent / "backups" / "payroll").glob("*.db"))) == 1
+
+
+def test_errors_are_reported(db_path, capsys):
+    code = cli.main([
+        "--db", str(db_path),
+        "calc", "--from", "2026-03-31", "--to", "2026-03-01",
+    ])
+    assert code == 1
+    assert "Empty period" in capsys.readouterr().err
+
+
+def test_light_commands_skip_heavy_imports(db_path, tmp_path):
+    script = (
+        "import sys, cli\n"
+        f"cli.main(['--db', {str(db_path)!r}, 'backup', '--dir', {str(tmp_path / 'bk')!r}])\n"
+        "heavy = {'tkinter', 'numpy', 'reportlab', 'openpyxl'} & set(sys.modules)\n"
+        "print(sorted(heavy))\n"
+    )
+    env = dict(os.environ, LOCALAPPDATA=str(tmp_path))
+    out = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=ROOT_DIR, env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    assert out.strip().splitlines()[-1] == "[]"
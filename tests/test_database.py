@@ -0,0 +1,318 @@
+import pytest
+
+from database.db import Database
+
+
+# --------------------------------------------------
+# FIXTURES
+# --------------------------------------------------
+@pytest.fixture
+def db(tmp_path):
+    database = Database(tmp_path / "payroll.db")
+    yield database
+    database.close()
+
+
+def save_payroll(db, name, period_from, period_to, net=100.0, employee_id=1):
+    return db.save_payroll(
+        employee_id=employee_id,
+        name=name,
+        rate_mode="fixed",
+        rate=8.0,
+        period_from=period_from,
+        period_to=period_to,
+        total_hours=12.5,
+        gross_amount=net,
+        net_amount=net,
+        days={"2026-01-02": 2.5, "2026-01-01": 10.0},
+    )
+
+
+# --------------------------------------------------
+# PAYROLL HISTORY
+# --------------------------------------------------
+def test_payroll_history_roundtrip(db):
+    db.add_employee("Anna", 10.0)
+    payroll_id = save_payroll(db, "Anna", "2026-01-01", "2026-01-31")
+
+    payroll, days = db.get_payroll_full(payroll_id)
+
+    assert payroll["name"] == "Anna"
+    assert payroll["net_amount"] == 100.0
+    assert [(d["work_date"], d["hours"]) for d in days] == [
+        ("2026-01-01", 10.0),
+        ("2026-01-02", 2.5),
+    ]
+
+
+def test_payroll_history_pagination_and_filters(db):
+    db.add_employee("Anna", 10.0)
+    db.add_employee("Boris", 10.0)
+    for i in range(5):
+        save_payroll(db, f"Anna {i}", "2026-01-01", "2026-01-31", employee_id=1)
+    save_payroll(db, "Boris", "2026-02-01", "2026-02-28", employee_id=2)
+
+    assert db.count_payrolls() == 6
+    assert len(db.get_payrolls(limit=4)) == 4
+    assert len(db.get_payrolls(limit=4, offset=4)) == 2
+
+    # Новые сначала
+    assert db.get_payrolls(limit=1)[0]["name"] == "Boris"
+
+    assert db.count_payrolls(name="anna") == 5
+    assert db.count_payrolls(employee_id=2) == 1
+    assert db.count_payrolls(period_from="2026-02-10", period_to="2026-03-01") == 1
+
+
+def test_get_payroll_full_missing(db):
+    with pytest.raises(KeyError):
+        db.get_payroll_full(42)
+
+
+# --------------------------------------------------
+# HOURS
+# --------------------------------------------------
+def test_save_hours_many_counts(db):
+    db.add_employee("Anna", 10.0)
+    emp_id = db.get_employees()[0]["id"]
+
+    inserted, updated = db.save_hours_many(
+        (emp_id, f"2026-01-{day:02d}", 8.0) for day in range(1, 11)
+    )
+    assert (inserted, updated) == (10, 0)
+
+    inserted, updated = db.save_hours_many([
+        (emp_id, "2026-01-01", 8.0),   # без изменений
+        (emp_id, "2026-01-02", 6.0),   # изменено
+        (emp_id, "2026-01-11", 4.0),   # новая
+    ])
+    assert (inserted, updated) == (1, 1)
+
+    hours = dict(
+        (r["work_date"], r["hours"])
+        for r in db.load_hours(emp_id, "2026-01-01", "2026-01-31")
+    )
+    assert len(hours) == 11
+    assert hours["2026-01-02"] == 6.0
+
+
+def test_transaction_rolls_back(db):
+    db.add_employee("Anna", 10.0)
+    emp_id = db.get_employees()[0]["id"]
+
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.save_hours(emp_id, "2026-01-01", 8.0)
+            db.save_hours(emp_id, "2026-01-02", 8.0)
+            raise RuntimeError("boom")
+
+    assert db.load_hours(emp_id, "2026-01-01", "2026-01-31") == []
+
+
+# --------------------------------------------------
+# CONNECTION PROFILES
+# --------------------------------------------------
+def test_interactive_profile_settings(db):
+    settings = db.settings()
+
+    assert settings["profile"] == "interactive"
+    assert settings["journal_mode"] == "wal"
+    assert settings["synchronous"] == 1  # NORMAL
+    assert settings["foreign_keys"] == 1
+
+
+def test_reporting_profile_is_read_only(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "payroll.db"
+    Database(path).close()
+
+    reporting = Database(path, profile="reporting")
+    assert reporting.get_employees() == []
+    with pytest.raises(sqlite3.OperationalError):
+        reporting.add_employee("Anna", 10.0)
+    reporting.close()
+
+
+def test_unknown_profile(tmp_path):
+    with pytest.raises(ValueError):
+        Database(tmp_path / "payroll.db", profile="turbo")
+
+
+# --------------------------------------------------
+# MIGRATIONS
+# --------------------------------------------------
+def test_migrates_legacy_database(tmp_path, monkeypatch):
+    import sqlite3
+    from database import migrations
+
+    path = tmp_path / "legacy.db"
+    legacy = sqlite3.connect(path)
+    legacy.execute(
+        "CREATE TABLE employees (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+        "name TEXT NOT NULL, rate REAL NOT NULL, iban TEXT, bic TEXT)"
+    )
+    legacy.executemany(
+        "INSERT INTO employees (name, rate, iban) VALUES (?, ?, ?)",
+        [(f"E{i}", 10.0, "DE89" if i % 2 else None) for i in range(25)],
+    )
+    legacy.commit()
+    legacy.close()
+
+    monkeypatch.setattr(migrations, "BATCH_SIZE", 10)
+    reports = []
+    conn = sqlite3.connect(path)
+    applied = migrations.migrate(conn, progress=lambda m, done, total: reports.append(
+        (m.version, done, total)
+    ))
+    conn.close()
+
+    assert applied == migrations.LATEST_VERSION
+    assert (5, 25, 25) in reports
+
+    db = Database(path)
+    rows = db.get_employees()
+    assert sum(r["has_bank_account"] for r in rows) == 12
+    assert rows[0]["bank"] is None
+    db.close()
+
+
+def test_migrate_is_noop_when_current(db):
+    from database.migrations import LATEST_VERSION, migrate, schema_version
+
+    assert schema_version(db.conn) == LATEST_VERSION
+    assert migrate(db.conn) == 0
+
+
+def test_update_employee_bank(db):
+    from core.models import Employee
+
+    db.add_employee("Anna", 10.0)
+    emp_id = db.get_employees()[0]["id"]
+
+    db.update_employee_bank(emp_id, True, "Revolut", "LT12", "REVOLT21")
+    employee = Employee.from_row(db.get_employees()[0])
+
+    assert employee.has_bank_account
+    assert employee.bank_name == "Revolut"
+    assert employee.iban == "LT12"
+
+
+# --------------------------------------------------
+# FULL-TEXT SEARCH
+# --------------------------------------------------
+def test_search_employees_and_payrolls(db):
+    db.add_employee("Anna Schmidt", 10.0, "Deutsche Bank", "DE89 3704", "DEUTDEFF")
+    db.add_employee("Boris Lang", 10.0)
+    save_payroll(db, "Anna Schmidt", "2026-03-01", "2026-03-31")
+
+    # Виды не смешиваются по bm25: сначала сотрудники, потом расчёты
+    results = [(r["kind"], r["id"]) for r in db.search("anna sch")]
+    assert results == [("employee", 1), ("payroll", 1)]
+
+    assert [r["id"] for r in db.search("de89", scope="employees")] == [1]
+    assert [r["id"] for r in db.search("2026 03", scope="payrolls")] == [1]
+    assert db.search("anna OR boris") == []
+    assert db.search("   ") == []
+
+    # Индекс следует за изменениями через триггеры
+    db.update_employee(2, "Robert Lang", 10.0)
+    db.delete_employee(1)
+    assert db.search("boris") == []
+    assert [r["name"] for r in db.search("rob")] == ["Robert Lang"]
+    assert [r["kind"] for r in db.search("schmidt")] == ["payroll"]
+
+    assert db.count_payrolls(query="schm") == 1
+    assert db.count_payrolls(query="lang") == 0
+
+
+# --------------------------------------------------
+# EMPLOYEE REPOSITORY
+# --------------------------------------------------
+def count_queries(db):
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    return statements
+
+
+def test_employee_repository_cache_and_invalidation(db):
+    for name in ("Boris", "Anna", "Clara"):
+        db.add_employee(name, 10.0)
+
+    assert [e.name for e in db.list_employees()] == ["Anna", "Boris", "Clara"]
+    assert db.count_employees() == 3
+
+    queries = count_queries(db)
+    anna = db.get_employee(2)
+    assert db.get_employee(2) is anna
+    assert db.count_employees() == 3
+    assert db.get_employee(99) is None
+    assert queries == []
+
+    db.update_employee(2, "Zoe", 12.0, iban="DE89")
+    db.delete_employee(1)
+    emp_id = db.add_employee("Bella", 9.0)
+
+    assert db.get_employee(2).name == "Zoe"
+    assert db.get_employee(2).has_bank_account
+    assert db.get_employee(1) is None
+    assert [e.name for e in db.list_employees()] == ["Bella", "Clara", "Zoe"]
+    assert db.count_employees() == 3
+    assert db.get_employee(emp_id).rate == 9.0
+
+
+def test_employee_keyset_pages(db):
+    with db.transaction():
+        for i in range(25):
+            db.add_employee(f"Employee {i:02d}", 10.0)
+
+    names, after = [], None
+    while True:
+        page = db.list_employees(after=after, limit=10)
+        if not page:
+            break
+        names += [e.name for e in page]
+        after = (page[-1].name, page[-1].id)
+
+    assert names == [f"Employee {i:02d}" for i in range(25)]
+
+
+def test_employee_cache_dropped_on_rollback(db):
+    db.add_employee("Anna", 10.0)
+    db.list_employees()
+
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.add_employee("Boris", 10.0)
+            raise RuntimeError
+
+    assert [e.name for e in db.list_employees()] == ["Anna"]
+    assert db.count_employees() == 1
+
+
+def test_hours_cache_prefetch_and_invalidation(db):
+    anna = db.add_employee("Anna", 10.0)
+    boris = db.add_employee("Boris", 10.0)
+    db.save_hours_many([
+        (anna, "2026-01-05", 8.0),
+        (boris, "2026-01-05", 6.0),
+        (boris, "2026-02-02", 4.0),
+    ])
+
+    db.prefetch_hours([anna, boris], "2026-01-01", "2026-01-31")
+    db.load_period_hours(boris, "2026-02-01", "2026-02-28")
+
+    queries = count_queries(db)
+    assert db.load_period_hours(anna, "2026-01-01", "2026-01-31") == {"2026-01-05": 8.0}
+    assert db.load_period_hours(boris, "2026-01-01", "2026-01-31") == {"2026-01-05": 6.0}
+    assert queries == []
+
+    # Сбрасывается только январь Бориса — февраль остаётся в кэше
+    db.save_hours(boris, "2026-01-06", 7.0)
+    assert (anna, "2026-01-01", "2026-01-31") in db.hours_cache
+    assert (boris, "2026-01-01", "2026-01-31") not in db.hours_cache
+    assert (boris, "2026-02-01", "2026-02-28") in db.hours_cache
+    assert db.load_period_hours(boris, "2026-01-01", "2026-01-31") == {
+        "2026-01-05": 6.0,
+        "2026-01-06": 7.0,
+    }
@@ -0,0 +1,42 @@
+from core.models import Employee
+from services.employee_search import EmployeeSearchIndex
+
+
+def get_index():
+    return EmployeeSearchIndex([
+        Employee(1, "Anna Schmidt", 10.0, True, "Deutsche Bank", "DE89 3704 0044", "DEUTDEFF"),
+        Employee(2, "Boris Müller-Lang", 12.0),
+        Employee(3, "Anna Berg", 9.0, True, "Sparkasse", "DE12 5005 0000", "HELADEF1"),
+    ])
+
+
+def names(employees):
+    return [e.name for e in employees]
+
+
+def test_prefix_and_token_search():
+    index = get_index()
+
+    assert names(index.search("")) == ["Anna Berg", "Anna Schmidt", "Boris Müller-Lang"]
+    assert names(index.search("ann")) == ["Anna Berg", "Anna Schmidt"]
+    assert names(index.search("anna sch")) == ["Anna Schmidt"]
+    assert names(index.search("LANG")) == ["Boris Müller-Lang"]
+    assert names(index.search("spark")) == ["Anna Berg"]
+    assert names(index.search("de89 3704")) == ["Anna Schmidt"]
+    assert names(index.search("de893704")) == ["Anna Schmidt"]
+    assert names(index.search("helad")) == ["Anna Berg"]
+    assert index.search("anna boris") == []
+
+
+def test_index_updates():
+    index = get_index()
+
+    index.update(Employee(1, "Anna Zimmer", 10.0))
+    index.add(Employee(4, "Zoe Adams", 11.0))
+    index.remove(3)
+
+    assert names(index.search("anna")) == ["Anna Zimmer"]
+    assert index.search("schmidt") == []
+    assert index.search("sparkasse") == []
+    assert names(index.search("z")) == ["Anna Zimmer", "Zoe Adams"]
+    assert len(index) == 3
@@ -0,0 +1,75 @@
+import pytest
+from openpyxl import load_workbook
+
+from database.db import Database
+from services.export_service import export_payroll_register
+from services.payroll_service import calculate_payroll_run
+
+
+# --------------------------------------------------
+# FIXTURES
+# --------------------------------------------------
+@pytest.fixture
+def db(tmp_path):
+    database = Database(tmp_path / "payroll.db")
+    database.add_employee("Zoe", 12.5, "Bank", "DE89", "BIC1")
+    database.add_employee("Adam", 10.0)
+    database.add_employee("Mia", 9.0)
+    database.save_hours_many([
+        (1, "2026-03-01", 8.0),
+        (1, "2026-03-02", 7.5),
+        (3, "2026-03-02", 4.25),
+        (3, "2026-04-01", 8.0),   # вне периода
+    ])
+    yield database
+    database.close()
+
+
+# --------------------------------------------------
+# REGISTER
+# --------------------------------------------------
+def test_register_matches_payroll_run(db, tmp_path):
+    path = tmp_path / "register.xlsx"
+
+    count = export_payroll_register(
+        db, path, "2026-03-01", "2026-03-31",
+        housing=50.0, utilities=20.0, include_days=True,
+    )
+
+    wb = load_workbook(path, read_only=True)
+    register = list(wb["Register"].values)
+    days = list(wb["Days"].values)
+
+    assert count == 3
+    assert register[0][:2] == ("Employee ID", "Employee")
+    expected = {
+        p.employee.id: p.summary
+        for p in calculate_payroll_run(
+            db, "2026-03-01", "2026-03-31", housing=50.0, utilities=20.0, with_rows=False
+        )
+    }
+    for row in register[1:]:
+        summary = expected[row[0]]
+        assert row[6:11] == (
+            summary.total_hours,
+            summary.gross_amount,
+            summary.housing_deduction,
+            summary.utilities_deduction,
+            summary.net_amount,
+        )
+
+    assert register[1][11:] == ("Bank", "DE89", "BIC1")
+    assert [(r[0], r[2], r[4]) for r in days[1:]] == [
+        (1, "01-03-2026", 8.0),
+        (1, "02-03-2026", 7.5),
+        (3, "02-03-2026", 4.25),
+    ]
+
+
+def test_register_without_days_sheet(db, tmp_path):
+    path = tmp_path / "register.xlsx"
+
+    export_payroll_register(db, path, "2026-03-01", "2026-03-31", rate_mode="custom")
+
+    wb = load_workbook(path, read_only=True)
+    assert wb.sheetnames == ["Register"]
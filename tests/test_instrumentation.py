@@ -0,0 +1,121 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from core import instrumentation
+from core.instrumentation import timed, timer
+from database.db import Database
+from services.payroll_service import calculate_payroll_run
+from tests.conftest import ROOT_DIR
+
+
+# --------------------------------------------------
+# FIXTURES
+# --------------------------------------------------
+@pytest.fixture
+def metrics():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield instrumentation
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+# --------------------------------------------------
+# SWITCH
+# --------------------------------------------------
+def test_disabled_records_nothing():
+    instrumentation.reset()
+
+    @timed("test.noop")
+    def noop():
+        return [1, 2, 3]
+
+    assert noop() == [1, 2, 3]
+    with timer("test.block") as span:
+        span.rows = 5
+
+    assert instrumentation.snapshot() == {}
+
+
+def test_env_variable_enables_and_dumps(tmp_path):
+    path = tmp_path / "metrics.json"
+    script = (
+        "from database.db import Database\n"
+        "db = Database(':memory:')\n"
+        "db.add_employee('Anna', 12.5)\n"
+        "db.list_employees()\n"
+    )
+    env = dict(os.environ, LOCALAPPDATA=str(tmp_path), PAYROLL_METRICS=str(path))
+    subprocess.run([sys.executable, "-c", script], cwd=ROOT_DIR, env=env, check=True)
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["enabled"] is True
+    assert data["metrics"]["db.list_employees"]["rows"] == 1
+
+
+# --------------------------------------------------
+# METRICS
+# --------------------------------------------------
+def test_calls_rows_and_percentiles(metrics):
+    for i in range(1, 101):
+        metrics.record("test.op", i / 1000, rows=2)
+
+    summary = metrics.snapshot()["test.op"]
+    assert summary["calls"] == 100
+    assert summary["rows"] == 200
+    assert summary["p50_ms"] == pytest.approx(50.0)
+    assert summary["p95_ms"] == pytest.approx(95.0)
+    assert summary["max_ms"] == pytest.approx(100.0)
+
+
+def test_errors_are_counted(metrics):
+    @timed("test.fail")
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        fail()
+
+    assert metrics.snapshot()["test.fail"]["errors"] == 1
+
+
+def test_database_and_services_are_instrumented(metrics, tmp_path):
+    db = Database(":memory:")
+    db.add_employee("Anna", 12.5)
+    db.add_employee("Boris", 10.0)
+    db.save_hours(1, "2026-03-02", 8.0)
+    calculate_payroll_run(db, "2026-03-01", "2026-03-31")
+
+    with timer("test.block") as span:
+        span.rows = 7
+
+    snapshot = metrics.snapshot()
+    assert snapshot["db.add_employee"]["calls"] == 2
+    assert snapshot["db.list_employees"]["rows"] == 2
+    assert snapshot["payroll.run"]["rows"] == 2
+    assert snapshot["test.block"]["rows"] == 7
+
+    data = metrics.dump(tmp_path / "metrics.json")
+    assert json.loads((tmp_path / "metrics.json").read_text(encoding="utf-8")) == data
+
+
+def test_cursor_methods_count_rows_as_they_are_read(metrics):
+    db = Database(":memory:")
+    db.add_employee("Anna", 12.5)
+    db.save_hours_many([(1, f"2026-03-{d:02d}", 8.0) for d in range(1, 11)])
+
+    cursor = db.load_hours_for_period("2026-03-01", "2026-03-31")
+    assert "db.load_hours_for_period" not in metrics.snapshot()    # ещё не прочитан
+    assert len(list(cursor)) == 10
+
+    abandoned = db.iter_hours(1, "2026-03-01", "2026-03-31")
+    next(abandoned)
+    del abandoned
+
+    snapshot = metrics.snapshot()
+    assert snapshot["db.load_hours_for_period"]["rows"] == 10
+    assert snapshot["db.iter_hours"]["rows"] == 1
@@ -0,0 +1,108 @@
+import threading
+import time
+
+import pytest
+
+from core.jobs import JobRunner
+
+
+# --------------------------------------------------
+# FIXTURES
+# --------------------------------------------------
+@pytest.fixture
+def runner():
+    jobs = JobRunner(workers=2)
+    yield jobs
+    jobs.shutdown()
+
+
+def wait_for(runner, job, timeout=5.0):
+    """Аналог цикла after(): poll() до завершения задачи"""
+    deadline = time.monotonic() + timeout
+    while not job.finished:
+        runner.poll()
+        assert time.monotonic() < deadline, f"{job} did not finish"
+        time.sleep(0.01)
+
+
+# --------------------------------------------------
+# JOBS
+# --------------------------------------------------
+def test_callbacks_run_in_polling_thread(runner):
+    events = []
+    worker_threads = []
+
+    def work(job, n):
+        worker_threads.append(threading.get_ident())
+        for i in range(n):
+            job.report(i + 1, n)
+        return n * 2
+
+    job = runner.submit(
+        work,
+        3,
+        name="double",
+        on_done=lambda result: events.append(("done", result, threading.get_ident())),
+        on_progress=lambda done, total: events.append(("progress", done, total)),
+    )
+    assert runner.running("double") == [job]
+
+    wait_for(runner, job)
+
+    main = threading.get_ident()
+    assert worker_threads and worker_threads[0] != main
+    assert events == [
+        ("progress", 1, 3),
+        ("progress", 2, 3),
+        ("progress", 3, 3),
+        ("done", 6, main),
+    ]
+    assert runner.running() == []
+
+
+def test_error_and_cancel(runner):
+    errors = []
+    started = threading.Event()
+
+    def fail(job):
+        raise ValueError("boom")
+
+    def slow(job):
+        started.set()
+        while True:
+            job.check()
+            time.sleep(0.01)
+
+    failed = runner.submit(fail, name="fail", on_error=errors.append)
+    cancelled = runner.submit(slow, name="slow", on_error=errors.append)
+    started.wait(5)
+    cancelled.cancel()
+
+    wait_for(runner, failed)
+    wait_for(runner, cancelled)
+
+    # Об отмене пользователю не сообщаем
+    assert [str(e) for e in errors] == ["boom"]
+
+
+def test_listeners_see_start_and_finish(runner):
+    seen = []
+    runner.add_listener(lambda job: seen.append((job.name, job.finished)))
+
+    job = runner.submit(lambda job: None, name="noop")
+    wait_for(runner, job)
+
+    assert seen == [("noop", False), ("noop", True)]
+
+
+def test_shutdown_does_not_wait_for_uncancellable_jobs():
+    runner = JobRunner(workers=2)
+    release = threading.Event()
+    job = runner.submit(lambda job: release.wait(5), name="Print")
+
+    started = time.monotonic()
+    runner.shutdown(timeout=0.1)
+
+    assert time.monotonic() - started < 1.0
+    assert job.cancelled
+    release.set()
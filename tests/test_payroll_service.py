@@ -7,11 +7,11 @@ from services.payroll_service import (
 # --------------------------------------------------
 # FIXTURES
 # --------------------------------------------------
-def get_employee():
+def get_employee(rate=15.0):
     return Employee(
         id=1,
         name="John Doe",
-        rate=15.0
+        rate=rate
     )
 
 
@@ -22,17 +22,17 @@ def test_fixed_payroll_single_day():
     employee = get_employee()
 
     rows, summary = calculate_fixed_payroll(
-        employee=employee,
-        hours_map={"2026-01-01": 8},
-        start_iso="2026-01-01",
-        end_iso="2026-01-01"
+        employee,
+        {"2026-01-01": 8},
+        "2026-01-01",
+        "2026-01-01",
     )
 
     assert summary.total_hours == 8
-    assert summary.rate == 8.0
     assert summary.gross_amount == 64.0
     assert summary.net_amount == 64.0
     assert len(rows) == 1
+    assert rows[0].rate == 8.0
     assert rows[0].amount == 64.0
 
 
@@ -40,31 +40,41 @@ def test_fixed_payroll_multiple_days():
     employee = get_employee()
 
     rows, summary = calculate_fixed_payroll(
-        employee=employee,
-        hours_map={
+        employee,
+        {
             "2026-01-01": 8,
             "2026-01-02": 6
         },
-        start_iso="2026-01-01",
-        end_iso="2026-01-02"
     )
 
     assert summary.total_hours == 14
     assert summary.gross_amount == 112.0
 
 
+def test_fixed_payroll_with_deductions():
+    rows, summary = calculate_fixed_payroll(
+        get_employee(),
+        {"2026-01-01": 10},
+        housing=20,
+        utilities=10,
+    )
+
+    assert summary.gross_amount == 80.0
+    assert summary.housing_deduction + summary.utilities_deduction == 30.0
+    assert summary.net_amount == 50.0
+
+
 # --------------------------------------------------
 # CUSTOM REPORT TESTS
 # --------------------------------------------------
 def test_custom_payroll_without_deductions():
-    employee = get_employee()
+    employee = get_employee(rate=12.0)
 
     rows, summary = calculate_custom_payroll(
-        employee=employee,
-        hours_map={"2026-01-01": 10},
-        start_iso="2026-01-01",
-        end_iso="2026-01-01",
-        rate=12.0
+        employee,
+        {"2026-01-01": 10},
+        "2026-01-01",
+        "2026-01-01",
     )
 
     assert summary.total_hours == 10
@@ -72,38 +82,156 @@ def test_custom_payroll_without_deductions():
     assert summary.net_amount == 120.0
 
 
-def test_custom_payroll_with_deductions():
-    employee = get_employee()
+def test_custom_payroll_ignores_deductions():
+    # Custom Rate — без удержаний (1.8.2)
+    employee = get_employee(rate=12.0)
 
     rows, summary = calculate_custom_payroll(
-        employee=employee,
-        hours_map={"2026-01-01": 10},
-        start_iso="2026-01-01",
-        end_iso="2026-01-01",
-        rate=12.0,
-        housing_deduction=20,
-        utilities_deduction=10
+        employee,
+        {"2026-01-01": 10},
+        housing=20,
+        utilities=10,
     )
 
     assert summary.gross_amount == 120.0
-    assert summary.total_deductions == 30.0
-    assert summary.net_amount == 90.0
+    assert summary.housing_deduction + summary.utilities_deduction == 0.0
+    assert summary.net_amount == 120.0
 
 
 # --------------------------------------------------
 # EDGE CASES
 # --------------------------------------------------
 def test_zero_hours():
-    employee = get_employee()
+    employee = get_employee(rate=10.0)
 
-    rows, summary = calculate_custom_payroll(
-        employee=employee,
-        hours_map={},
-        start_iso="2026-01-01",
-        end_iso="2026-01-01",
-        rate=10.0
-    )
+    rows, summary = calculate_custom_payroll(employee, {})
 
     assert summary.total_hours == 0
     assert summary.gross_amount == 0
     assert summary.net_amount == 0
+    assert rows == []
+
+
+# --------------------------------------------------
+# BATCH RUN
+# --------------------------------------------------
+def test_payroll_run_all_employees(tmp_path):
+    from database.db import Database
+    from services.payroll_service import calculate_payroll_run
+
+    db = Database(tmp_path / "payroll.db")
+    db.add_employee("Anna", 12.0)
+    db.add_employee("Boris", 10.0)
+    anna, boris = (r["id"] for r in db.get_employees())
+
+    db.save_hours(anna, "2026-01-05", 8)
+    db.save_hours(anna, "2026-01-06", 6)
+    db.save_hours(boris, "2026-01-05", 10)
+    db.save_hours(boris, "2026-02-01", 10)  # вне периода
+
+    results = calculate_payroll_run(
+        db, "2026-01-01", "2026-01-31", rate_mode="custom"
+    )
+    by_name = {r.employee.name: r for r in results}
+
+    assert by_name["Anna"].summary.total_hours == 14
+    assert by_name["Anna"].summary.gross_amount == 168.0
+    assert by_name["Boris"].summary.gross_amount == 100.0
+    assert len(by_name["Boris"].rows) == 1
+    db.close()
+
+
+def test_payroll_run_fixed_with_deductions(tmp_path):
+    from database.db import Database
+    from services.payroll_service import calculate_payroll_run
+
+    db = Database(tmp_path / "payroll.db")
+    db.add_employee("Anna", 12.0)
+    db.add_employee("Boris", 10.0)
+    anna, boris = (r["id"] for r in db.get_employees())
+    db.save_hours(anna, "2026-01-05", 10)
+
+    results = calculate_payroll_run(
+        db, "2026-01-01", "2026-01-31",
+        housing=20, utilities=5,
+        deductions={boris: (0.0, 0.0)},
+    )
+    by_name = {r.employee.name: r for r in results}
+
+    assert by_name["Anna"].summary.gross_amount == 80.0
+    assert by_name["Anna"].summary.net_amount == 55.0
+    assert by_name["Boris"].summary.net_amount == 0.0
+    db.close()
+
+
+# --------------------------------------------------
+# VECTORIZED CALCULATION
+# --------------------------------------------------
+def test_payroll_vector_matches_rows():
+    from services.payroll_service import PayrollVector, build_payroll_rows
+
+    hours_map = {"2026-01-02": 7.5, "2026-01-01": 8, "2026-01-03": 0}
+    vector = PayrollVector.from_hours_map(hours_map, 12.35)
+    rows = build_payroll_rows(hours_map, 12.35)
+
+    assert [r.date for r in rows] == ["2026-01-01", "2026-01-02", "2026-01-03"]
+    assert [r.amount for r in rows] == [98.8, 92.62, 0.0]
+    assert vector.gross_cents == 19142
+    assert vector.total_hours == 15.5
+
+
+def test_summary_without_rows():
+    rows, summary = calculate_custom_payroll(
+        get_employee(), {"2026-01-01": 10}, with_rows=False
+    )
+
+    assert rows == []
+    assert summary.gross_amount == 150.0
+
+
+# --------------------------------------------------
+# RUNNING TOTALS
+# --------------------------------------------------
+def test_running_totals_match_full_recalculation():
+    import random
+
+    from services.payroll_service import RunningTotals
+
+    rnd = random.Random(7)
+    employee = get_employee()
+    hours_map = {f"2026-{m:02d}-{d:02d}": 10.0 for m in (1, 2) for d in range(1, 29)}
+
+    totals = RunningTotals(hours_map, 8)
+    totals.set_deductions(120.555, 30, apply=True)
+    for _ in range(300):
+        date = rnd.choice(list(hours_map))
+        hours_map[date] = rnd.randrange(0, 49) * 0.5
+        totals.set_hours(date, hours_map[date])
+
+    _, expected = calculate_fixed_payroll(
+        employee, hours_map, housing=120.555, utilities=30, with_rows=False
+    )
+    assert totals.summary() == expected
+
+    totals.set_rate(employee.rate)
+    totals.set_deductions(120.555, 30, apply=False)
+    _, expected = calculate_custom_payroll(
+        employee, hours_map, housing=120.555, utilities=30, with_rows=False
+    )
+    assert totals.summary() == expected
+
+
+# --------------------------------------------------
+# DATE METADATA
+# --------------------------------------------------
+def test_date_info():
+    from core.dates import date_info, date_info_dmy
+
+    info = date_info("2026-01-04")
+
+    assert info.date_ui == "04.01.2026"
+    assert info.date_dmy == "04-01-2026"
+    assert info.weekday == "Sunday"
+    assert info.is_weekend
+    assert info.iso_week == 1
+    assert date_info_dmy("04-01-2026") is info
@@ -0,0 +1,215 @@
+import threading
+
+from core.models import Employee, EmployeePayroll
+from services.payroll_service import calculate_custom_payroll
+from services.report_service import build_statement, generate_payroll_pdfs, render_statements
+
+
+# --------------------------------------------------
+# FIXTURES
+# --------------------------------------------------
+def get_payroll(emp_id=1, name="John Doe", days=28):
+    employee = Employee(id=emp_id, name=name, rate=15.0, iban="DE89")
+    hours_map = {f"2026-02-{d:02d}": 8.0 for d in range(1, days + 1)}
+    rows, summary = calculate_custom_payroll(employee, hours_map)
+    return EmployeePayroll(employee=employee, rows=rows, summary=summary)
+
+
+def get_statements(tmp_path, count):
+    return [
+        build_statement(
+            get_payroll(i, f"Employee {i}"),
+            period_from="01-02-2026",
+            period_to="28-02-2026",
+            rate_mode="custom",
+            output_dir=tmp_path,
+        )
+        for i in range(count)
+    ]
+
+
+# --------------------------------------------------
+# BATCH RENDER
+# --------------------------------------------------
+def test_render_statements_in_process_pool(tmp_path):
+    statements = get_statements(tmp_path, 4)
+    statements[2]["rows"] = None  # ошибка только в одном документе
+
+    progress = []
+    result = render_statements(
+        statements, workers=2, progress=lambda done, total: progress.append(done)
+    )
+
+    assert sorted(progress) == [1, 2, 3, 4]
+    assert list(result.errors) == [2]
+    assert result.paths[2] is None
+    for i in (0, 1, 3):
+        assert open(result.paths[i], "rb").read(5) == b"%PDF-"
+
+
+def test_render_statements_cancel(tmp_path):
+    cancel = threading.Event()
+    cancel.set()
+
+    result = render_statements(get_statements(tmp_path, 3), workers=1, cancel=cancel)
+
+    assert result.cancelled
+    assert result.paths == [None, None, None]
+
+
+def test_batch_pdfs_for_employees_with_same_name(tmp_path):
+    payrolls = [get_payroll(1, "Anna"), get_payroll(2, "Anna"), get_payroll(3, "Boris")]
+
+    result = generate_payroll_pdfs(
+        payrolls, "01-02-2026", "28-02-2026", "custom", workers=2, output_dir=tmp_path
+    )
+
+    assert result.errors == {}
+    assert len(set(result.paths)) == 3
+    assert len(list(tmp_path.glob("*.pdf"))) == 3
+
+
+def test_render_statements_cancel_in_process_pool(tmp_path):
+    cancel = threading.Event()
+    cancel.set()
+    total = 40
+
+    # Отмена не ждёт первого готового документа, очередь пула отменяется
+    result = render_statements(get_statements(tmp_path, total), workers=2, cancel=cancel)
+
+    assert result.cancelled
+    assert result.paths == [None] * total
+    assert len(list(tmp_path.glob("*.pdf"))) < total
+
+
+# --------------------------------------------------
+# TEMPLATES
+# --------------------------------------------------
+def test_template_plan_is_cached_and_invalidated(tmp_path):
+    import json
+    import os
+
+    from services.report_templates import TEMPLATES_DIR, load_plan
+
+    data = json.loads((TEMPLATES_DIR / "report_fixed.json").read_text(encoding="utf-8"))
+    path = tmp_path / "report_fixed.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    plan = load_plan("fixed", tmp_path)
+    assert load_plan("fixed", tmp_path) is plan
+    assert [c.title for c in plan.columns] == ["Date", "Day", "Hours", "Hourly rate", "Amount"]
+    assert plan.format_row(("01-02-2026", "Sunday", 8, 10, 80)) == [
+        "01-02-2026", "Sunday", "8.0", "10.00 €", "80.00 €"
+    ]
+
+    data["table"]["columns"] = data["table"]["columns"][:2]
+    path.write_text(json.dumps(data), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert len(load_plan("fixed", tmp_path).columns) == 2
+
+
+def test_custom_template_has_no_deductions():
+    from services.report_templates import load_plan
+
+    lines = [line.fmt for line in load_plan("custom").summary]
+
+    assert not any("deduction" in line for line in lines)
+
+
+def test_custom_pdf_has_no_deduction_rows():
+    import io
+
+    from reportlab.pdfgen import canvas
+
+    import services.report_service as report_service
+
+    def render(template, **extra):
+        buffer = io.BytesIO()
+        c = canvas.Canvas(buffer, pageCompression=0)
+        report_service._draw_statement_document(
+            c,
+            employee_name="Anna",
+            period_from="01-02-2026",
+            period_to="28-02-2026",
+            created_at="01-03-2026",
+            bank=None, iban=None, bic=None,
+            rows=[("02-02-2026", "Monday", 8.0, 15.0, 120.0)],
+            gross=120.0,
+            total_hours=8.0,
+            utilities=30.0,
+            rental=100.0,
+            template=template,
+        )
+        c.save()
+        return buffer.getvalue()
+
+    # Даже если удержания переданы, шаблон Custom их не выводит, net = gross
+    assert b"Rental deduction" in render("fixed")
+    custom = render("custom")
+    assert b"deduction" not in custom
+    assert b"Net amount: 120.00" in custom
+
+
+# --------------------------------------------------
+# PAGINATION (STREAMING)
+# --------------------------------------------------
+def test_long_statement_is_paginated_from_generator():
+    from datetime import date, timedelta
+
+    from reportlab.pdfgen import canvas
+
+    from services.report_service import _draw_statement, _statement_context, statement_rows
+    from services.report_templates import load_plan
+
+    start = date(2025, 1, 1)
+    days = ((str(start + timedelta(days=i)), 8.0) for i in range(400))
+
+    plan = load_plan("fixed")
+    context = _statement_context(
+        "John Doe", "01-01-2025", "04-02-2026", "05-02-2026",
+        None, None, None, None, None, 50.0, 100.0,
+    )
+    c = canvas.Canvas(None, pagesize=plan.page_size)
+    _draw_statement(c, plan, context, statement_rows(days, 10.0))
+
+    assert c.getPageNumber() > 5
+    assert context["total_hours"] == 3200.0
+    assert context["gross"] == 32000.0
+    assert context["net"] == 31850.0
+
+
+# --------------------------------------------------
+# COMBINED PDF
+# --------------------------------------------------
+def test_combined_pdf_has_outline_entry_per_employee(tmp_path):
+    from services.report_service import _render_combined_to_file
+
+    path = tmp_path / "all.pdf"
+    progress = []
+
+    completed = _render_combined_to_file(
+        str(path),
+        get_statements(tmp_path, 3),
+        progress=lambda done, total: progress.append((done, total)),
+    )
+
+    data = path.read_bytes()
+    assert completed
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+    assert data.count(b"/Type /Page\n") >= 3
+    assert b"/Outlines" in data
+    for i in range(3):
+        assert f"Employee {i}".encode() in data
+
+
+def test_combined_pdf_cancel(tmp_path):
+    from services.report_service import _render_combined_to_file
+
+    cancel = threading.Event()
+    cancel.set()
+    path = tmp_path / "all.pdf"
+
+    assert not _render_combined_to_file(str(path), get_statements(tmp_path, 2), cancel=cancel)
+    assert not path.exists()
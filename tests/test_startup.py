@@ -0,0 +1,21 @@
+import pytest
+
+from benchmarks.import_time import BUDGETS_MS, measure, parse_importtime
+
+
+def test_parse_importtime():
+    text = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   core.dates\n"
+        "import time:       300 |        420 | app\n"
+        "unrelated line\n"
+    )
+    assert parse_importtime(text) == [("core.dates", 120, 120), ("app", 300, 420)]
+
+
+@pytest.mark.parametrize("module", ["app", "cli"])
+def test_startup_import_budget(module):
+    result = measure(module, runs=3)
+
+    assert result["deferred"] == []
+    assert result["total_ms"] < BUDGETS_MS[module]
@@ -0,0 +1,71 @@
+from datetime import date
+
+from database.synthetic import SyntheticProfile, create_database, make_employees, populate
+
+
+def iban_valid(iban: str) -> bool:
+    digits = "".join(str(int(ch, 36)) for ch in iban[4:] + iban[:4])
+    return int(digits) % 97 == 1
+
+
+def dump(db):
+    return (
+        db.conn.execute("SELECT name, rate, bank, iban, bic FROM employees ORDER BY id").fetchall(),
+        db.conn.execute("SELECT employee_id, work_date, hours FROM work_hours ORDER BY id").fetchall(),
+    )
+
+
+def test_same_seed_same_database():
+    start, end = date(2026, 1, 1), date(2026, 3, 31)
+    first, stats = create_database(":memory:", 50, start, end, seed=3)
+    second, _ = create_database(":memory:", 50, start, end, seed=3)
+    other, _ = create_database(":memory:", 50, start, end, seed=4)
+
+    assert stats.employees == 50
+    assert stats.hours_rows == first.conn.execute("SELECT COUNT(*) FROM work_hours").fetchone()[0]
+    assert [tuple(r) for t in dump(first) for r in t] == [tuple(r) for t in dump(second) for r in t]
+    assert dump(first)[1] != dump(other)[1]
+    assert first.count_employees() == 50
+    assert first.conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+
+def test_realistic_patterns():
+    db, _ = create_database(
+        ":memory:", 300, date(2026, 1, 1), date(2026, 12, 31),
+        seed=1, profile=SyntheticProfile(weekend_share=0.0),
+    )
+
+    weekend = db.conn.execute(
+        "SELECT COUNT(*) FROM work_hours WHERE strftime('%w', work_date) IN ('0', '6')"
+    ).fetchone()[0]
+    assert weekend == 0
+
+    # Рабочих дней в 2026 — 261; отпуск и больничные их уменьшают
+    days = [r[0] for r in db.conn.execute(
+        "SELECT COUNT(*) FROM work_hours GROUP BY employee_id"
+    )]
+    assert max(days) < 261
+    assert min(days) > 100
+
+    hours = {h for (h,) in db.conn.execute("SELECT DISTINCT hours FROM work_hours")}
+    assert {8.0, 10.0} <= hours
+    assert hours & {4.0, 5.0, 6.0}       # неполный день
+
+    employees = make_employees(300, seed=1)
+    ibans = [e[3] for e in employees if e[3]]
+    assert all(iban_valid(iban) for iban in ibans)
+    assert len(ibans) < len(employees)    # есть сотрудники без счёта
+
+
+def test_indexes_and_search_survive_bulk_load():
+    db, _ = create_database(":memory:", 100, date(2026, 1, 1), date(2026, 1, 31), seed=1)
+    populate(db, 50, date(2026, 1, 1), date(2026, 1, 31), seed=2)     # дозапись
+
+    objects = {r[0] for r in db.conn.execute("SELECT name FROM sqlite_master")}
+    assert {"idx_work_hours_date", "employees_fts_ai", "employees_fts_ad", "employees_fts_au"} <= objects
+
+    # Полнотекстовый индекс содержит и первую загрузку, и дозапись
+    expected = db.conn.execute("SELECT COUNT(*) FROM employees WHERE name LIKE 'anna %'").fetchone()[0]
+    assert expected and len(db.search("anna", scope="employees", limit=1000)) == expected
+    name = db.get_employee(150).name
+    assert 150 in [r["id"] for r in db.search(name, scope="employees")]
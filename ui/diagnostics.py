@@ -0,0 +1,119 @@
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+
+from core import instrumentation
+
+REFRESH_MS = 1000
+
+COLUMNS = (
+    ("name", "Metric", 220, "w"),
+    ("calls", "Calls", 70, "e"),
+    ("rows", "Rows", 80, "e"),
+    ("p50", "p50, ms", 80, "e"),
+    ("p95", "p95, ms", 80, "e"),
+    ("max", "Max, ms", 80, "e"),
+    ("total", "Total, ms", 90, "e"),
+)
+
+
+class Diagnostics(tk.Toplevel):
+    """Замеры core.instrumentation: вызовы, строки, p50 / p95, обновление раз в секунду"""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.title("Diagnostics")
+        self.geometry("760x420")
+
+        self.enabled_var = tk.BooleanVar(value=instrumentation.enabled())
+
+        # ---------- TOOLBAR ----------
+        top = ttk.Frame(self)
+        top.pack(fill="x", padx=10, pady=(10, 0))
+
+        ttk.Checkbutton(
+            top,
+            text="Collect metrics",
+            variable=self.enabled_var,
+            command=self._toggle,
+        ).pack(side="left")
+
+        ttk.Button(top, text="Export JSON…", command=self._export).pack(side="right")
+        ttk.Button(top, text="Reset", command=self._reset).pack(side="right", padx=(0, 8))
+
+        # ---------- TABLE ----------
+        frame = ttk.Frame(self)
+        frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        self.tree = ttk.Treeview(
+            frame,
+            columns=[c[0] for c in COLUMNS],
+            show="headings",
+            selectmode="browse",
+        )
+        for key, title, width, anchor in COLUMNS:
+            self.tree.heading(key, text=title)
+            self.tree.column(key, width=width, anchor=anchor, stretch=key == "name")
+
+        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        self.hint = ttk.Label(self, text="", foreground="#6C757D")
+        self.hint.pack(fill="x", padx=10, pady=(0, 10))
+
+        self._refresh()
+
+    def _toggle(self):
+        if self.enabled_var.get():
+            instrumentation.enable()
+        else:
+            instrumentation.disable()
+        self._refresh(schedule=False)
+
+    def _reset(self):
+        instrumentation.reset()
+        self._refresh(schedule=False)
+
+    def _export(self):
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json")],
+            initialfile="payroll-metrics.json",
+        )
+        if not path:
+            return
+        try:
+            instrumentation.dump(path)
+        except OSError as e:
+            messagebox.showerror("Error", str(e), parent=self)
+
+    def _refresh(self, schedule=True):
+        if not self.winfo_exists():
+            return
+
+        tree = self.tree
+        selected = tree.selection()
+        tree.delete(*tree.get_children())
+        for name, m in instrumentation.snapshot().items():
+            tree.insert("", "end", iid=name, values=(
+                name,
+                m["calls"],
+                m["rows"] or "",
+                f"{m['p50_ms']:.2f}",
+                f"{m['p95_ms']:.2f}",
+                f"{m['max_ms']:.2f}",
+                f"{m['total_ms']:.1f}",
+            ))
+        selected = [i for i in selected if tree.exists(i)]
+        if selected:
+            tree.selection_set(selected)
+
+        if instrumentation.enabled():
+            self.hint.config(text="Collecting. PDFs rendered in worker processes are not included.")
+        else:
+            self.hint.config(text=f"Collection is off. Enable here or start with {instrumentation.ENV_VAR}=1.")
+
+        if schedule:
+            self.after(REFRESH_MS, self._refresh)
@@ -1,6 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from core.models import Employee
+from services.employee_search import EmployeeSearchIndex
+from ui.virtual_tree import ListSource, VirtualTreeview
+
+# Пауза после последнего нажатия клавиши перед фильтрацией
+SEARCH_DELAY_MS = 200
+
 
 class EmployeesTab(ttk.Frame):
     def __init__(self, parent, db, on_change=None):
@@ -18,6 +25,9 @@ class EmployeesTab(ttk.Frame):
         self.search_var = tk.StringVar()
         self.search_var.trace("w", self._on_search)
 
+        self.index = EmployeeSearchIndex()
+        self._search_job = None
+
         self._build_ui()
         self._load()
 
@@ -49,11 +59,18 @@ class EmployeesTab(ttk.Frame):
         self.table_frame = ttk.Frame(left_panel)
         self.table_frame.grid(row=1, column=0, sticky="nsew")
 
-        self.tree = ttk.Treeview(
+        # Виртуальная таблица: в Treeview только видимые строки
+        self.source = ListSource(make_row=self._make_row)
+        self.table = VirtualTreeview(
             self.table_frame,
+            count=self.source.count,
+            fetch=self.source.fetch,
             columns=("name", "rate", "bank", "iban", "bic"),
-            show="headings"
+            show="headings",
+            selectmode="browse",
         )
+        self.table.pack(fill="both", expand=True)
+        self.tree = self.table.tree
 
         self.tree.heading("name", text="Name")
         self.tree.heading("rate", text="Rate €/h")
@@ -67,13 +84,6 @@ class EmployeesTab(ttk.Frame):
         self.tree.column("iban", width=220)
         self.tree.column("bic", width=120)
 
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(self.table_frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.tree.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
         # Zebra stripes
         self.tree.tag_configure("oddrow", background="#f9f9f9")
         self.tree.tag_configure("evenrow", background="#ffffff")
@@ -125,7 +135,7 @@ class EmployeesTab(ttk.Frame):
         self._set_button_state(new_mode=True)
 
         # bind только после создания кнопок
-        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select, add="+")
         # Правая кнопка мыши - сброс выделения
         self.tree.bind("<Button-3>", self._on_right_click)
 
@@ -134,38 +144,21 @@ class EmployeesTab(ttk.Frame):
     # ======================================================
 
     def _on_search(self, *args):
-        """Фильтрация таблицы по поисковому запросу"""
-        search_text = self.search_var.get().lower().strip()
-        
-        # Очищаем таблицу
-        self.tree.delete(*self.tree.get_children())
-        
-        # Загружаем отфильтрованные данные
-        row_index = 0
-        for r in self.db.get_employees():
-            # Фильтруем по имени, банку, IBAN или BIC
-            if search_text:
-                searchable = f"{r['name']} {r['bank'] or ''} {r['iban'] or ''} {r['bic'] or ''}".lower()
-                if search_text not in searchable:
-                    continue
-            
-            # Zebra stripes
-            tag = "evenrow" if row_index % 2 == 0 else "oddrow"
-            
-            self.tree.insert(
-                "",
-                "end",
-                iid=r["id"],
-                values=(
-                    r["name"],
-                    f"{r['rate']:.2f}",
-                    r["bank"] or "",
-                    r["iban"] or "",
-                    r["bic"] or "",
-                ),
-                tags=(tag,)
-            )
-            row_index += 1
+        """Фильтрация откладывается до паузы в наборе (SEARCH_DELAY_MS)"""
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(SEARCH_DELAY_MS, self._apply_search)
+
+    def _apply_search(self):
+        """Фильтрация таблицы по поисковому запросу (индекс в памяти)"""
+        self._search_job = None
+        self.source.items = self.index.search(self.search_var.get())
+        self.table.refresh()
+
+    def _make_row(self, row_index, e: Employee):
+        # Zebra stripes
+        tag = "evenrow" if row_index % 2 == 0 else "oddrow"
+        return e.id, self._item_values(e), (tag,)
 
     # ======================================================
     # TABLE CLICK HANDLING
@@ -173,15 +166,13 @@ class EmployeesTab(ttk.Frame):
 
     def _on_right_click(self, event):
         """Правая кнопка мыши - сброс выделения"""
-        for item in self.tree.selection():
-            self.tree.selection_remove(item)
+        self.table.selection_clear()
         self._force_clear()
         return "break"
     
     def _on_frame_click(self, event):
         """Обработка клика по фрейму (вне таблицы)"""
-        for item in self.tree.selection():
-            self.tree.selection_remove(item)
+        self.table.selection_clear()
         self._force_clear()
     
     def _force_clear(self):
@@ -195,7 +186,7 @@ class EmployeesTab(ttk.Frame):
         self._set_button_state(new_mode=True)
 
     def _clear_selection(self):
-        self.tree.selection_set(())
+        self.table.selection_clear()
         self.selected_id = None
 
         self.name_var.set("")
@@ -209,44 +200,51 @@ class EmployeesTab(ttk.Frame):
     # ======================================================
 
     def _load(self):
-        """Загрузка данных с zebra-стилем"""
-        self.tree.delete(*self.tree.get_children())
-        row_index = 0
-        for r in self.db.get_employees():
-            # Zebra stripes
-            tag = "evenrow" if row_index % 2 == 0 else "oddrow"
-            
-            self.tree.insert(
-                "",
-                "end",
-                iid=r["id"],
-                values=(
-                    r["name"],
-                    f"{r['rate']:.2f}",
-                    r["bank"] or "",
-                    r["iban"] or "",
-                    r["bic"] or "",
-                ),
-                tags=(tag,)
-            )
-            row_index += 1
+        """Загрузка из БД и перестроение поискового индекса"""
+        self.index.rebuild(self.db.list_employees())
+        self._apply_search()
+
+    def _item_values(self, e: Employee):
+        return (
+            e.name,
+            f"{e.rate:.2f}",
+            e.bank_name or "",
+            e.iban or "",
+            e.bic or "",
+        )
+
+    def _form_employee(self, emp_id, rate):
+        bank = self.bank_var.get().strip() or None
+        iban = self.iban_var.get().strip() or None
+        bic = self.bic_var.get().strip() or None
+        return Employee(
+            id=emp_id,
+            name=self.name_var.get().strip(),
+            rate=rate,
+            has_bank_account=bool(iban),
+            bank_name=bank,
+            iban=iban,
+            bic=bic,
+        )
 
     def _on_select(self, event):
-        selected = self.tree.selection()
+        selected = self.table.selection()
 
         if not selected:
             self._set_button_state(new_mode=True)
             return
 
         emp_id = int(selected[0])
-        r = next(e for e in self.db.get_employees() if e["id"] == emp_id)
+        if emp_id == self.selected_id:
+            return  # та же строка снова на экране после прокрутки
+        e = self.index.get(emp_id)
 
         self.selected_id = emp_id
-        self.name_var.set(r["name"])
-        self.rate_var.set(str(r["rate"]))
-        self.bank_var.set(r["bank"] or "")
-        self.iban_var.set(r["iban"] or "")
-        self.bic_var.set(r["bic"] or "")
+        self.name_var.set(e.name)
+        self.rate_var.set(str(e.rate))
+        self.bank_var.set(e.bank_name or "")
+        self.iban_var.set(e.iban or "")
+        self.bic_var.set(e.bic or "")
         
         # Переключаем в режим редактирования
         self._set_button_state(new_mode=False)
@@ -263,7 +261,7 @@ class EmployeesTab(ttk.Frame):
     # ======================================================
 
     def _new_employee_mode(self):
-        self.tree.selection_remove(self.tree.selection())
+        self.table.selection_clear()
         self.selected_id = None
 
         self.name_var.set("")
@@ -315,15 +313,17 @@ class EmployeesTab(ttk.Frame):
             messagebox.showerror("Missing data", "Employee name is required.")
             return
 
-        self.db.add_employee(
-            name=self.name_var.get().strip(),
-            rate=rate,
-            bank=self.bank_var.get().strip() or None,
-            iban=self.iban_var.get().strip() or None,
-            bic=self.bic_var.get().strip() or None,
+        e = self._form_employee(None, rate)
+        e.id = self.db.add_employee(
+            name=e.name,
+            rate=e.rate,
+            bank=e.bank_name,
+            iban=e.iban,
+            bic=e.bic,
         )
 
-        self._load()
+        self.index.add(e)
+        self._apply_search()
         self._new_employee_mode()
 
         if self.on_change:
@@ -341,16 +341,18 @@ class EmployeesTab(ttk.Frame):
             messagebox.showerror("Missing data", "Employee name is required.")
             return
 
+        e = self._form_employee(self.selected_id, rate)
         self.db.update_employee(
-            emp_id=self.selected_id,
-            name=self.name_var.get().strip(),
-            rate=rate,
-            bank=self.bank_var.get().strip() or None,
-            iban=self.iban_var.get().strip() or None,
-            bic=self.bic_var.get().strip() or None,
+            emp_id=e.id,
+            name=e.name,
+            rate=e.rate,
+            bank=e.bank_name,
+            iban=e.iban,
+            bic=e.bic,
         )
 
-        self._load()
+        self.index.update(e)
+        self._apply_search()
         self._new_employee_mode()
 
         if self.on_change:
@@ -372,7 +374,8 @@ class EmployeesTab(ttk.Frame):
             return
 
         self.db.delete_employee(self.selected_id)
-        self._load()
+        self.index.remove(self.selected_id)
+        self._apply_search()
         self._new_employee_mode()
 
         if self.on_change:
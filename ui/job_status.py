@@ -0,0 +1,57 @@
+from tkinter import ttk
+
+
+class JobStatus(ttk.Frame):
+    """
+    Индикатор фоновых задач для статус-бара: название и прогресс
+    последней активной задачи, число остальных, кнопка отмены.
+    Скрыт, пока задач нет.
+    """
+
+    def __init__(self, parent, runner):
+        super().__init__(parent)
+        self.runner = runner
+        self._job = None
+
+        self.label = ttk.Label(self, text="", font=("Segoe UI", 9), foreground="#6C757D")
+        self.label.pack(side="left", padx=(0, 6))
+
+        self.bar = ttk.Progressbar(self, length=120, mode="indeterminate")
+        self.bar.pack(side="left", padx=(0, 6))
+
+        self.cancel_button = ttk.Button(self, text="✖", width=3, command=self._cancel)
+        self.cancel_button.pack(side="left")
+
+        runner.add_listener(self._on_job)
+
+    def _on_job(self, job):
+        active = self.runner.running()
+        if not active:
+            self._job = None
+            self.bar.stop()
+            self.pack_forget()
+            return
+
+        self._job = active[-1]
+        if not self.winfo_ismapped():
+            self.pack(side="right", padx=10)
+        self._show(self._job, len(active) - 1)
+
+    def _show(self, job, others):
+        text = f"⏳ {job.name}"
+        if job.total:
+            text += f" {job.done}/{job.total}"
+            self.bar.stop()
+            self.bar.config(mode="determinate", maximum=job.total, value=job.done)
+        elif str(self.bar.cget("mode")) != "indeterminate" or job.done is None:
+            # Объём неизвестен (печать, один PDF) — бегущая полоса
+            self.bar.config(mode="indeterminate")
+            self.bar.start(15)
+        if others:
+            text += f" (+{others})"
+        self.label.config(text=text)
+
+    def _cancel(self):
+        if self._job is not None:
+            self._job.cancel()
+            self.label.config(text=f"⏳ {self._job.name}: cancelling…")
@@ -1,21 +1,46 @@
 import tkinter as tk
-from tkinter import ttk
-from services.report_service import preview_payroll_pdf_from_history
+from tkinter import ttk, messagebox
+from core.dates import date_info
+from ui.virtual_tree import VirtualTreeview
+
+PAGE_SIZE = 200
 
 
 class PayrollHistory(tk.Toplevel):
-    def __init__(self, parent, db):
+    def __init__(self, parent, db, jobs):
         super().__init__(parent)
         self.title("Payroll History")
         self.geometry("700x400")
 
         self.db = db
+        self.jobs = jobs
+
+        self.search_var = tk.StringVar()
+
+        # ---------- FILTER ----------
+        top = ttk.Frame(self)
+        top.pack(fill="x", padx=10, pady=(10, 0))
 
-        self.tree = ttk.Treeview(
+        ttk.Label(top, text="🔍 Search:").pack(side="left", padx=(0, 8))
+        search_entry = ttk.Entry(top, textvariable=self.search_var)
+        search_entry.pack(side="left", fill="x", expand=True)
+        search_entry.bind("<Return>", lambda e: self._reload())
+
+        self.count_label = ttk.Label(top, text="", foreground="#6C757D")
+        self.count_label.pack(side="right", padx=(8, 0))
+
+        # ---------- TABLE ----------
+        # Страницы подгружаются из БД при прокрутке
+        self.table = VirtualTreeview(
             self,
+            count=self._count,
+            fetch=self._fetch,
+            page_size=PAGE_SIZE,
             columns=("id", "employee", "period", "created", "net"),
-            show="headings"
+            show="headings",
+            selectmode="browse",
         )
+        self.tree = self.table.tree
 
         self.tree.heading("id", text="ID")
         self.tree.heading("employee", text="Employee")
@@ -25,31 +50,58 @@ class PayrollHistory(tk.Toplevel):
 
         self.tree.column("id", width=50, anchor="center")
 
-        self.tree.pack(fill="both", expand=True, padx=10, pady=10)
+        self.table.pack(fill="both", expand=True, padx=10, pady=10)
 
         self.tree.bind("<Double-1>", self._open_pdf)
 
-        self._load()
+        self._reload()
+
+    def _filters(self):
+        # Имя, банк, IBAN, BIC или даты периода (полнотекстовый поиск)
+        return {"query": self.search_var.get().strip() or None}
 
-    def _load(self):
-        for r in self.db.get_payrolls():
-            self.tree.insert(
-                "",
-                "end",
-                values=(
+    def _reload(self):
+        """Перезагрузка с учётом фильтра"""
+        self.table.reset()
+        self.count_label.config(text=f"{self.table.total} payrolls")
+
+    def _count(self):
+        return self.db.count_payrolls(**self._filters())
+
+    def _fetch(self, offset, limit):
+        rows = self.db.get_payrolls(**self._filters(), limit=limit, offset=offset)
+        return [
+            (
+                r["id"],
+                (
                     r["id"],
                     r["name"],
-                    f"{r['period_from']} – {r['period_to']}",
-                    r["created_at"],
-                    f"{r['net_amount']:.2f} €"
-                )
+                    f"{date_info(r['period_from']).date_dmy} – "
+                    f"{date_info(r['period_to']).date_dmy}",
+                    r["created_at"][:16],
+                    f"{r['net_amount']:.2f} €",
+                ),
+                (),
             )
+            for r in rows
+        ]
 
     def _open_pdf(self, event):
-        item = self.tree.selection()
+        item = self.table.selection()
         if not item:
             return
 
-        payroll_id = self.tree.item(item[0])["values"][0]
+        payroll_id = int(item[0])
         payroll, days = self.db.get_payroll_full(payroll_id)
-        preview_payroll_pdf_from_history(payroll, days)
+
+        # Рендер и открытие PDF — в фоне, окно истории не замирает
+        def run(job):
+            from services.report_service import preview_payroll_pdf_from_history
+
+            preview_payroll_pdf_from_history(payroll, days)
+
+        self.jobs.submit(
+            run,
+            name="PDF Preview",
+            on_error=lambda e: messagebox.showerror("PDF Preview", str(e)),
+        )
@@ -1,21 +1,27 @@
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from datetime import datetime, timedelta
 
 from tkcalendar import DateEntry
-from services.report_service import generate_payroll_pdf
-from services.payroll_service import calculate_fixed_payroll, calculate_custom_payroll
-from core.models import Employee
+# report_service (reportlab) и export_service (openpyxl) импортируются
+# в фоновых задачах при первом действии — не при запуске приложения
+from services.payroll_service import RunningTotals, calculate_payroll_run
+from core.dates import date_info, date_range
+from ui.virtual_tree import ListSource, VirtualTreeview
+from database.db import Database
 from config import FIXED_RATE
 
 DEFAULT_HOURS = 10.0
+PREFETCH_NEIGHBOURS = 2   # соседних сотрудников в списке, чьи табели грузим заранее
 HOUR_STEP = 0.5
+FLUSH_DELAY_MS = 2000
 
 
 class PayrollTab(ttk.Frame):
-    def __init__(self, parent, db):
+    def __init__(self, parent, db, jobs):
         super().__init__(parent)
         self.db = db
+        self.jobs = jobs
 
         self.employee_map = {}
         self.days_data = {}
@@ -23,6 +29,7 @@ class PayrollTab(ttk.Frame):
         self.rate_mode = tk.StringVar(value="fixed")
         self.utilities_var = tk.StringVar(value="0.00")
         self.rental_var = tk.StringVar(value="0.00")
+        self.combine_pdf = tk.BooleanVar(value=False)
 
         # Summary variables
         self.total_hours_var = tk.StringVar(value="0.0")
@@ -32,13 +39,21 @@ class PayrollTab(ttk.Frame):
 
         self._editor = None
 
+        # Итоги периода: правка дня обновляет их на разницу
+        self.totals = None
+        self._recalc_job = None
+
+        # Несохранённые правки часов: (employee_id, ISO дата) → часы
+        self._dirty_hours = {}
+        self._flush_job = None
+
         self._build_ui()
         self._load_employees()
         
         # Bind auto-recalculation
-        self.rate_mode.trace_add("write", lambda *args: self._auto_recalculate())
-        self.utilities_var.trace_add("write", lambda *args: self._auto_recalculate())
-        self.rental_var.trace_add("write", lambda *args: self._auto_recalculate())
+        self.rate_mode.trace_add("write", lambda *args: self._schedule_recalculate())
+        self.utilities_var.trace_add("write", lambda *args: self._schedule_recalculate())
+        self.rental_var.trace_add("write", lambda *args: self._schedule_recalculate())
 
     # ======================================================
     # UI LAYOUT - 3 ZONES (Header / Content / Summary)
@@ -75,6 +90,7 @@ class PayrollTab(ttk.Frame):
         )
         self.employee_cb = ttk.Combobox(header, state="readonly", width=25)
         self.employee_cb.grid(row=0, column=1, sticky="w", padx=(0, 20))
+        self.employee_cb.bind("<<ComboboxSelected>>", self._on_employee_selected)
 
         # Period From
         ttk.Label(header, text="From:", font=("Segoe UI", 10, "bold")).grid(
@@ -129,20 +145,17 @@ class PayrollTab(ttk.Frame):
             table_frame, text="📅 Working Hours", font=("Segoe UI", 11, "bold")
         ).pack(anchor="w", pady=(0, 8))
 
-        # Treeview with scrollbar
-        tree_container = ttk.Frame(table_frame)
-        tree_container.pack(fill="both", expand=True)
-
-        scrollbar = ttk.Scrollbar(tree_container, orient="vertical")
-        scrollbar.pack(side="right", fill="y")
-
-        self.tree = ttk.Treeview(
-            tree_container,
+        # Виртуальная таблица: строки дней строятся из days_data по мере прокрутки
+        self.hours_source = ListSource(make_row=self._make_hours_row)
+        self.hours_table = VirtualTreeview(
+            table_frame,
+            count=self.hours_source.count,
+            fetch=self.hours_source.fetch,
             columns=("date", "day", "hours"),
             show="headings",
-            yscrollcommand=scrollbar.set,
         )
-        scrollbar.config(command=self.tree.yview)
+        self.hours_table.pack(fill="both", expand=True)
+        self.tree = self.hours_table.tree
 
         self.tree.heading("date", text="Date", anchor="center")
         self.tree.heading("day", text="Day", anchor="center")
@@ -152,7 +165,10 @@ class PayrollTab(ttk.Frame):
         self.tree.column("day", width=150, anchor="center")
         self.tree.column("hours", width=100, anchor="center")
 
-        self.tree.pack(fill="both", expand=True)
+        # Zebra + weekend tags
+        self.tree.tag_configure("odd", background="#f9f9f9")
+        self.tree.tag_configure("even", background="#ffffff")
+        self.tree.tag_configure("weekend", background="#fee2e2", foreground="#991b1b")
 
         # Bind events
         self.tree.bind("<Double-1>", self._start_edit_hours)
@@ -277,6 +293,37 @@ class PayrollTab(ttk.Frame):
             width=10,
         ).pack(side="left")
 
+        # Пакетные действия для всех сотрудников
+        all_frame = ttk.Frame(card)
+        all_frame.pack(fill="x", pady=(8, 0))
+
+        ttk.Button(
+            all_frame,
+            text="📚 Save all",
+            command=self._save_all_pdfs,
+            style="Neutral.TButton",
+        ).pack(side="left", fill="x", expand=True, padx=(0, 5))
+
+        ttk.Button(
+            all_frame,
+            text="🖨 Print all",
+            command=self._print_all_pdfs,
+            style="Neutral.TButton",
+        ).pack(side="left", fill="x", expand=True)
+
+        ttk.Checkbutton(
+            card,
+            text="Save all as one PDF",
+            variable=self.combine_pdf,
+        ).pack(anchor="w", pady=(6, 0))
+
+        ttk.Button(
+            card,
+            text="📊 Export register to Excel",
+            command=self._export_register,
+            style="Neutral.TButton",
+        ).pack(fill="x", pady=(8, 0))
+
     # ======================================================
     # ZONE 3: SUMMARY PANEL
     # ======================================================
@@ -339,66 +386,86 @@ class PayrollTab(ttk.Frame):
     # ======================================================
 
     def _load_employees(self):
+        current = self.employee_cb.get()
         self.employee_map.clear()
         names = []
 
-        for e in self.db.get_employees():
-            self.employee_map[e["name"]] = e
-            names.append(e["name"])
+        for e in self.db.list_employees():
+            self.employee_map[e.name] = e.id
+            names.append(e.name)
 
         self.employee_cb["values"] = names
-        if names:
+        if current in self.employee_map:
+            self.employee_cb.set(current)
+        elif names:
             self.employee_cb.current(0)
 
+    def reload_employees(self):
+        """Список сотрудников изменился (вкладка Employees)"""
+        self._load_employees()
+
     # ======================================================
     # PERIOD GENERATION
     # ======================================================
 
+    def _on_employee_selected(self, event=None):
+        """Смена сотрудника: табель того же периода из БД (обычно уже в кэше)"""
+        if self.days_data:
+            self._generate_period()
+        else:
+            self._schedule_recalculate()
+
     def _generate_period(self):
         """Генерация периода с zebra-стилем и подсветкой выходных"""
-        self.tree.delete(*self.tree.get_children())
+        self.flush_hours()
         self.days_data.clear()
 
         start = self.from_entry.get_date()
         end = self.to_entry.get_date()
 
-        # Configure zebra tags
-        self.tree.tag_configure("odd", background="#f9f9f9")
-        self.tree.tag_configure("even", background="#ffffff")
-        self.tree.tag_configure("weekend", background="#fee2e2", foreground="#991b1b")
+        # Сохранённые часы важнее значений по умолчанию
+        emp_id = self._current_employee_id()
+        stored = (
+            self.db.load_period_hours(emp_id, start.isoformat(), end.isoformat())
+            if emp_id is not None else {}
+        )
 
-        d = start
-        row_index = 0
-        while d <= end:
-            is_weekend = d.weekday() in [5, 6]  # Saturday, Sunday
-            hours = 0.0 if is_weekend else DEFAULT_HOURS
-
-            key = d.strftime("%Y-%m-%d")
-            self.days_data[key] = hours
-
-            # Determine tag
-            if is_weekend:
-                tag = "weekend"
-            else:
-                tag = "odd" if row_index % 2 == 0 else "even"
-
-            self.tree.insert(
-                "",
-                "end",
-                iid=key,
-                values=(
-                    d.strftime("%d-%m-%Y"),
-                    d.strftime("%A"),
-                    f"{hours:.1f}",
-                ),
-                tags=(tag,),
-            )
+        for info in date_range(start, end):
+            default = 0.0 if info.is_weekend else DEFAULT_HOURS
+            self.days_data[info.iso] = stored.get(info.iso, default)
 
-            d += timedelta(days=1)
-            row_index += 1
+        self.hours_source.items = list(self.days_data)
+        self.hours_table.reset()
 
-        self._update_total_hours()
-        self._auto_recalculate()
+        self.totals = RunningTotals(self.days_data, self._current_rate())
+        self._schedule_recalculate()
+
+        self.after_idle(self._prefetch_neighbours, start.isoformat(), end.isoformat())
+
+    def _prefetch_neighbours(self, start, end):
+        """Табели соседних сотрудников — чтобы переключение было мгновенным"""
+        names = list(self.employee_cb["values"])
+        current = self.employee_cb.current()
+        if current < 0:
+            return
+
+        neighbours = [
+            self.employee_map[names[i]]
+            for i in range(current - PREFETCH_NEIGHBOURS, current + PREFETCH_NEIGHBOURS + 1)
+            if i != current and 0 <= i < len(names)
+        ]
+        self.db.prefetch_hours(neighbours, start, end)
+
+    def _make_hours_row(self, row_index, key):
+        info = date_info(key)
+
+        # Determine tag
+        if info.is_weekend:
+            tag = "weekend"
+        else:
+            tag = "odd" if row_index % 2 == 0 else "even"
+
+        return key, (info.date_dmy, info.weekday, f"{self.days_data[key]:.1f}"), (tag,)
 
     # ======================================================
     # HOURS EDITING
@@ -448,23 +515,78 @@ class PayrollTab(ttk.Frame):
             val = self.days_data.get(row_id, 0.0)
 
         self.days_data[row_id] = val
+        self._mark_dirty(row_id, val)
+        if self.totals is not None:
+            self.totals.set_hours(row_id, val)
 
-        values = list(self.tree.item(row_id, "values"))
-        values[2] = f"{val:.1f}"
-        self.tree.item(row_id, values=values)
+        # Строка могла уйти с экрана, пока открыт редактор
+        self.hours_table.refresh(recount=False)
 
         self._editor.destroy()
         self._editor = None
 
-        self._update_total_hours()
-        self._auto_recalculate()
+        self._schedule_recalculate()
+
+    # ======================================================
+    # HOURS PERSISTENCE
+    # ======================================================
+
+    def _current_employee_id(self):
+        name = self.employee_cb.get()
+        if not name:
+            return None
+        return self.employee_map[name]
+
+    def _current_employee(self):
+        emp_id = self._current_employee_id()
+        if emp_id is None:
+            return None
+        return self.db.get_employee(emp_id)
+
+    def _mark_dirty(self, date, hours):
+        """Правка попадает в буфер и сохраняется пакетом с задержкой"""
+        emp_id = self._current_employee_id()
+        if emp_id is None:
+            return
+
+        self._dirty_hours[(emp_id, date)] = hours
+
+        if self._flush_job is not None:
+            self.after_cancel(self._flush_job)
+        self._flush_job = self.after(FLUSH_DELAY_MS, self.flush_hours)
+
+    def flush_hours(self):
+        """Сохранение всех несохранённых правок одной транзакцией"""
+        if self._flush_job is not None:
+            self.after_cancel(self._flush_job)
+            self._flush_job = None
+
+        if not self._dirty_hours:
+            return
+
+        rows = [
+            (emp_id, date, hours)
+            for (emp_id, date), hours in self._dirty_hours.items()
+        ]
+        self.db.save_hours_many(rows)
+        self._dirty_hours.clear()
+
+    def _persist_period(self):
+        """Сохранение всего табеля периода для выбранного сотрудника"""
+        emp_id = self._current_employee_id()
+        if emp_id is None:
+            return
+
+        for date, hours in self.days_data.items():
+            self._dirty_hours[(emp_id, date)] = hours
+        self.flush_hours()
 
     def clear_selection_on_click(self, event):
         region = self.tree.identify("region", event.x, event.y)
         item = self.tree.identify_row(event.y)
 
         if not item:
-            self.tree.selection_remove(self.tree.selection())
+            self.hours_table.selection_clear()
 
         return None
 
@@ -472,50 +594,50 @@ class PayrollTab(ttk.Frame):
     # AUTO-RECALCULATION
     # ======================================================
 
+    def _schedule_recalculate(self):
+        """Пересчёт не чаще одного раза за цикл простоя (серия правок → один)"""
+        if self._recalc_job is None:
+            self._recalc_job = self.after_idle(self._auto_recalculate)
+
+    def _current_rate(self):
+        if self.rate_mode.get() == "fixed":
+            return FIXED_RATE
+        emp = self._current_employee()
+        return emp.rate if emp is not None else 0.0
+
     def _update_total_hours(self):
         """Обновление итогов часов"""
-        total = sum(self.days_data.values())
+        total = self.totals.total_hours if self.totals is not None else 0.0
         self.total_hours_var.set(f"{total:.1f}")
         self.total_label.config(text=f"Total: {total:.1f} hours")
 
-    def _auto_recalculate(self):
-        """Автоматический пересчёт Net при изменении параметров"""
-        if not self.days_data:
-            return
+    def _calculate_summary(self):
+        """Итоги для выбранного сотрудника и текущих часов (без прохода по дням)"""
+        if not self.days_data or self.totals is None:
+            return None
 
-        name = self.employee_cb.get()
-        if not name:
-            return
+        if self._current_employee() is None:
+            return None
 
-        emp_data = self.employee_map[name]
-        emp = Employee(
-            id=emp_data["id"],
-            name=emp_data["name"],
-            rate=emp_data["rate"],
-        )
+        rental, utilities = self._deductions()
 
-        try:
-            utilities = float(self.utilities_var.get() or 0)
-        except ValueError:
-            utilities = 0.0
+        # Fixed — удержания применяются, Custom — нет (как в payroll_service)
+        self.totals.set_rate(self._current_rate())
+        self.totals.set_deductions(
+            rental, utilities, apply=self.rate_mode.get() == "fixed"
+        )
+        return self.totals.summary()
 
-        try:
-            rental = float(self.rental_var.get() or 0)
-        except ValueError:
-            rental = 0.0
+    def _auto_recalculate(self):
+        """Автоматический пересчёт Net при изменении параметров"""
+        self._recalc_job = None
+        self._update_total_hours()
 
-        # Calculate
-        if self.rate_mode.get() == "fixed":
-            rows, summary = calculate_fixed_payroll(
-                emp, self.days_data, utilities=utilities, housing=rental
-            )
-        else:
-            rows, summary = calculate_custom_payroll(
-                emp, self.days_data, utilities=utilities, housing=rental
-            )
+        summary = self._calculate_summary()
+        if summary is None:
+            return
 
         # Update summary
-        self.total_hours_var.set(f"{summary.total_hours:.1f}")
         self.gross_var.set(f"{summary.gross_amount:.2f} €")
         
         total_deductions = summary.housing_deduction + summary.utilities_deduction
@@ -529,58 +651,310 @@ class PayrollTab(ttk.Frame):
     # PDF ACTIONS
     # ======================================================
 
-    def _preview_pdf(self):
-        """Просмотр PDF"""
+    def _submit(self, title, fn, on_done=None):
+        """
+        Фоновая задача с заголовком title (не более одной одновременно);
+        ошибка — окно с сообщением. Возвращает Job или None.
+        """
+        if self.jobs.running(title):
+            messagebox.showinfo(title, f"{title} is already running")
+            return None
+
+        return self.jobs.submit(
+            fn,
+            name=title,
+            on_done=on_done,
+            on_error=lambda e: messagebox.showerror(title, str(e)),
+        )
+
+    def _reporting_db(self):
+        """Соединение только для чтения для фоновой задачи (sqlite3 — один поток)"""
+        return Database(self.db.path, profile="reporting")
+
+    def _submit_pdf(self, title, action, on_done=None):
         try:
-            self._call_pdf(action="preview")
+            kwargs = self._pdf_kwargs(action)
         except Exception as e:
-            messagebox.showerror("PDF Preview", str(e))
+            messagebox.showerror(title, str(e))
+            return None
+
+        def run(job):
+            from services.report_service import generate_payroll_pdf
+
+            return generate_payroll_pdf(**kwargs)
+
+        return self._submit(title, run, on_done)
+
+    def _preview_pdf(self):
+        """Просмотр PDF"""
+        self._submit_pdf("PDF Preview", "preview")
 
     def _save_pdf(self):
         """Сохранение PDF в папку по периоду"""
-        try:
-            pdf_path = self._call_pdf(action="save")
+        # Снимок расчёта до запуска: сотрудник / часы могут смениться, пока идёт рендер
+        record = self._payroll_record()
+
+        def done(pdf_path):
+            if record is not None:
+                self.db.save_payroll(**record)
             messagebox.showinfo("PDF Saved", f"PDF saved to:\n{pdf_path}")
-        except Exception as e:
-            messagebox.showerror("PDF Save", str(e))
+
+        if self._submit_pdf("PDF Save", "save", done):
+            self._persist_period()
 
     def _print_pdf(self):
         """Печать PDF"""
+        self._submit_pdf(
+            "PDF Print",
+            "print",
+            lambda path: messagebox.showinfo("PDF Print", "PDF sent to printer"),
+        )
+
+    def _deductions(self):
+        """Значения удержаний из формы (некорректный ввод → 0)"""
+        values = []
+        for var in (self.rental_var, self.utilities_var):
+            try:
+                values.append(float(var.get() or 0))
+            except ValueError:
+                values.append(0.0)
+        return tuple(values)
+
+    def _run_options(self):
+        """Параметры пакетного расчёта из формы (часы берутся из БД)"""
+        self.flush_hours()
+        housing, utilities = self._deductions()
+        return {
+            "start": self.from_entry.get_date().isoformat(),
+            "end": self.to_entry.get_date().isoformat(),
+            "period_from": self.from_entry.get(),
+            "period_to": self.to_entry.get(),
+            "rate_mode": self.rate_mode.get(),
+            "housing": housing,
+            "utilities": utilities,
+        }
+
+    def _run_all_payrolls(self, options):
+        """Расчёт всех сотрудников за период — в рабочем потоке, своё соединение"""
+        db = self._reporting_db()
         try:
-            self._call_pdf(action="print")
-            messagebox.showinfo("PDF Print", "PDF sent to printer")
-        except Exception as e:
-            messagebox.showerror("PDF Print", str(e))
+            return calculate_payroll_run(
+                db,
+                options["start"],
+                options["end"],
+                rate_mode=options["rate_mode"],
+                housing=options["housing"],
+                utilities=options["utilities"],
+            )
+        finally:
+            db.close()
+
+    def _save_all_pdfs(self):
+        """PDF для всех сотрудников за период (часы из БД)"""
+        if not messagebox.askyesno(
+            "Save all employees",
+            "Generate statements for every employee for the selected period?\n\n"
+            "Hours are taken from saved timesheets; deductions from the form "
+            "apply to every employee.",
+        ):
+            return
+
+        options = self._run_options()
+        combine = self.combine_pdf.get()
+
+        def run(job):
+            from services.report_service import (
+                generate_combined_payroll_pdf,
+                generate_payroll_pdfs,
+            )
+
+            payrolls = self._run_all_payrolls(options)
+            job.check()
+            if combine:
+                path = generate_combined_payroll_pdf(
+                    payrolls,
+                    options["period_from"],
+                    options["period_to"],
+                    options["rate_mode"],
+                    action="save",
+                    progress=job.report,
+                    cancel=job.cancel_event,
+                )
+                return payrolls, path
+            return payrolls, generate_payroll_pdfs(
+                payrolls,
+                options["period_from"],
+                options["period_to"],
+                options["rate_mode"],
+                progress=job.report,
+                cancel=job.cancel_event,
+            )
 
-    def _call_pdf(self, action="preview"):
+        self._submit("Save all employees", run, self._on_all_pdfs_saved)
+
+    def _on_all_pdfs_saved(self, outcome):
+        payrolls, result = outcome
+        if result is None:
+            return      # отменено
+
+        if isinstance(result, str):
+            messagebox.showinfo(
+                "Save all employees",
+                f"{len(payrolls)} statements saved to:\n{result}",
+            )
+            return
+
+        saved = [p for p in result.paths if p]
+        message = f"{len(saved)} PDF saved"
+        if saved:
+            message += f" to:\n{os.path.dirname(saved[0])}"
+        if result.errors:
+            failed = "\n".join(
+                f"{payrolls[i].employee.name}: {err}"
+                for i, err in list(result.errors.items())[:10]
+            )
+            message += f"\n\nFailed ({len(result.errors)}):\n{failed}"
+            messagebox.showwarning("Save all employees", message)
+        else:
+            messagebox.showinfo("Save all employees", message)
+
+    def _print_all_pdfs(self):
+        """Все сотрудники одним PDF — одно задание печати"""
+        if not messagebox.askyesno(
+            "Print all employees",
+            "Print statements for every employee for the selected period?",
+        ):
+            return
+
+        options = self._run_options()
+
+        def run(job):
+            from services.report_service import generate_combined_payroll_pdf
+
+            payrolls = self._run_all_payrolls(options)
+            job.check()
+            path = generate_combined_payroll_pdf(
+                payrolls,
+                options["period_from"],
+                options["period_to"],
+                options["rate_mode"],
+                action="print",
+                progress=job.report,
+                cancel=job.cancel_event,
+            )
+            return len(payrolls) if path else None
+
+        def done(count):
+            if count is not None:
+                messagebox.showinfo(
+                    "Print all employees", f"{count} statements sent to printer"
+                )
+
+        self._submit("Print all employees", run, done)
+
+    def _export_register(self):
+        """Реестр зарплаты всех сотрудников за период в Excel"""
+        path = filedialog.asksaveasfilename(
+            title="Export payroll register",
+            defaultextension=".xlsx",
+            filetypes=[("Excel workbook", "*.xlsx")],
+            initialfile=f"Payroll_register_{self.from_entry.get()}_{self.to_entry.get()}.xlsx",
+        )
+        if not path:
+            return
+
+        include_days = messagebox.askyesno(
+            "Export payroll register",
+            "Include a sheet with hours for every day?",
+        )
+
+        options = self._run_options()
+        total = self.db.count_employees()
+
+        def run(job):
+            from services.export_service import export_payroll_register
+
+            def progress(done):
+                job.report(done, total)
+                job.check()
+
+            db = self._reporting_db()
+            try:
+                return export_payroll_register(
+                    db,
+                    path,
+                    options["start"],
+                    options["end"],
+                    rate_mode=options["rate_mode"],
+                    housing=options["housing"],
+                    utilities=options["utilities"],
+                    include_days=include_days,
+                    progress=progress,
+                )
+            finally:
+                db.close()
+
+        self._submit(
+            "Export payroll register",
+            run,
+            lambda count: messagebox.showinfo(
+                "Export payroll register", f"{count} employees exported to:\n{path}"
+            ),
+        )
+
+    def _payroll_record(self):
+        """Аргументы save_payroll для истории (History → Payroll history)"""
+        summary = self._calculate_summary()
+        if summary is None:
+            return None
+
+        emp = self._current_employee()
+        rate_mode = self.rate_mode.get()
+
+        return dict(
+            employee_id=emp.id,
+            name=emp.name,
+            rate_mode=rate_mode,
+            rate=FIXED_RATE if rate_mode == "fixed" else emp.rate,
+            period_from=self.from_entry.get_date().isoformat(),
+            period_to=self.to_entry.get_date().isoformat(),
+            total_hours=summary.total_hours,
+            gross_amount=summary.gross_amount,
+            net_amount=summary.net_amount,
+            days=dict(self.days_data),
+            utilities=summary.utilities_deduction or None,
+            rental=summary.housing_deduction or None,
+            bank=emp.bank_name,
+            iban=emp.iban,
+            bic=emp.bic,
+        )
+
+    def _pdf_kwargs(self, action="preview"):
         """
-        Генерирует PDF с указанным действием
+        Аргументы generate_payroll_pdf для выбранного сотрудника
         action: "preview", "save", "print"
         """
-        name = self.employee_cb.get()
-        if not name:
+        emp = self._current_employee()
+        if emp is None:
             raise ValueError("Employee not selected")
 
-        emp = self.employee_map[name]
-
+        # Из days_data, а не из таблицы: в ней только видимые строки
         rows = []
-        for iid in self.tree.get_children():
-            date, day, hours = self.tree.item(iid)["values"]
-            rows.append((date, day, hours))
+        for key, hours in self.days_data.items():
+            info = date_info(key)
+            rows.append((info.date_dmy, info.weekday, hours))
 
-        pdf_path = generate_payroll_pdf(
-            employee_name=emp["name"],
-            employee_rate=emp["rate"],
+        return dict(
+            employee_name=emp.name,
+            employee_rate=emp.rate,
             rows=rows,
             rate_mode=self.rate_mode.get(),
             utilities=self.utilities_var.get() or None,
             rental=self.rental_var.get() or None,
             period_from=self.from_entry.get(),
             period_to=self.to_entry.get(),
-            bank_name=emp["bank"] if "bank" in emp.keys() else None,
-            iban=emp["iban"] if "iban" in emp.keys() else None,
-            bic=emp["bic"] if "bic" in emp.keys() else None,
+            bank_name=emp.bank_name,
+            iban=emp.iban,
+            bic=emp.bic,
             action=action,
         )
-
-        return pdf_path
@@ -0,0 +1,233 @@
+from collections import OrderedDict
+from tkinter import ttk
+
+from core.instrumentation import timer
+
+
+PAGE_SIZE = 200         # строк в одном запросе к источнику
+CACHE_PAGES = 8         # сколько страниц держать в памяти
+BUFFER_ROWS = 2         # строк сверх видимых (частично видимая последняя и т.п.)
+DEFAULT_ROW_HEIGHT = 20
+DEFAULT_HEADING_HEIGHT = 24
+
+
+class ListSource:
+    """
+    Источник для VirtualTreeview из списка в памяти.
+    make_row(index, item) -> (iid, values, tags)
+    """
+
+    def __init__(self, items=(), make_row=None):
+        self.items = list(items)
+        self.make_row = make_row
+
+    def count(self) -> int:
+        return len(self.items)
+
+    def fetch(self, offset: int, limit: int):
+        return [
+            self.make_row(i, item)
+            for i, item in enumerate(self.items[offset:offset + limit], start=offset)
+        ]
+
+
+# ==================================================
+# VIRTUAL TREEVIEW
+# ==================================================
+class VirtualTreeview(ttk.Frame):
+    """
+    Таблица, в которой существуют только видимые строки (+ BUFFER_ROWS).
+
+    Данные берутся постранично из источника:
+        count() -> int
+        fetch(offset, limit) -> [(iid, values, tags), ...]
+    При прокрутке (колесо, полоса, клавиши) пересобираются только видимые
+    строки — время не зависит от общего числа строк.
+
+    self.tree — обычный ttk.Treeview: heading / column / tag_configure и
+    обработчики событий настраиваются как раньше. Обработчики
+    <<TreeviewSelect>> вешать с add="+", выделение читать через selection():
+    оно сохраняется, когда выделенная строка уходит за пределы экрана.
+    """
+
+    def __init__(self, parent, *, count, fetch, page_size=PAGE_SIZE, **tree_options):
+        super().__init__(parent)
+        self._count = count
+        self._fetch = fetch
+        self.page_size = page_size
+
+        self._pages = OrderedDict()
+        self._selection = ()
+        self.total = 0
+        self.first = 0
+        self._visible = 1
+        self._row_height = DEFAULT_ROW_HEIGHT
+        self._heading_height = DEFAULT_HEADING_HEIGHT
+
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.tree = ttk.Treeview(self, **tree_options)
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        self.tree.bind("<Configure>", self._on_resize, add="+")
+        self.tree.bind("<<TreeviewSelect>>", self._on_select, add="+")
+        self.tree.bind("<MouseWheel>", self._on_wheel, add="+")
+        self.tree.bind("<Button-4>", lambda e: self.scroll(-3), add="+")
+        self.tree.bind("<Button-5>", lambda e: self.scroll(3), add="+")
+        self.tree.bind("<Up>", lambda e: self._on_key(-1), add="+")
+        self.tree.bind("<Down>", lambda e: self._on_key(1), add="+")
+        self.tree.bind("<Prior>", lambda e: self._on_page(-1), add="+")
+        self.tree.bind("<Next>", lambda e: self._on_page(1), add="+")
+
+    # ---------- DATA ----------
+    def refresh(self, recount: bool = True):
+        """Сбросить кэш страниц и перерисовать (позиция прокрутки сохраняется)"""
+        self._pages.clear()
+        if recount:
+            self.total = self._count()
+        self._render()
+
+    def reset(self):
+        """Новые данные: прокрутка в начало, выделение снимается"""
+        self.first = 0
+        self._selection = ()
+        self.refresh()
+
+    def rows(self, offset: int, limit: int):
+        """Строки [offset, offset + limit) из кэша страниц"""
+        result = []
+        end = min(offset + limit, self.total)
+        index = offset
+        while index < end:
+            page_no, start = divmod(index, self.page_size)
+            page = self._page(page_no)
+            if not page:
+                break
+            chunk = page[start:start + (end - index)]
+            result.extend(chunk)
+            index += len(chunk)
+            if len(page) < self.page_size:
+                break
+        return result
+
+    def _page(self, page_no: int):
+        page = self._pages.get(page_no)
+        if page is None:
+            with timer("ui.tree.fetch") as span:
+                page = self._fetch(page_no * self.page_size, self.page_size)
+                span.rows = len(page)
+            self._pages[page_no] = page
+            if len(self._pages) > CACHE_PAGES:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page_no)
+        return page
+
+    # ---------- SELECTION ----------
+    def selection(self):
+        return self._selection
+
+    def selection_clear(self):
+        self._selection = ()
+        self.tree.selection_set(())
+
+    def _on_select(self, event=None):
+        selected = self.tree.selection()
+        if selected:
+            self._selection = selected
+        else:
+            # Строки, ушедшие за экран, остаются выделенными
+            self._selection = tuple(i for i in self._selection if not self.tree.exists(i))
+
+    # ---------- RENDER ----------
+    def _render(self):
+        self.first = max(0, min(self.first, self.total - self._visible))
+
+        tree = self.tree
+        with timer("ui.tree.render") as span:
+            tree.delete(*tree.get_children())
+            rows = self.rows(self.first, self._visible + BUFFER_ROWS)
+            for iid, values, tags in rows:
+                tree.insert("", "end", iid=iid, values=values, tags=tags)
+            span.rows = len(rows)
+
+        visible = [i for i in self._selection if tree.exists(i)]
+        if visible and tuple(visible) != tree.selection():
+            tree.selection_set(visible)
+
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        if self.total <= self._visible:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(
+                self.first / self.total,
+                (self.first + self._visible) / self.total,
+            )
+
+    def _measure(self):
+        children = self.tree.get_children()
+        if children:
+            bbox = self.tree.bbox(children[0])
+            if bbox:
+                self._heading_height, self._row_height = bbox[1], bbox[3]
+
+    def _on_resize(self, event):
+        # Второй проход — после замера реальной высоты строки по bbox
+        for _ in range(2):
+            self._measure()
+            visible = max(1, (event.height - self._heading_height) // max(self._row_height, 1))
+            if visible == self._visible:
+                break
+            self._visible = visible
+            self._render()
+
+    # ---------- SCROLLING ----------
+    def scroll(self, delta: int):
+        first = max(0, min(self.first + delta, self.total - self._visible))
+        if first != self.first:
+            self.first = first
+            self._render()
+        return "break"
+
+    def scroll_to(self, index: int):
+        self.first = index
+        self._render()
+
+    def _on_scrollbar(self, action, *args):
+        if action == "moveto":
+            self.first = int(float(args[0]) * self.total)
+            self._render()
+        elif action == "scroll":
+            amount, unit = int(args[0]), args[1]
+            self.scroll(amount * (self._visible if unit == "pages" else 1))
+
+    def _on_wheel(self, event):
+        # Windows: delta кратно 120; macOS: небольшие значения
+        if not event.delta:
+            return "break"
+        steps = max(1, abs(event.delta) // 120)
+        return self.scroll(-3 * steps if event.delta > 0 else 3 * steps)
+
+    def _on_key(self, delta: int):
+        """Стрелки у края экрана прокручивают таблицу на строку"""
+        children = self.tree.get_children()
+        focus = self.tree.focus()
+        if not children or focus not in children:
+            return None
+
+        position = children.index(focus) + delta
+        if 0 <= position < min(self._visible, len(children)):
+            return None     # внутри экрана — стандартная обработка Treeview
+
+        self.scroll(delta)
+        children = self.tree.get_children()
+        target = children[0] if delta < 0 else children[min(self._visible, len(children)) - 1]
+        self.tree.focus(target)
+        self.tree.selection_set(target)
+        return "break"
+
+    def _on_page(self, delta: int):
+        return self.scroll(delta * self._visible)